@@ -38,261 +38,564 @@ Below is the implementation.
 # !pip install curl_cffi
 """
 
-from crewai import Agent, Task
-from crewai.tools import tool
-from langchain_community.tools import DuckDuckGoSearchRun
+## Heavy libraries (crewai, yfinance, pandas, ...) are imported on first use, and the
+## tools, agents, tasks and crew are built by the factories below when first needed,
+## so importing this module or running --help stays fast (see benchmarks/bench_import.py).
+import functools
+import threading
 from datetime import datetime
+from advisor.ratelimit import limiter_stats
+from advisor.search import search, search_stats
+from advisor.breaker import ProviderUnavailable, breaker_stats
 
 # Current date for context
 Now = datetime.now()
 Today = Now.strftime("%d-%b-%Y")
 
-# Define a web search tool
-@tool("DuckDuckGo Search")
-def search_tool(search_query: str):
-    """Search the internet for information on a given topic"""
-    return DuckDuckGoSearchRun().run(search_query)
 
-"""### Step 2: Define Custom Tools"""
+def _once(factory):
+    """Build on the first call and return the same objects afterwards (thread-safe)."""
+    built = []
+    lock = threading.Lock()
 
-from crewai.tools import tool
-import json
+    @functools.wraps(factory)
+    def wrapper():
+        with lock:
+            if not built:
+                built.append(factory())
+            return built[0]
+    return wrapper
 
-## Import Yahoo Finance APIs
-import yfinance as yf
-from curl_cffi import requests
-import time
+# Define a web search tool: one reused client, results cached by normalized query,
+# identical concurrent queries coalesced and near-duplicate snippets dropped (see advisor/search.py)
+def web_search(search_query: str):
+    """Search the internet for information on a given topic"""
+    try:
+        return search(search_query)
+    except ProviderUnavailable as e:
+        return e.to_result()
 
-session = requests.Session(impersonate="chrome")
+"""### Step 2: Define Custom Tools"""
 
-## A function is defined, that will work as a tool and that is provided to the framework (hence to agents) as a tool with the '@tool' decorator
+## Market data comes from a pluggable provider, Yahoo Finance or Finnhub, optionally hedged
+## with the other one (see advisor/providers.py). It goes through a shared TTL+LRU cache
+## (see advisor/cache.py) and fundamentals are persisted in a local SQLite store
+## (see advisor/store.py), so the three tools below fetch each payload once per run.
+## Tools accept a ticker or company name and resolve it through the local listing index (see advisor/symbols.py).
+## Identical concurrent tool calls share one execution (see advisor/coalesce.py).
+## Calls to a degraded provider fail fast with a "provider unavailable" result (see advisor/breaker.py).
+from advisor.cache import market_cache
+from advisor.market import get_price, get_financials, get_histories, get_many, get_snapshot, resolve_symbol
+from advisor.compact import render_statement
+from advisor.coalesce import coalesced, kickoff_once, coalescing_stats
+
+## Each function below is provided to the framework (hence to agents) as a tool by build_tools(),
+## which wraps it with CrewAI's '@tool' decorator.
 ## Note the function description  (purpose, usage) in doc strigs.
-@tool ("Get current stock price")
-def get_current_stock_price(symbol: str) -> str:
+@coalesced
+def current_stock_price(symbol: str) -> str:
     """Use this function to get the current stock price for a given symbol.
 
     Args:
-        symbol (str): The stock symbol.
+        symbol (str): The stock symbol or company name.
 
     Returns:
         str: The current stock price or error message.
     """
     try:
-        time.sleep(0.5)
-        stock = yf.Ticker(symbol,session=session)
-
-        current_price = stock.info.get("regularMarketPrice", stock.info.get("currentPrice"))
+        symbol = resolve_symbol(symbol) or symbol
+        current_price = get_price(symbol)
         return f"{current_price:.2f}" if current_price else f"Could not fetch current price for {symbol}"
+    except ProviderUnavailable as e:
+        return e.to_result()
     except Exception as e:
         return f"Error fetching current price for {symbol}: {e}"
 
-@tool
-def get_company_info(symbol: str):
+@coalesced
+def company_info(symbol: str):
     """Use this function to get company information and current financial snapshot for a given stock symbol.
 
     Args:
-        symbol (str): The stock symbol.
+        symbol (str): The stock symbol or company name.
 
     Returns:
-        JSON containing company profile and current financial snapshot.
+        Company profile and current financial snapshot, one field per line.
     """
     try:
-        company_info_full = yf.Ticker(symbol,session=session).info
-        if company_info_full is None:
+        symbol = resolve_symbol(symbol) or symbol
+        snapshot = get_snapshot(symbol)
+        if snapshot is None:
             return f"Could not fetch company info for {symbol}"
-
-        company_info_cleaned = {
-            "Name": company_info_full.get("shortName"),
-            "Symbol": company_info_full.get("symbol"),
-            "Current Stock Price": f"{company_info_full.get('regularMarketPrice', company_info_full.get('currentPrice'))} {company_info_full.get('currency', 'USD')}",
-            "Market Cap": f"{company_info_full.get('marketCap', company_info_full.get('enterpriseValue'))} {company_info_full.get('currency', 'USD')}",
-            "Sector": company_info_full.get("sector"),
-            "Industry": company_info_full.get("industry"),
-            "City": company_info_full.get("city"),
-            "Country": company_info_full.get("country"),
-            "EPS": company_info_full.get("trailingEps"),
-            "P/E Ratio": company_info_full.get("trailingPE"),
-            "52 Week Low": company_info_full.get("fiftyTwoWeekLow"),
-            "52 Week High": company_info_full.get("fiftyTwoWeekHigh"),
-            "50 Day Average": company_info_full.get("fiftyDayAverage"),
-            "200 Day Average": company_info_full.get("twoHundredDayAverage"),
-            "Employees": company_info_full.get("fullTimeEmployees"),
-            "Total Cash": company_info_full.get("totalCash"),
-            "Free Cash flow": company_info_full.get("freeCashflow"),
-            "Operating Cash flow": company_info_full.get("operatingCashflow"),
-            "EBITDA": company_info_full.get("ebitda"),
-            "Revenue Growth": company_info_full.get("revenueGrowth"),
-            "Gross Margins": company_info_full.get("grossMargins"),
-            "Ebitda Margins": company_info_full.get("ebitdaMargins"),
-        }
-        return json.dumps(company_info_cleaned)
+        return snapshot.render()
+    except ProviderUnavailable as e:
+        return e.to_result()
     except Exception as e:
         return f"Error fetching company profile for {symbol}: {e}"
 
-@tool
-def get_income_statements(symbol: str):
+@coalesced
+def income_statements(symbol: str):
 
     """Use this function to get income statements for a given stock symbol.
 
     Args:
-    symbol (str): The stock symbol.
+    symbol (str): The stock symbol or company name.
 
     Returns:
-    JSON containing income statements or an empty dictionary.
+    Compact table of key income statement items for the latest years
+    (or JSON when ADVISOR_STATEMENT_FORMAT=json), or an empty dictionary.
     """
     try:
-        stock = yf.Ticker(symbol,session=session)
-        financials = stock.financials
-        return financials.to_json(orient="index")
+        symbol = resolve_symbol(symbol) or symbol
+        financials = get_financials(symbol)
+        return render_statement(financials, symbol) if financials is not None else "{}"
+    except ProviderUnavailable as e:
+        return e.to_result()
     except Exception as e:
         return f"Error fetching income statements for {symbol}: {e}"
 
+@coalesced
+def technical_indicators(symbols: str):
+    """Use this function to get technical indicators (SMA, EMA, RSI, MACD, volatility, drawdown)
+    computed from one year of daily prices, for one stock or a comma separated watchlist.
+
+    Args:
+        symbols (str): A stock symbol or company name, or several separated by commas.
+
+    Returns:
+        Compact table with one row of indicators and trend signals per symbol.
+    """
+    try:
+        from advisor.technicals import technical_summary   # imports NumPy
+
+        resolved = [resolve_symbol(s) or s.strip().upper() for s in symbols.split(",") if s.strip()]
+        return technical_summary(get_histories(resolved))
+    except ProviderUnavailable as e:
+        return e.to_result()
+    except Exception as e:
+        return f"Error computing technical indicators for {symbols}: {e}"
+
+@coalesced
+def financial_ratios(symbols: str):
+    """Use this function to get precomputed financial ratios (YoY growth, revenue CAGR, gross/operating/net
+    margins, interest coverage, tax rate) from all stored annual income statements, for one stock or several.
+
+    Args:
+        symbols (str): A stock symbol or company name, or several separated by commas.
+
+    Returns:
+        Compact table with one row of ratios per symbol (plus a year-by-year trend for a single symbol).
+    """
+    try:
+        from advisor.ratios import ratio_summary   # imports NumPy
+
+        resolved = [resolve_symbol(s) or s.strip().upper() for s in symbols.split(",") if s.strip()]
+        return ratio_summary(get_many(get_financials, resolved))
+    except ProviderUnavailable as e:
+        return e.to_result()
+    except Exception as e:
+        return f"Error computing financial ratios for {symbols}: {e}"
+
+@coalesced
+def peer_comparison(symbol: str):
+    """Use this function to compare a stock with the largest companies in its industry: valuation
+    (P/E, P/B, EV/EBITDA), margins, ROE, growth and leverage, with the peer median, range and percentile.
+
+    Args:
+        symbol (str): The stock symbol or company name.
+
+    Returns:
+        Compact table with one row per metric.
+    """
+    try:
+        from advisor.peers import peer_summary   # imports NumPy
+
+        return peer_summary(resolve_symbol(symbol) or symbol.strip().upper())
+    except ProviderUnavailable as e:
+        return e.to_result()
+    except Exception as e:
+        return f"Error comparing {symbol} with its peers: {e}"
+
+@_once
+def build_tools():
+    """Wrap the tool functions with CrewAI's ``@tool``, keyed by the names the agents use."""
+    from crewai.tools import tool
+    # Counts each tool call's market-cache hits into its trace span
+    from advisor.tracing import tool_scope
+
+    def make_tool(name, func):
+        return tool(name)(tool_scope(name)(func))
+
+    return {
+        "search_tool": make_tool("DuckDuckGo Search", web_search),
+        "get_current_stock_price": make_tool("Get current stock price", current_stock_price),
+        "get_company_info": make_tool("get_company_info", company_info),
+        "get_income_statements": make_tool("get_income_statements", income_statements),
+        "get_technical_indicators": make_tool("Get technical indicators", technical_indicators),
+        "get_financial_ratios": make_tool("Get financial ratios", financial_ratios),
+        "get_peer_comparison": make_tool("Get peer comparison", peer_comparison),
+    }
+
 """### Step 3: Define the Agents
 
 
 """
 
-from crewai import Agent
-
-# Agent for gathering company news and information
-news_info_explorer = Agent(
-    role='News and Info Researcher',
-    goal='Gather and provide the latest news and information about a company from the internet',
-    #llm='gpt-4o',
-    llm='gpt-4.1-2025-04-14',
-    verbose=True,
-    backstory=(
-        'You are an expert researcher, who can gather detailed information about a company. '
-        'Consider you are on: ' + Today
-    ),
-    tools=[search_tool],
-    cache=True,
-    max_iter=5,
-)
-
-# Agent for gathering financial data
-data_explorer = Agent(
-    role='Data Researcher',
-    goal='Gather and provide financial data and company information about a stock',
-    #llm='gpt-4o',
-    llm='gpt-4.1-2025-04-14',
-    verbose=True,
-    backstory=(
-        'You are an expert researcher, who can gather detailed information about a company or stock. '
-        'When using tools, use the stock symbol and add a suffix ".NS" to it. try with and without the suffix and see what works'
-        'Consider you are on: ' + Today
-    ),
-    tools=[get_company_info, get_income_statements],
-    cache=True,
-    max_iter=5,
-)
-
-# Agent for analyzing data
-analyst = Agent(
-    role='Data Analyst',
-    goal='Consolidate financial data, stock information, and provide a summary',
-    #llm='gpt-4o',
-    llm='gpt-4.1-2025-04-14',
-    verbose=True,
-    backstory=(
-        'You are an expert in analyzing financial data, stock/company-related current information, and '
-        'making a comprehensive analysis. Use Indian units for numbers (lakh, crore). '
-        'Consider you are on: ' + Today
-    ),
-)
-
-# Agent for financial recommendations
-fin_expert = Agent(
-    role='Financial Expert',
-    goal='Considering financial analysis of a stock, make investment recommendations',
-    #llm='gpt-4o',
-    llm='gpt-4.1-2025-04-14',
-    verbose=True,
-    tools=[get_current_stock_price],
-    max_iter=5,
-    backstory=(
-        'You are an expert financial advisor who can provide investment recommendations. '
-        'Consider the financial analysis, current information about the company, current stock price, '
-        'and make recommendations about whether to buy/hold/sell a stock along with reasons.'
-        'When using tools, try with and without the suffix ".NS" to the stock symbol and see what works. '
-        'Consider you are on: ' + Today
-    ),
-)
+@_once
+def build_agents():
+    """Create the four agents with their tools."""
+    from crewai import Agent
+    # Opt-in on-disk LLM response cache: ADVISOR_LLM_CACHE=1 (see advisor/llm_cache.py)
+    from advisor.llm_cache import cached_llm
+
+    tools = build_tools()
+
+    # Agent for gathering company news and information
+    news_info_explorer = Agent(
+        role='News and Info Researcher',
+        goal='Gather and provide the latest news and information about a company from the internet',
+        #llm='gpt-4o',
+        llm=cached_llm('gpt-4.1-2025-04-14'),
+        verbose=True,
+        backstory=(
+            'You are an expert researcher, who can gather detailed information about a company. '
+            'Consider you are on: ' + Today
+        ),
+        tools=[tools["search_tool"]],
+        cache=True,
+        max_iter=5,
+    )
+
+    # Agent for gathering financial data
+    data_explorer = Agent(
+        role='Data Researcher',
+        goal='Gather and provide financial data and company information about a stock',
+        #llm='gpt-4o',
+        llm=cached_llm('gpt-4.1-2025-04-14'),
+        verbose=True,
+        backstory=(
+            'You are an expert researcher, who can gather detailed information about a company or stock. '
+            'When using tools, pass the stock symbol or company name as given; tools resolve the exchange (e.g. ".NS") themselves. '
+            'Take growth, margins and coverage from the financial ratios tool rather than computing them yourself. '
+            'Consider you are on: ' + Today
+        ),
+        tools=[tools["get_company_info"], tools["get_income_statements"], tools["get_financial_ratios"]],
+        cache=True,
+        max_iter=5,
+    )
+
+    # Agent for analyzing data
+    analyst = Agent(
+        role='Data Analyst',
+        goal='Consolidate financial data, stock information, and provide a summary',
+        #llm='gpt-4o',
+        llm=cached_llm('gpt-4.1-2025-04-14'),
+        verbose=True,
+        backstory=(
+            'You are an expert in analyzing financial data, stock/company-related current information, and '
+            'making a comprehensive analysis. Use Indian units for numbers (lakh, crore). '
+            'Use the technical indicators tool for price trend, momentum and risk instead of guessing them, '
+            'and the peer comparison tool to judge valuation and margins against the industry. '
+            'Consider you are on: ' + Today
+        ),
+        tools=[tools["get_technical_indicators"], tools["get_peer_comparison"]],
+        max_iter=5,
+    )
+
+    # Agent for financial recommendations
+    fin_expert = Agent(
+        role='Financial Expert',
+        goal='Considering financial analysis of a stock, make investment recommendations',
+        #llm='gpt-4o',
+        llm=cached_llm('gpt-4.1-2025-04-14'),
+        verbose=True,
+        tools=[tools["get_current_stock_price"]],
+        max_iter=5,
+        backstory=(
+            'You are an expert financial advisor who can provide investment recommendations. '
+            'Consider the financial analysis, current information about the company, current stock price, '
+            'and make recommendations about whether to buy/hold/sell a stock along with reasons.'
+            'When using tools, pass the stock symbol or company name as given; tools resolve the exchange themselves. '
+            'Consider you are on: ' + Today
+        ),
+    )
+
+    return {"news_info_explorer": news_info_explorer, "data_explorer": data_explorer,
+            "analyst": analyst, "fin_expert": fin_expert}
 
 """### Step 4: Define the Tasks"""
 
-from crewai import Task
-
-# Task to gather financial data of a stock
-get_company_financials = Task(
-    description="Get financial data like income statements and other fundamental ratios for stock: {stock}",
-    expected_output="Detailed information from income statement, key ratios for {stock}. "
-                    "Indicate also about current financial status and trend over the period.",
-    agent=data_explorer,
-)
-
-# Task to gather company news
-get_company_news = Task(
-    description="Get latest news and business information about company: {stock}",
-    expected_output="Latest news and business information about the company. Provide a summary also.",
-    agent=news_info_explorer,
-)
-
-# Task to analyze financial data and news
-analyse = Task(
-    description="Make thorough analysis based on given financial data and latest news of a stock",
-    expected_output="Comprehensive analysis of a stock outlining financial health, stock valuation, risks, and news. "
-                    "Mention currency information and number units in Indian context (lakh/crore).",
-    agent=analyst,
-    context=[get_company_financials, get_company_news],
-    output_file='Analysis.md',
-)
-
-# Task to provide financial advice
-advise = Task(
-    description="Make a recommendation about investing in a stock, based on analysis provided and current stock price. "
-                "Explain the reasons.",
-    expected_output="Recommendation (Buy / Hold / Sell) of a stock backed with reasons elaborated."
-                    "Response in Mark down format.",
-    agent=fin_expert,
-    context=[analyse],
-    output_file='Recommendation.md',
-)
+@_once
+def build_tasks():
+    """Create the four tasks, in execution order."""
+    from crewai import Task
+
+    agents = build_agents()
+
+    # Task to gather financial data of a stock
+    get_company_financials = Task(
+        description="Get financial data like income statements and other fundamental ratios for stock: {stock}",
+        expected_output="Detailed information from income statement, key ratios for {stock}. "
+                        "Indicate also about current financial status and trend over the period.",
+        agent=agents["data_explorer"],
+    )
+
+    # Task to gather company news
+    get_company_news = Task(
+        description="Get latest news and business information about company: {stock}",
+        expected_output="Latest news and business information about the company. Provide a summary also.",
+        agent=agents["news_info_explorer"],
+    )
+
+    # Task to analyze financial data and news
+    analyse = Task(
+        description="Make thorough analysis based on given financial data, latest news and price technicals of stock: {stock}",
+        expected_output="Comprehensive analysis of a stock outlining financial health, stock valuation, risks, and news. "
+                        "Mention currency information and number units in Indian context (lakh/crore).",
+        agent=agents["analyst"],
+        context=[get_company_financials, get_company_news],
+        output_file='Analysis.md',
+    )
+
+    # Task to provide financial advice
+    advise = Task(
+        description="Make a recommendation about investing in a stock, based on analysis provided and current stock price. "
+                    "Explain the reasons.",
+        expected_output="Recommendation (Buy / Hold / Sell) of a stock backed with reasons elaborated."
+                        "Response in Mark down format.",
+        agent=agents["fin_expert"],
+        context=[analyse],
+        output_file='Recommendation.md',
+    )
+
+    return {"get_company_financials": get_company_financials, "get_company_news": get_company_news,
+            "analyse": analyse, "advise": advise}
 
 """### Step 5: Set Up the Crew"""
 
-from crewai import Crew, Process
-from datetime import datetime
-
-# Callback function to print a timestamp
-def timestamp(Input):
-    print(datetime.now())
-
-# Define the crew with agents and tasks in sequential process
-crew = Crew(
-    agents=[data_explorer, news_info_explorer, analyst, fin_expert],
-    tasks=[get_company_financials, get_company_news, analyse, advise],
-    verbose=True,
-    Process=Process.sequential,
-    step_callback=timestamp,
-)
-
-"""### Step 5: Run the Crew and Observe Results"""
+@_once
+def build_crew():
+    """Create the crew and the tracer that records its spans."""
+    from crewai import Crew, Process
+    from advisor.tracing import Tracer
+
+    agents = build_agents()
+    tasks = build_tasks()
+
+    # Tracer recording crew -> task -> agent iteration -> LLM / tool spans (see advisor/tracing.py)
+    tracer = Tracer()
+
+    # Define the crew with agents and tasks in sequential process
+    crew = Crew(
+        agents=[agents["data_explorer"], agents["news_info_explorer"], agents["analyst"], agents["fin_expert"]],
+        tasks=[tasks["get_company_financials"], tasks["get_company_news"], tasks["analyse"], tasks["advise"]],
+        verbose=True,
+        Process=Process.sequential,
+    )
+    return {"crew": crew, "tracer": tracer}
+
+## Tools, agents, tasks, ``crew`` and ``tracer`` stay available as module attributes
+## (e.g. ``module.crew``); they are built on first access
+_LAZY_ATTRIBUTES = {
+    **dict.fromkeys(("search_tool", "get_current_stock_price", "get_company_info",
+                     "get_income_statements", "get_technical_indicators", "get_financial_ratios",
+                     "get_peer_comparison"), build_tools),
+    **dict.fromkeys(("news_info_explorer", "data_explorer", "analyst", "fin_expert"), build_agents),
+    **dict.fromkeys(("get_company_financials", "get_company_news", "analyse", "advise"), build_tasks),
+    **dict.fromkeys(("crew", "tracer"), build_crew),
+}
+
+
+def __getattr__(name):
+    factory = _LAZY_ATTRIBUTES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()[name]
+
+"""### Step 5: Run the Crew and Observe Results
+
+Run a single stock, or a whole watchlist in batch mode (one crew per symbol,
+reports written to <output-dir>/<SYMBOL>/Analysis.md and Recommendation.md):
+
+    python 3_investment_advisor.py --stock RELIANCE
+    python 3_investment_advisor.py --symbols TCS,INFY,HDFCBANK --workers 8
+    python 3_investment_advisor.py --symbols-file watchlist.txt --output-dir reports
+
+Add --parallel-tasks to gather financials and news concurrently, and --prefetch
+to fetch price, profile and financials in plain Python before the agents run.
+Add --memo to reuse task outputs whose definition and inputs have not changed.
+Each run prints a run id; pass it back with --run-id to resume a failed run from its
+last completed task (--list-runs shows checkpointed runs).
+
+Screen a whole exchange (or the given symbols) first and only run the crew on the
+shortlist (see advisor/screener.py); add --screen-only to print the shortlist and stop:
+
+    python 3_investment_advisor.py --universe NSE --screen pe=5:25 --screen pos52=:0.4 --rank roe:desc --top 10
+"""
 
 # Set your OpenAI API key or any other LLM API key
+import argparse
+import asyncio
 import os
-from dotenv import load_dotenv
-load_dotenv()
-
-# Ensure OPENAI_API_KEY is set in your .env file
-# Run the crew with a specific stock
-result = crew.kickoff(inputs={'stock': 'RELIANCE'})
-
-# Print the final result
-print("Final Result:", result)
+from advisor.batch import run_batch, read_symbols, print_report, DEFAULT_WORKERS
+from advisor.dag import enable_concurrent_tasks
+from advisor.prefetch import prefetched_crew
+from advisor.memo import TaskMemo
+from advisor.checkpoint import CheckpointStore
+from advisor.symbols import YAHOO_SUFFIX
+from advisor.providers import PROVIDERS, DEFAULT_PROVIDER, HEDGE_PROVIDER, make_provider, set_default_provider, provider_stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Investment advisory crew")
+    parser.add_argument("--stock", default="RELIANCE", help="Single stock to analyse")
+    parser.add_argument("--symbols", help="Comma separated symbols for batch mode")
+    parser.add_argument("--symbols-file", help="File with one symbol per line for batch mode")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="Crews running at the same time in batch mode")
+    parser.add_argument("--output-dir", default="reports", help="Root directory for batch reports")
+    parser.add_argument("--parallel-tasks", action="store_true",
+                        help="Run independent tasks (financials and news) concurrently")
+    parser.add_argument("--prefetch", action="store_true",
+                        help="Fetch price, profile and financials before the agents run")
+    parser.add_argument("--warm-cache", action="store_true",
+                        help="Batch mode: fetch market data for all symbols concurrently before the crews start")
+    parser.add_argument("--memo", action="store_true",
+                        help="Reuse stored task outputs when a task's definition and inputs are unchanged")
+    parser.add_argument("--run-id",
+                        help="Resume this run (batch: run-id prefix) from its task checkpoints; new runs get a fresh id")
+    parser.add_argument("--list-runs", action="store_true", help="List checkpointed runs and exit")
+    parser.add_argument("--provider", choices=sorted(PROVIDERS),
+                        help="Market-data provider (default: ADVISOR_PROVIDER or yahoo)")
+    parser.add_argument("--hedge", choices=sorted(PROVIDERS),
+                        help="Also ask this provider when the primary is slower than its p95 latency")
+    parser.add_argument("--universe", choices=sorted(YAHOO_SUFFIX),
+                        help="Screen every indexed listing on this exchange (implies screening)")
+    parser.add_argument("--screen", action="append", default=[], metavar="FIELD=MIN:MAX",
+                        help="Screen filter, e.g. pe=5:25, pos52=:0.4, op_margin=0.15: (repeatable)")
+    parser.add_argument("--rank", action="append", default=[], metavar="FIELD[:desc]",
+                        help="Rank the screened symbols by this field, e.g. pe or roe:desc (repeatable)")
+    parser.add_argument("--top", type=int, default=10, help="Symbols from the screen handed to the crew")
+    parser.add_argument("--screen-only", action="store_true", help="Print the screen shortlist and exit")
+    parser.add_argument("--trace", help="Append trace spans to this JSONL file")
+    parser.add_argument("--otlp", help="Send trace spans to an OTLP/HTTP collector, e.g. http://localhost:4318/v1/traces")
+    args = parser.parse_args(argv)
+
+    symbols = []
+    if args.symbols:
+        symbols += args.symbols.split(",")
+    if args.symbols_file:
+        symbols += read_symbols(args.symbols_file)
+
+    if args.list_runs:
+        # Task counts come from the checkpoint rows, so listing never builds the crew
+        for run_id, status, inputs, completed, task_count, updated_at in CheckpointStore().runs():
+            print(f"{run_id:<40}{status:<11}{completed}/{task_count or '?'} tasks  {inputs}  "
+                  f"{datetime.fromtimestamp(updated_at):%d-%b-%Y %H:%M}")
+        return
+
+    # Vectorized pre-filter: only the top of the screen reaches the (LLM-priced) crew
+    if args.universe or args.screen or args.rank:
+        from advisor.screener import screen, universe, print_screen
+
+        try:
+            screened = screen(symbols + (universe(args.universe) if args.universe else []),
+                              args.screen, args.rank, args.top)
+        except ValueError as e:
+            parser.error(str(e))
+        print_screen(screened)
+        if args.screen_only:
+            return
+        symbols = screened["shortlist"]
+        if not symbols:
+            print("No symbols passed the screen")
+            return
+    # Every task output is checkpointed under the run id, so a failed run can be resumed
+    checkpoints = CheckpointStore()
+    run_id = args.run_id or datetime.now().strftime("%Y%m%d-%H%M%S")
+    print(f"Run id: {run_id} (resume with --run-id {run_id})")
+
+    from dotenv import load_dotenv
+    from advisor.tracing import sinks_from_env
+    from advisor.llm_cache import llm_cache_stats
+
+    built = build_crew()
+    crew, tracer = built["crew"], built["tracer"]
+    tasks = build_tasks()
+
+    def run(crew_copy, inputs, print_summary=True):
+        symbol_run_id = f"{run_id}:{inputs['stock']}" if symbols else run_id
+        return checkpoints.kickoff(crew_copy, inputs, symbol_run_id,
+                                   lambda c, i: tracer.trace_kickoff(c, i, print_summary=print_summary))
+
+    # Steps applied to each per-run copy of the crew before kickoff
+    steps = []
+    if args.prefetch:
+        # Injected into the financials task, and into advise for the current price
+        prefetch_tasks = [crew.tasks.index(tasks["get_company_financials"]), crew.tasks.index(tasks["advise"])]
+        steps.append(lambda crew_copy, stock: prefetched_crew(crew_copy, stock, prefetch_tasks))
+    memo = TaskMemo() if args.memo else None
+    if memo:
+        steps.append(lambda crew_copy, stock: memo.attach(crew_copy))
+
+    def prepare(crew_copy, stock):
+        for step in steps:
+            crew_copy = step(crew_copy, stock)
+        return crew_copy
+
+    if args.parallel_tasks:
+        # get_company_financials and get_company_news run together, analyse waits for both
+        groups = enable_concurrent_tasks(crew)
+        print("Task groups:", [[task.agent.role for task in group] for group in groups])
+
+    # Ensure OPENAI_API_KEY is set in your .env file
+    load_dotenv()
+
+    if args.provider or args.hedge:
+        set_default_provider(make_provider(args.provider or DEFAULT_PROVIDER, args.hedge or HEDGE_PROVIDER))
+
+    tracer.sinks = sinks_from_env(args.trace, args.otlp)
+    tracer.install()
+
+    if symbols:
+        if args.warm_cache:
+            from advisor.yahoo_async import warm_cache
+            from advisor.bulk import bulk_quotes
+
+            # One multi-symbol quote request per 50 symbols, then full profiles for the listed ones
+            quotes = bulk_quotes(symbols)
+            for symbol, reason in quotes["failed"].items():
+                print(f"   - no quote for {symbol}: {reason}")
+            errors = asyncio.run(warm_cache(list(quotes["quotes"])))
+            print(f"Warmed market data for {len(quotes['quotes']) - len(errors)}/{len(symbols)} symbols")
+        batch = run_batch(crew, symbols, max_workers=args.workers, output_dir=args.output_dir,
+                          prepare=prepare,
+                          kickoff=lambda crew_copy, inputs: kickoff_once(
+                              crew_copy, inputs, lambda c, i: run(c, i, print_summary=False)))
+        tracer.print_summary()
+        print_report(batch)
+    else:
+        # Run the crew with a specific stock
+        run_crew = prepare(crew.copy(), args.stock) if steps else crew
+        # Identical runs requested concurrently today share one execution
+        result = kickoff_once(run_crew, {'stock': args.stock}, run)
+
+        # Print the final result
+        print("Final Result:", result)
+    print("Market data cache:", market_cache.stats())
+    print("Search:", search_stats())
+    print("Coalescing:", coalescing_stats())
+    if memo:
+        print("Task memo:", memo.stats())
+    if llm_cache_stats():
+        print("LLM cache:", llm_cache_stats())
+    print("Market data provider:", provider_stats())
+    print("Rate limiters:", limiter_stats())
+    print("Circuit breakers:", breaker_stats())
+
+if __name__ == "__main__":
+    main()
 
 """
 ---
 ### Conclusion
 This workflow demonstrates a detailed investment advisory process using multiple agents and tasks. The system showcases the integration of custom tools and collaborative agents in CrewAI to provide actionable financial insights.
-"""
\ No newline at end of file
+"""
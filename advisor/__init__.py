@@ -0,0 +1 @@
+"""Shared helpers for the investment advisor crew (3_investment_advisor.py)."""
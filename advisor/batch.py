@@ -0,0 +1,125 @@
+"""Batch portfolio mode: run the advisory crew over many symbols in parallel.
+
+Each symbol gets its own copy of the crew and its own output directory
+(``<output_dir>/<SYMBOL>/Analysis.md`` etc.), and at most ``max_workers``
+crews run at once so LLM and data-provider limits are respected.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+DEFAULT_WORKERS = int(os.getenv("ADVISOR_BATCH_WORKERS", "8"))
+
+
+def read_symbols(path):
+    """Read one symbol per line (or comma separated) from ``path``, skipping blanks and # comments."""
+    symbols = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.split("#", 1)[0]
+            symbols.extend(s.strip() for s in line.split(",") if s.strip())
+    return symbols
+
+
+def unique_symbols(symbols):
+    """Upper-case and de-duplicate symbols, keeping their order."""
+    return list(dict.fromkeys(s.strip().upper() for s in symbols if s.strip()))
+
+
+def per_symbol_crew(crew, symbol, output_dir):
+    """Return a copy of ``crew`` whose task output files live under ``output_dir/symbol``."""
+    symbol_dir = os.path.join(output_dir, symbol)
+    os.makedirs(symbol_dir, exist_ok=True)
+    crew_copy = crew.copy()
+    for task in crew_copy.tasks:
+        if task.output_file:
+            task.output_file = os.path.join(symbol_dir, os.path.basename(task.output_file))
+    return crew_copy
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_batch(crew, symbols, max_workers=DEFAULT_WORKERS, output_dir="reports", make_inputs=None,
+              prepare=None, kickoff=None):
+    """Kick off ``crew`` once per symbol with bounded concurrency.
+
+    Args:
+        crew: The template Crew; it is copied per symbol and never run directly.
+        symbols (list[str]): Symbols to analyse.
+        max_workers (int): Maximum number of crews running at the same time.
+        output_dir (str): Root directory for per-symbol reports.
+        make_inputs (callable): Maps a symbol to kickoff inputs, default ``{'stock': symbol}``.
+        prepare (callable): Optional ``prepare(crew_copy, symbol)`` returning the crew to run,
+            e.g. to inject prefetched data.
+        kickoff (callable): Optional ``kickoff(crew, inputs)`` used instead of ``crew.kickoff``,
+            e.g. ``tracer.trace_kickoff``.
+
+    Returns:
+        dict: ``results`` (symbol -> crew output), ``errors`` (symbol -> message),
+        ``durations`` (symbol -> seconds) and ``stats``.
+    """
+    symbols = unique_symbols(symbols)
+    make_inputs = make_inputs or (lambda symbol: {"stock": symbol})
+    results, errors, durations = {}, {}, {}
+    print_lock = threading.Lock()
+
+    def run_one(symbol):
+        started = time.perf_counter()
+        try:
+            symbol_crew = per_symbol_crew(crew, symbol, output_dir)
+            if prepare is not None:
+                symbol_crew = prepare(symbol_crew, symbol)
+            if kickoff is not None:
+                return kickoff(symbol_crew, make_inputs(symbol))
+            return symbol_crew.kickoff(inputs=make_inputs(symbol))
+        finally:
+            durations[symbol] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="advisor") as pool:
+        futures = {pool.submit(run_one, symbol): symbol for symbol in symbols}
+        for done, future in enumerate(as_completed(futures), 1):
+            symbol = futures[future]
+            try:
+                results[symbol] = future.result()
+                status = "ok"
+            except Exception as e:
+                errors[symbol] = f"{type(e).__name__}: {e}"
+                status = f"failed ({errors[symbol]})"
+            with print_lock:
+                print(f"[{done}/{len(symbols)}] {symbol}: {status} in {durations.get(symbol, 0):.1f}s")
+    elapsed = time.perf_counter() - started
+
+    times = list(durations.values())
+    stats = {
+        "symbols": len(symbols),
+        "succeeded": len(results),
+        "failed": len(errors),
+        "workers": max_workers,
+        "elapsed_s": round(elapsed, 2),
+        "symbols_per_min": round(len(symbols) / elapsed * 60, 2) if elapsed else 0.0,
+        "p50_s": round(_percentile(times, 50), 2),
+        "p95_s": round(_percentile(times, 95), 2),
+    }
+    return {"results": results, "errors": errors, "durations": durations, "stats": stats}
+
+
+def print_report(batch):
+    """Print the throughput summary returned by ``run_batch``."""
+    stats = batch["stats"]
+    print("\n" + "=" * 50)
+    print(f"Batch finished: {stats['succeeded']}/{stats['symbols']} symbols in {stats['elapsed_s']}s "
+          f"with {stats['workers']} workers")
+    print(f"Throughput: {stats['symbols_per_min']} symbols/min, "
+          f"per-symbol p50 {stats['p50_s']}s, p95 {stats['p95_s']}s")
+    for symbol, error in batch["errors"].items():
+        print(f"   - {symbol}: {error}")
+    print("=" * 50)
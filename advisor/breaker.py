@@ -0,0 +1,272 @@
+"""Per-provider circuit breakers and hard per-call deadlines.
+
+A provider call that runs past its deadline, or any call while the
+provider's breaker is open, raises ``ProviderUnavailable`` at once instead
+of hanging on transport timeouts. Tools turn that into a structured result
+that tells the agent not to retry, so a degraded provider costs
+milliseconds per call rather than minutes per run.
+
+The breaker opens after ``failures`` consecutive failures, stays open for
+``reset`` seconds and then lets a single probe call through (half-open):
+success closes it again, failure re-opens it.
+
+Settings can be overridden with environment variables such as
+``ADVISOR_BREAKER_YAHOO=5,30`` (failures, reset seconds) and
+``ADVISOR_DEADLINE_YAHOO=8`` (seconds per call).
+"""
+
+import asyncio
+import functools
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+from advisor.ratelimit import limiter
+
+## (consecutive failures before opening, seconds before a half-open probe)
+DEFAULT_BREAKERS = {
+    "yahoo": (5, 30),
+    "finnhub": (5, 30),
+    "duckduckgo": (3, 60),
+}
+DEFAULT_DEADLINES = {
+    "yahoo": 10.0,
+    "finnhub": 10.0,
+    "duckduckgo": 8.0,
+}
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+## Deadline-bound calls per provider; each breaker has its own pool, so calls
+## that overrun (and keep their worker until the transport gives up) on one
+## provider never delay another provider's calls
+DEFAULT_WORKERS = 8
+
+
+class ProviderUnavailable(Exception):
+    """Raised when a provider's breaker is open or a call missed its deadline."""
+
+    def __init__(self, provider, reason, retry_after=None):
+        super().__init__(f"{provider} unavailable: {reason}")
+        self.provider = provider
+        self.reason = reason
+        self.retry_after = retry_after
+
+    def to_result(self):
+        """Return the JSON tool result handed to the agent instead of data."""
+        return json.dumps({
+            "error": "provider_unavailable",
+            "provider": self.provider,
+            "reason": self.reason,
+            "retry_after_s": round(self.retry_after) if self.retry_after else None,
+            "message": "This data source is temporarily unavailable. Do not retry; "
+                       "continue with the information you already have.",
+        })
+
+
+def _is_client_error(exc):
+    ## A 4xx answer (unknown symbol, bad query) means the provider is up;
+    ## only 429 and 5xx count against the breaker
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status is not None and 400 <= status < 500 and status != 429
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker with a hard per-call deadline."""
+
+    def __init__(self, name, failures=5, reset=30.0, deadline=None, workers=DEFAULT_WORKERS):
+        """
+        Args:
+            name (str): Provider name, used in errors and stats.
+            failures (int): Consecutive failures that open the breaker.
+            reset (float): Seconds the breaker stays open before a probe.
+            deadline (float): Seconds a call may take, None for no limit.
+            workers (int): Threads running this provider's deadline-bound calls.
+        """
+        self.name = name
+        self.failure_threshold = int(failures)
+        self.reset_timeout = float(reset)
+        self.deadline = deadline
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"deadline-{name}")
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.calls = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.opened = 0
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self):
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+        return self._state
+
+    def before_call(self):
+        """Admit a call or raise ``ProviderUnavailable`` if the breaker is open."""
+        with self._lock:
+            self.calls += 1
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            self.rejected += 1
+            retry_after = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+        raise ProviderUnavailable(self.name, "circuit open", retry_after)
+
+    def record_success(self):
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self.opened += 1
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+    def _timed_out(self):
+        with self._lock:
+            self.timeouts += 1
+        self.record_failure()
+        return ProviderUnavailable(self.name, f"no answer within {self.deadline:g}s", self.reset_timeout)
+
+    def call(self, func, *args, throttle=None, tokens=1, **kwargs):
+        """Run ``func(*args, **kwargs)`` through the breaker and deadline.
+
+        ``throttle`` (a ``TokenBucket``) is only drawn from once the call is
+        admitted, so a rejected call does not wait for a token; the wait is
+        not counted against the deadline. ``tokens`` is the number of
+        requests the call sends. The deadline starts when a worker picks the
+        call up, so time queued behind other calls of this provider is not
+        counted either.
+        """
+        self.before_call()
+        if throttle is not None:
+            throttle.acquire(tokens)
+        try:
+            if self.deadline:
+                started = []
+                ready = threading.Event()
+
+                def run():
+                    started.append(time.monotonic())
+                    ready.set()
+                    return func(*args, **kwargs)
+
+                future = self._executor.submit(run)
+                ready.wait()
+                try:
+                    result = future.result(timeout=max(0.0, started[0] + self.deadline - time.monotonic()))
+                except FutureTimeout:
+                    raise self._timed_out() from None
+            else:
+                result = func(*args, **kwargs)
+        except ProviderUnavailable:
+            raise
+        except Exception as exc:
+            if _is_client_error(exc):
+                self.record_success()
+            else:
+                self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+    async def call_async(self, func, *args, throttle=None, tokens=1, **kwargs):
+        """Await ``func(*args, **kwargs)`` through the breaker and deadline (see ``call``)."""
+        self.before_call()
+        if throttle is not None:
+            await throttle.acquire_async(tokens)
+        try:
+            result = await asyncio.wait_for(func(*args, **kwargs), self.deadline)
+        except asyncio.TimeoutError:
+            raise self._timed_out() from None
+        except Exception as exc:
+            if _is_client_error(exc):
+                self.record_success()
+            else:
+                self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+    def stats(self):
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "calls": self.calls,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+                "opened": self.opened,
+                "deadline_s": self.deadline,
+            }
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def _configured(provider):
+    failures, reset = DEFAULT_BREAKERS.get(provider, (5, 30))
+    override = os.getenv(f"ADVISOR_BREAKER_{provider.upper()}")
+    if override:
+        parts = override.split(",")
+        failures = int(parts[0])
+        reset = float(parts[1]) if len(parts) > 1 else reset
+    deadline = float(os.getenv(f"ADVISOR_DEADLINE_{provider.upper()}", DEFAULT_DEADLINES.get(provider, 10.0)))
+    return failures, reset, deadline or None
+
+
+def breaker(provider):
+    """Return the shared CircuitBreaker for ``provider``, creating it on first use."""
+    with _breakers_lock:
+        circuit = _breakers.get(provider)
+        if circuit is None:
+            circuit = _breakers[provider] = CircuitBreaker(provider, *_configured(provider))
+        return circuit
+
+
+def guarded(provider, rate_limited=False):
+    """Decorator that runs each call through ``provider``'s breaker and deadline.
+
+    With ``rate_limited``, admitted calls also take a token from ``provider``'s
+    rate limiter; calls rejected by an open breaker never wait for one.
+    Works for both plain and ``async def`` functions.
+    """
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                throttle = limiter(provider) if rate_limited else None
+                return await breaker(provider).call_async(func, *args, throttle=throttle, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            throttle = limiter(provider) if rate_limited else None
+            return breaker(provider).call(func, *args, throttle=throttle, **kwargs)
+        return wrapper
+    return decorator
+
+
+def breaker_stats():
+    """Return ``{provider: stats}`` for every breaker used so far."""
+    with _breakers_lock:
+        circuits = dict(_breakers)
+    return {provider: circuit.stats() for provider, circuit in circuits.items()}
@@ -0,0 +1,150 @@
+"""Bulk quote and profile fetch for many symbols at once.
+
+Quotes come from Yahoo's multi-symbol quote endpoint in chunks of
+``CHUNK_SIZE`` symbols per request; a chunk that fails falls back to the
+provider's daily bars (through its breaker and rate limiter) for its
+prices. Yahoo has no multi-symbol profile endpoint, so profiles are
+fetched concurrently on one event loop.
+Each profile's compact snapshot lands in the shared ``market_cache`` under
+the same key as the single-symbol tools, so later company-info calls are
+answered from memory.
+Quotes are cached for repeated bulk calls (e.g. the screener), and the
+price tool answers from a cached quote until it expires. Symbols that could
+not be fetched are reported instead of failing the whole batch.
+"""
+
+import asyncio
+
+from advisor import symbols
+from advisor.cache import market_cache, PRICE_TTL, QUOTE_TTL
+from advisor.providers import default_provider
+from advisor.yahoo_async import AsyncYahooClient
+
+CHUNK_SIZE = 50
+
+## v7 quote fields kept in the snapshot, renamed to their ``Ticker.info`` names where they differ
+QUOTE_FIELDS = {
+    "shortName": "shortName",
+    "currency": "currency",
+    "regularMarketPrice": "regularMarketPrice",
+    "regularMarketChangePercent": "regularMarketChangePercent",
+    "marketCap": "marketCap",
+    "trailingPE": "trailingPE",
+    "forwardPE": "forwardPE",
+    "epsTrailingTwelveMonths": "trailingEps",
+    "priceToBook": "priceToBook",
+    "fiftyTwoWeekLow": "fiftyTwoWeekLow",
+    "fiftyTwoWeekHigh": "fiftyTwoWeekHigh",
+    "fiftyDayAverage": "fiftyDayAverage",
+    "twoHundredDayAverage": "twoHundredDayAverage",
+    "trailingAnnualDividendYield": "dividendYield",
+    "averageDailyVolume3Month": "averageVolume",
+}
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _run(coroutine):
+    """Run ``coroutine`` from sync code (tools run in worker threads without a loop)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    raise RuntimeError("bulk fetch helpers are synchronous; await the AsyncYahooClient methods instead")
+
+
+def _resolve_all(symbols_list):
+    """Map each requested symbol to its Yahoo symbol, keeping the request order."""
+    return {query: symbols.resolve(query) or query.strip().upper() for query in symbols_list}
+
+
+def _download_prices(chunk):
+    """Fallback: last close for ``chunk`` from the provider's daily bars."""
+    prices = {}
+    for symbol, bars in default_provider().histories(chunk, period="5d").items():
+        if bars is not None and len(bars):
+            prices[symbol] = float(bars["Close"].iloc[-1])
+    return prices
+
+
+async def _fetch_quotes(yahoo_symbols, chunk_size):
+    quotes, failed = {}, {}
+    async with AsyncYahooClient() as client:
+        chunks = list(_chunks(yahoo_symbols, chunk_size))
+        results = await asyncio.gather(*(client.get_quotes(chunk) for chunk in chunks), return_exceptions=True)
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, Exception):
+            try:
+                prices = await asyncio.to_thread(_download_prices, chunk)
+            except Exception as e:
+                prices = {}
+                result = e
+            for symbol in chunk:
+                if symbol in prices:
+                    quotes[symbol] = {"symbol": symbol, "regularMarketPrice": prices[symbol]}
+                else:
+                    failed[symbol] = f"{type(result).__name__}: {result}"
+            continue
+        for symbol in chunk:
+            if symbol in result:
+                raw = result[symbol]
+                quotes[symbol] = {"symbol": symbol, **{name: raw.get(field) for field, name in QUOTE_FIELDS.items()}}
+            else:
+                failed[symbol] = "not found"
+    return quotes, failed
+
+
+def bulk_quotes(symbols_list, chunk_size=CHUNK_SIZE):
+    """Fetch quote snapshots for many symbols, serving cached ones from memory.
+
+    Args:
+        symbols_list (list[str]): Tickers or company names.
+        chunk_size (int): Symbols per provider request.
+
+    Returns:
+        dict: ``quotes`` (Yahoo symbol -> snapshot dict) and ``failed`` (Yahoo symbol -> reason).
+    """
+    resolved = _resolve_all(symbols_list)
+    quotes, missing = {}, []
+    for symbol in dict.fromkeys(resolved.values()):
+        cached = market_cache.get(("quote", symbol))
+        if cached is not None:
+            quotes[symbol] = cached
+        else:
+            missing.append(symbol)
+    failed = {}
+    if missing:
+        fetched, failed = _run(_fetch_quotes(missing, chunk_size))
+        for symbol, quote in fetched.items():
+            market_cache.set(("quote", symbol), quote, QUOTE_TTL)
+            if quote.get("regularMarketPrice"):
+                market_cache.set(("price", symbol), quote["regularMarketPrice"], PRICE_TTL)
+        quotes.update(fetched)
+    return {"quotes": quotes, "failed": failed}
+
+
+async def _fetch_profiles(yahoo_symbols, max_clients):
+    async with AsyncYahooClient(max_clients=max_clients) as client:
+        return await client.gather(client.get_info, yahoo_symbols)
+
+
+def bulk_profiles(symbols_list, max_clients=20):
+    """Fetch ``Ticker.info``-style profiles for many symbols concurrently (their snapshots are cached).
+
+    Returns:
+        dict: ``profiles`` (Yahoo symbol -> info dict) and ``failed`` (Yahoo symbol -> reason).
+    """
+    yahoo_symbols = list(dict.fromkeys(_resolve_all(symbols_list).values()))
+    results = _run(_fetch_profiles(yahoo_symbols, max_clients))
+    profiles, failed = {}, {}
+    for symbol, result in results.items():
+        if isinstance(result, Exception):
+            failed[symbol] = f"{type(result).__name__}: {result}"
+        elif not result:
+            failed[symbol] = "not found"
+        else:
+            profiles[symbol] = result
+    return {"profiles": profiles, "failed": failed}
@@ -0,0 +1,112 @@
+"""Bounded in-memory cache for market data.
+
+One ``TTLCache`` instance (``market_cache``) is shared by every tool, so an
+advisory run fetches each Yahoo payload once instead of once per tool call.
+Entries expire per field (prices in seconds, profile in hours, financials in
+days) and the least recently used entry is evicted once the cache is full.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+## Time-to-live per kind of data, in seconds
+PRICE_TTL = 30
+QUOTE_TTL = 5 * 60
+PROFILE_TTL = 6 * 60 * 60
+FINANCIALS_TTL = 24 * 60 * 60
+## Daily bars: only the last bar moves during the session
+HISTORY_TTL = 60 * 60
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self, maxsize=1024, default_ttl=PROFILE_TTL):
+        """
+        Args:
+            maxsize (int): Maximum number of entries kept before LRU eviction.
+            default_ttl (float): TTL in seconds used when ``set`` gets none.
+        """
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.listeners = []  # callables(key, hit) notified on every lookup
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.RLock()
+
+    def get(self, key, default=None):
+        """Return the cached value for ``key`` or ``default`` if missing/expired."""
+        value = self._lookup(key)
+        for listener in self.listeners:
+            listener(key, value is not _MISSING)
+        return default if value is _MISSING else value
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if time.monotonic() < expires_at:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return _MISSING
+
+    def set(self, key, value, ttl=None):
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        ttl = self.default_ttl if ttl is None else ttl
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key, loader, ttl=None):
+        """Return the cached value for ``key``, calling ``loader()`` on a miss.
+
+        ``None`` results are not cached so a failed fetch is retried next time.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = loader()
+        if value is not None:
+            self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        """Return hit/miss counters and current size as a dict."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+
+## Cache shared by all market-data tools
+market_cache = TTLCache(maxsize=2048)
@@ -0,0 +1,150 @@
+"""Per-task checkpoints so failed or interrupted crew runs can resume.
+
+Every run has a run ID. Each completed task's output is persisted under
+(run ID, task position) as soon as it finishes, and re-running with the
+same run ID restores those outputs instead of executing the tasks again, so
+a failure in ``advise`` no longer repays the financials, news and analysis
+LLM and network calls. A run only resumes with the inputs and the number of
+tasks it was started with.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+
+from advisor.store import DEFAULT_DB_PATH
+
+
+class CheckpointMismatch(ValueError):
+    """Raised when a run is resumed with different inputs or a different task list."""
+
+
+class CheckpointStore:
+    """SQLite-backed run and task checkpoints."""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self.restored = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS runs ("
+                " run_id TEXT PRIMARY KEY, inputs TEXT, status TEXT, error TEXT,"
+                " started_at REAL, updated_at REAL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS task_checkpoints ("
+                " run_id TEXT, task_index INTEGER, agent TEXT, output TEXT, created_at REAL,"
+                " PRIMARY KEY (run_id, task_index))"
+            )
+            ## Databases created before task counts were recorded
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(runs)")]
+            if "task_count" not in columns:
+                self._conn.execute("ALTER TABLE runs ADD COLUMN task_count INTEGER")
+
+    def _set_status(self, run_id, inputs, status, error=None, task_count=None):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO runs (run_id, inputs, status, error, started_at, updated_at, task_count)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT(run_id) DO UPDATE SET"
+                " status = excluded.status, error = excluded.error, updated_at = excluded.updated_at,"
+                " task_count = COALESCE(excluded.task_count, runs.task_count)",
+                (run_id, json.dumps(inputs, default=str), status, error, now, now, task_count),
+            )
+
+    def run_info(self, run_id):
+        """Return ``(inputs, task_count)`` recorded for ``run_id``, or None for a new run."""
+        with self._lock:
+            row = self._conn.execute("SELECT inputs, task_count FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return (json.loads(row[0]), row[1]) if row else None
+
+    def check_resumable(self, run_id, inputs, task_count):
+        """Raise ``CheckpointMismatch`` unless ``run_id`` is new or was started with the same inputs and tasks."""
+        stored = self.run_info(run_id)
+        done = self.completed_tasks(run_id)
+        if stored is not None:
+            stored_inputs, stored_count = stored
+            if stored_inputs != json.loads(json.dumps(inputs, default=str)):
+                raise CheckpointMismatch(f"Run {run_id} was started with inputs {stored_inputs}, not {inputs}; "
+                                         "start a new run instead of resuming it")
+            if stored_count is not None and stored_count != task_count:
+                raise CheckpointMismatch(f"Run {run_id} had {stored_count} tasks, the crew now has {task_count}; "
+                                         "its checkpoints cannot be resumed")
+        if done and done[-1] >= task_count:
+            raise CheckpointMismatch(f"Run {run_id} has a checkpoint for task {done[-1] + 1}, "
+                                     f"the crew only has {task_count} tasks")
+        return done
+
+    def load(self, run_id, task_index):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT output FROM task_checkpoints WHERE run_id = ? AND task_index = ?",
+                (run_id, task_index),
+            ).fetchone()
+        return row[0] if row else None
+
+    def save(self, run_id, task_index, agent_role, output):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO task_checkpoints VALUES (?, ?, ?, ?, ?)",
+                               (run_id, task_index, agent_role, output, time.time()))
+
+    def completed_tasks(self, run_id):
+        """Return the positions of tasks already checkpointed for ``run_id``."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT task_index FROM task_checkpoints WHERE run_id = ? ORDER BY task_index", (run_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def runs(self, status=None):
+        """Return ``[(run_id, status, inputs, completed, task_count, updated_at)]``, newest first.
+
+        ``task_count`` is the crew's task count when the run started (None for older runs).
+        """
+        query = ("SELECT r.run_id, r.status, r.inputs, COUNT(c.task_index), r.task_count, r.updated_at FROM runs r"
+                 " LEFT JOIN task_checkpoints c ON c.run_id = r.run_id"
+                 + (" WHERE r.status = ?" if status else "")
+                 + " GROUP BY r.run_id ORDER BY r.updated_at DESC")
+        with self._lock:
+            return self._conn.execute(query, (status,) if status else ()).fetchall()
+
+    def attach(self, crew, run_id):
+        """Checkpoint and restore the tasks of ``crew`` (a per-run copy) under ``run_id``, in place."""
+        indexes = {id(task): index for index, task in enumerate(crew.tasks)}
+        for agent in crew.agents:
+            object.__setattr__(agent, "execute_task", self._wrap(agent, agent.execute_task, run_id, indexes))
+        return crew
+
+    def _wrap(self, agent, execute_task, run_id, indexes):
+        def checkpointed(task, context=None, tools=None):
+            index = indexes.get(id(task))
+            if index is not None:
+                output = self.load(run_id, index)
+                if output is not None:
+                    with self._lock:
+                        self.restored += 1
+                    print(f"Run {run_id}: restored task {index + 1} ({agent.role}) from checkpoint")
+                    return output
+            output = execute_task(task, context=context, tools=tools)
+            if index is not None and isinstance(output, str):
+                self.save(run_id, index, agent.role, output)
+            return output
+        return checkpointed
+
+    def kickoff(self, crew, inputs, run_id, kickoff=None):
+        """Run ``crew`` under ``run_id``, resuming from its checkpoints and recording the outcome."""
+        done = self.check_resumable(run_id, inputs, len(crew.tasks))
+        if done:
+            print(f"Resuming run {run_id}: {len(done)}/{len(crew.tasks)} tasks already completed")
+        self._set_status(run_id, inputs, "running", task_count=len(crew.tasks))
+        self.attach(crew, run_id)
+        try:
+            result = kickoff(crew, inputs) if kickoff else crew.kickoff(inputs=inputs)
+        except BaseException as e:
+            self._set_status(run_id, inputs, "failed", f"{type(e).__name__}: {e}")
+            raise
+        self._set_status(run_id, inputs, "completed")
+        return result
@@ -0,0 +1,87 @@
+"""Single-flight request coalescing.
+
+Concurrent calls with the same key share one execution: the first caller
+runs the function and every caller that arrives while it is in flight
+waits for, and receives, the same result (or exception). Nothing is cached
+once the call finishes.
+
+Two levels are provided: ``coalesced`` for tool and fetch functions (same
+function and arguments) and ``kickoff_once`` for whole crew runs (same crew,
+same inputs, same day), which keeps provider and LLM load flat when many
+users ask for the same stock at market open.
+"""
+
+import functools
+import json
+import threading
+from concurrent.futures import Future
+from datetime import date
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key, func, *args, **kwargs):
+        """Run ``func(*args, **kwargs)`` once per in-flight ``key`` and return its result."""
+        with self._lock:
+            self.calls += 1
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def stats(self):
+        with self._lock:
+            return {"calls": self.calls, "shared": self.shared, "in_flight": len(self._in_flight)}
+
+
+_call_flights = SingleFlight()
+_crew_flights = SingleFlight()
+
+
+def coalesced(func):
+    """Decorator: concurrent calls of ``func`` with identical arguments share one execution."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (func.__module__, func.__qualname__, repr(args), repr(sorted(kwargs.items())))
+        return _call_flights.do(key, func, *args, **kwargs)
+    return wrapper
+
+
+def kickoff_once(crew, inputs, kickoff=None):
+    """Run ``crew`` with ``inputs``, sharing the run with identical in-flight requests today.
+
+    Args:
+        crew: The Crew (or per-run copy) to kick off; copies of one crew share ``crew.key``.
+        inputs (dict): Kickoff inputs.
+        kickoff (callable): Optional ``kickoff(crew, inputs)``, default ``crew.kickoff``.
+    """
+    key = (getattr(crew, "key", None) or id(crew), json.dumps(inputs, sort_keys=True, default=str),
+           date.today().isoformat())
+    run = kickoff or (lambda crew, inputs: crew.kickoff(inputs=inputs))
+    return _crew_flights.do(key, run, crew, inputs)
+
+
+def coalescing_stats():
+    return {"calls": _call_flights.stats(), "crews": _crew_flights.stats()}
@@ -0,0 +1,99 @@
+"""Token-compact rendering of financial statements for LLM context.
+
+``financials.to_json(orient="index")`` repeats long keys and full-precision
+floats for every line item. ``compact_statement`` keeps a selectable subset
+of key items and the latest periods, scales and rounds the numbers and lays
+them out as one small table, which is several times fewer prompt tokens.
+"""
+
+import math
+import os
+
+## Line items kept by default, in display order
+KEY_ITEMS = (
+    "Total Revenue",
+    "Gross Profit",
+    "Operating Income",
+    "EBITDA",
+    "Interest Expense",
+    "Pretax Income",
+    "Net Income",
+    "Diluted EPS",
+)
+## Items that are per-share values and must not be scaled
+PER_SHARE_ITEMS = {"Basic EPS", "Diluted EPS"}
+
+UNITS = {"K": 1e3, "L": 1e5, "M": 1e6, "Cr": 1e7, "B": 1e9}
+
+DEFAULT_FORMAT = os.getenv("ADVISOR_STATEMENT_FORMAT", "compact")    # "compact" or "json"
+DEFAULT_PERIODS = int(os.getenv("ADVISOR_STATEMENT_PERIODS", "4"))
+DEFAULT_ITEMS = tuple(i.strip() for i in os.getenv("ADVISOR_STATEMENT_ITEMS", "").split(",") if i.strip()) or KEY_ITEMS
+
+
+def as_float(value):
+    """Float value of a provider field; NaN when it is missing or not numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def is_indian_symbol(symbol):
+    return symbol.upper().endswith((".NS", ".BO"))
+
+
+def pick_unit(values, indian=False):
+    """Choose a scale unit for ``values``: crore for Indian stocks, else M or B by magnitude."""
+    if indian:
+        return "Cr"
+    largest = max((abs(v) for v in values if v is not None and not math.isnan(v)), default=0)
+    return "B" if largest >= 1e10 else "M"
+
+
+def _format(value, scale, digits):
+    if value is None or math.isnan(value):
+        return "-"
+    return f"{value / scale:.{digits}f}"
+
+
+def compact_statement(frame, items=DEFAULT_ITEMS, periods=DEFAULT_PERIODS, unit=None, indian=False,
+                      digits=1, title="Income statement"):
+    """Render a statement frame (line items x periods) as a compact text table.
+
+    Args:
+        frame (DataFrame): Statement shaped like ``Ticker.financials``.
+        items (tuple[str]): Line items to keep, in order; missing ones are skipped.
+            An empty tuple keeps every item.
+        periods (int): Number of latest periods to keep.
+        unit (str): Scale unit from ``UNITS``; chosen automatically when None.
+        indian (bool): Use Indian units (crore) when choosing automatically.
+        digits (int): Decimal places after scaling.
+        title (str): Table caption.
+
+    Returns:
+        str: Caption line, header row and one row per line item.
+    """
+    columns = sorted(frame.columns, reverse=True)[:periods]
+    rows = [item for item in items if item in frame.index] if items else list(frame.index)
+    if unit is None:
+        unit = pick_unit([frame.at[item, column] for item in rows if item not in PER_SHARE_ITEMS
+                          for column in columns], indian)
+    scale = UNITS[unit]
+
+    header = ["Item"] + [column.strftime("%Y-%m") if hasattr(column, "strftime") else str(column)
+                         for column in columns]
+    lines = [f"{title} ({unit}, per-share items unscaled, newest first)", " | ".join(header)]
+    for item in rows:
+        item_scale = 1 if item in PER_SHARE_ITEMS else scale
+        item_digits = 2 if item in PER_SHARE_ITEMS else digits
+        values = [_format(frame.at[item, column], item_scale, item_digits) for column in columns]
+        lines.append(" | ".join([item] + values))
+    return "\n".join(lines)
+
+
+def render_statement(frame, symbol, output_format=DEFAULT_FORMAT, **kwargs):
+    """Return the statement as compact text or as the original ``to_json(orient="index")``."""
+    if output_format == "json":
+        return frame.to_json(orient="index")
+    kwargs.setdefault("indian", is_indian_symbol(symbol))
+    return compact_statement(frame, **kwargs)
@@ -0,0 +1,50 @@
+"""DAG-aware task scheduling for sequential crews.
+
+In a sequential crew CrewAI runs tasks marked ``async_execution=True`` in the
+background and makes the next synchronous task wait for all of them. Marking
+each run of mutually independent tasks (no task uses another as context) as
+async therefore executes them concurrently while their dependants still
+block on every one of their inputs.
+"""
+
+
+def _depends_on(task, others):
+    context = task.context if isinstance(task.context, list) else []
+    return any(other in context for other in others)
+
+
+def concurrent_groups(tasks):
+    """Split ``tasks`` (in crew order) into consecutive groups of independent tasks."""
+    groups = []
+    for task in tasks:
+        if groups and not _depends_on(task, groups[-1]):
+            groups[-1].append(task)
+        else:
+            groups.append([task])
+    return groups
+
+
+def enable_concurrent_tasks(crew):
+    """Mark independent tasks of ``crew`` for concurrent execution.
+
+    Tasks in a group of two or more independent tasks become async, except
+    a task that takes context from an async task no synchronous task has
+    joined yet: CrewAI only waits for async tasks at the next synchronous
+    one, so that task stays synchronous (and joins them). The last task of
+    the crew is always kept synchronous.
+
+    Returns:
+        list[list]: The task groups, for logging.
+    """
+    groups = concurrent_groups(crew.tasks)
+    pending = []   # async tasks not yet joined by a synchronous task
+    for index, group in enumerate(groups):
+        for position, task in enumerate(group):
+            ## Keep the final task synchronous so kickoff returns its output
+            final = index == len(groups) - 1 and position == len(group) - 1
+            if len(group) >= 2 and not final and not _depends_on(task, pending):
+                task.async_execution = True
+                pending.append(task)
+            else:
+                pending = []
+    return groups
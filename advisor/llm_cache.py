@@ -0,0 +1,147 @@
+"""Opt-in on-disk cache of LLM responses for development and regression runs.
+
+Responses are stored in SQLite under a hash of the model, messages, tools
+and sampling parameters (exact match only) and evicted least-recently-used
+once the cache grows past ``ADVISOR_LLM_CACHE_MAX_MB``.
+
+    ADVISOR_LLM_CACHE=1            enable the cache (off by default)
+    ADVISOR_LLM_CACHE_BYPASS=1     production: always call the model, still record answers
+    ADVISOR_LLM_CACHE_PATH=...     cache file, default llm_cache.sqlite3
+
+Agents opt in with ``llm=cached_llm("gpt-4.1-2025-04-14")``.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from crewai import LLM
+
+DEFAULT_PATH = os.getenv("ADVISOR_LLM_CACHE_PATH", "llm_cache.sqlite3")
+MAX_BYTES = int(float(os.getenv("ADVISOR_LLM_CACHE_MAX_MB", "200")) * 1024 * 1024)
+
+## LLM attributes that change the answer and so belong in the key
+_PARAMS = ("temperature", "top_p", "max_tokens", "max_completion_tokens", "stop", "seed",
+           "response_format", "presence_penalty", "frequency_penalty", "reasoning_effort")
+
+
+def _enabled():
+    return os.getenv("ADVISOR_LLM_CACHE", "").lower() in ("1", "true", "yes")
+
+
+class ResponseCache:
+    """SQLite store of LLM responses with LRU eviction by total size."""
+
+    def __init__(self, path=DEFAULT_PATH, max_bytes=MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.bypass = os.getenv("ADVISOR_LLM_CACHE_BYPASS", "").lower() in ("1", "true", "yes")
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses ("
+                " key TEXT PRIMARY KEY, model TEXT, response TEXT, size INTEGER, last_used REAL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS llm_responses_lru ON llm_responses (last_used)")
+
+    @staticmethod
+    def key(model, messages, tools=None, params=None):
+        payload = {"model": model, "messages": messages, "tools": tools, "params": params or {}}
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            if self.bypass:
+                self.misses += 1
+                return None
+            row = self._conn.execute("SELECT response FROM llm_responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            with self._conn:
+                self._conn.execute("UPDATE llm_responses SET last_used = ? WHERE key = ?", (time.time(), key))
+            return row[0]
+
+    def put(self, key, model, response):
+        size = len(response.encode())
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO llm_responses VALUES (?, ?, ?, ?, ?)",
+                               (key, model, response, size, time.time()))
+            self._evict()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        ## Drop least recently used entries until 90% of the budget is free again
+        target = total - int(self.max_bytes * 0.9)
+        freed = 0
+        stale = []
+        for key, size in self._conn.execute("SELECT key, size FROM llm_responses ORDER BY last_used"):
+            stale.append((key,))
+            freed += size
+            if freed >= target:
+                break
+        self._conn.executemany("DELETE FROM llm_responses WHERE key = ?", stale)
+
+    def stats(self):
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_responses").fetchone()
+            lookups = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses,
+                    "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                    "entries": entries, "size_mb": round(size / 1024 / 1024, 2), "bypass": self.bypass}
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def response_cache():
+    """Return the process-wide ResponseCache, opening it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
+
+
+class CachedLLM(LLM):
+    """CrewAI ``LLM`` that answers repeated identical calls from the response cache."""
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+        cache = response_cache()
+        params = {name: getattr(self, name, None) for name in _PARAMS}
+        key = cache.key(self.model, messages, tools, params)
+        response = cache.get(key)
+        if response is not None:
+            return response
+        response = super().call(messages, tools=tools, callbacks=callbacks,
+                                available_functions=available_functions, **kwargs)
+        if isinstance(response, str) and response:
+            cache.put(key, self.model, response)
+        return response
+
+
+def cached_llm(model, fallback=None, **kwargs):
+    """Return a CachedLLM for ``model`` when ADVISOR_LLM_CACHE is on.
+
+    Otherwise returns ``fallback`` if given, else the plain model name, so
+    agents behave exactly as before when the cache is off.
+    """
+    if _enabled():
+        return CachedLLM(model=model, **kwargs)
+    return fallback if fallback is not None else model
+
+
+def llm_cache_stats():
+    """Cache metrics, or None when the cache is disabled."""
+    return response_cache().stats() if _enabled() else None
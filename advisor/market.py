@@ -0,0 +1,183 @@
+"""Cached market-data access shared by the advisor tools.
+
+Every helper goes through ``market_cache``, so the price, profile and
+income-statement tools reuse a single profile fetch per symbol. Profiles
+are cached as compact ``CompanySnapshot`` records, not ``Ticker.info``
+dicts. Fetches go to the configured provider (see ``advisor.providers``);
+symbols are always Yahoo symbols.
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+from advisor.cache import market_cache, PRICE_TTL, PROFILE_TTL, FINANCIALS_TTL, HISTORY_TTL
+from advisor.store import default_store
+from advisor import symbols
+from advisor.coalesce import coalesced
+from advisor.providers import default_provider
+from advisor.breaker import ProviderUnavailable
+from advisor.snapshot import CompanySnapshot
+
+## Exchange suffixes probed, in order, when a symbol is not in the listing index
+EXCHANGE_SUFFIXES = ("", ".NS", ".BO")
+## Daily history window used by the technical indicators (~252 trading days)
+HISTORY_PERIOD = "1y"
+## Concurrent fetches for multi-symbol tools
+MANY_WORKERS = 8
+
+
+@coalesced
+def _fetch_info(symbol):
+    info = default_provider().info(symbol)
+    if info:
+        remember_profile(symbol, info)
+    return info or None
+
+
+def remember_profile(symbol, info):
+    """Cache the price, compact snapshot and industry from a fresh profile payload.
+
+    The ``Ticker.info`` dict itself is not cached.
+
+    Returns:
+        CompanySnapshot: The snapshot built from ``info``.
+    """
+    price = info.get("regularMarketPrice", info.get("currentPrice"))
+    if price:
+        market_cache.set(("price", symbol), price, PRICE_TTL)
+    symbols.record_industry(symbol, info.get("industry"))
+    snapshot = CompanySnapshot.from_info(info)
+    snapshot.symbol = snapshot.symbol or symbol
+    market_cache.set(("snapshot", symbol), snapshot.to_bytes(), PROFILE_TTL)
+    return snapshot
+
+
+def get_info(symbol):
+    """Return the full ``Ticker.info``-shaped dict for ``symbol``, or None.
+
+    Always fetched (identical in-flight calls are coalesced); only the compact
+    snapshot is cached, so callers that need other fields cache what they derive.
+    """
+    return _fetch_info(symbol)
+
+
+def get_snapshot(symbol):
+    """Return the ``CompanySnapshot`` for ``symbol``, or None (cached for hours)."""
+    cached = market_cache.get(("snapshot", symbol))
+    if cached is not None:
+        return CompanySnapshot.from_bytes(cached)
+    info = _fetch_info(symbol)
+    if info is None:
+        return None
+    snapshot = CompanySnapshot.from_info(info)
+    snapshot.symbol = snapshot.symbol or symbol
+    return snapshot
+
+
+def get_price(symbol):
+    """Return the current market price for ``symbol`` (cached for seconds, bulk quotes for minutes)."""
+    price = market_cache.get(("price", symbol))
+    if price is not None:
+        return price
+    ## A bulk quote from the last few minutes (screener, peer ranking) is fresh enough
+    quote = market_cache.get(("quote", symbol))
+    if quote and quote.get("regularMarketPrice"):
+        return quote["regularMarketPrice"]
+    info = _fetch_info(symbol)
+    if info is None:
+        return None
+    return info.get("regularMarketPrice", info.get("currentPrice"))
+
+
+@coalesced
+def _fetch_financials(symbol):
+    return default_provider().financials(symbol)
+
+
+def get_financials(symbol):
+    """Return the annual income statement frame for ``symbol``.
+
+    Served from memory (cached for a day), then from the on-disk fundamentals
+    store, which only goes to the provider once a newer fiscal year may be published.
+    """
+    def load():
+        return default_store().get_statement(symbol, "income", lambda: _fetch_financials(symbol))
+    return market_cache.get_or_load(("financials", symbol), load, FINANCIALS_TTL)
+
+
+@coalesced
+def _fetch_histories(symbols_list, period):
+    return default_provider().histories(symbols_list, period)
+
+
+def get_histories(symbols_list, period=HISTORY_PERIOD):
+    """Return ``{symbol: daily OHLCV frame or None}`` for many symbols (cached for an hour).
+
+    Symbols already in the cache are served from memory; the rest are
+    fetched from the provider together, in one request where it supports it.
+    """
+    histories = {symbol: market_cache.get(("history", symbol, period)) for symbol in symbols_list}
+    missing = [symbol for symbol, frame in histories.items() if frame is None]
+    if missing:
+        fetched = _fetch_histories(missing, period)
+        for symbol in missing:
+            frame = fetched.get(symbol)
+            if frame is not None:
+                market_cache.set(("history", symbol, period), frame, HISTORY_TTL)
+            histories[symbol] = frame
+    return histories
+
+
+def get_history(symbol, period=HISTORY_PERIOD):
+    """Return the daily OHLCV frame for ``symbol``, or None."""
+    return get_histories([symbol], period)[symbol]
+
+
+def get_many(getter, symbols_list, max_workers=MANY_WORKERS):
+    """Call ``getter(symbol)`` for many symbols concurrently through the shared cache.
+
+    Returns:
+        dict: ``{symbol: result}``, None for symbols whose fetch failed. Raises
+        ``ProviderUnavailable`` only when the provider is down for all of them.
+    """
+    if not symbols_list:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols_list)), thread_name_prefix="market") as pool:
+        ## Each fetch runs in a copy of the caller's context, so per-call state
+        ## (e.g. the tracer's cache counters) follows it into the workers
+        futures = {symbol: pool.submit(contextvars.copy_context().run, getter, symbol) for symbol in symbols_list}
+    results, unavailable = {}, []
+    for symbol, future in futures.items():
+        error = future.exception()
+        if isinstance(error, ProviderUnavailable):
+            unavailable.append(error)
+        results[symbol] = None if error else future.result()
+    if unavailable and len(unavailable) == len(symbols_list):
+        raise unavailable[0]
+    return results
+
+
+def _probe_symbol(query):
+    query = query.strip().upper()
+    candidates = [query] if "." in query else [query + suffix for suffix in EXCHANGE_SUFFIXES]
+    for candidate in candidates:
+        try:
+            if get_snapshot(candidate):
+                return candidate
+        except ProviderUnavailable:
+            raise
+        except Exception:
+            continue
+    return None
+
+
+def resolve_symbol(query):
+    """Return the Yahoo symbol for a ticker or company name, or None.
+
+    The local listing index answers without network calls; symbols missing
+    from it are probed with the exchange suffixes once and remembered.
+    """
+    symbol = symbols.resolve(query.strip())
+    if symbol:
+        return symbol
+    return market_cache.get_or_load(("symbol", query.strip().upper()), lambda: _probe_symbol(query), PROFILE_TTL)
@@ -0,0 +1,109 @@
+"""Content-addressed memoization of task outputs.
+
+An agent's result for a task is stored under a hash of the task definition
+(interpolated description and expected output), the agent configuration
+(role, goal, backstory, tools), the model and the input context passed from
+upstream tasks. Re-running a crew with byte-identical inputs, e.g. the same
+prefetched data, then reuses ``analyse`` and ``advise`` instead of calling
+the LLM again, and only stages whose inputs changed are recomputed.
+
+Tasks whose agent uses tools read live data that the key cannot see, so
+their entries expire after ``TOOL_TASK_MAX_AGE``. The backstories carry the
+current date, so every entry is naturally scoped to one day.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from advisor.store import DEFAULT_DB_PATH
+
+TOOL_TASK_MAX_AGE = int(os.getenv("ADVISOR_MEMO_TOOL_TASK_MAX_AGE", str(60 * 60)))
+MAX_AGE = int(os.getenv("ADVISOR_MEMO_MAX_AGE", str(24 * 60 * 60)))
+
+
+def _model_name(llm):
+    return getattr(llm, "model", None) or getattr(llm, "model_name", None) or str(llm)
+
+
+def task_key(agent, task, context, tools):
+    """Return the content hash identifying one agent run of ``task`` with ``context``."""
+    payload = {
+        "task": [task.description, task.expected_output],
+        "agent": [agent.role, agent.goal, agent.backstory],
+        "model": _model_name(agent.llm),
+        "tools": sorted(tool.name for tool in (tools if tools is not None else agent.tools or [])),
+        "context": context or "",
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class TaskMemo:
+    """SQLite-backed task-output memo shared by all crews in the process."""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS task_memo ("
+                " key TEXT PRIMARY KEY, agent TEXT, output TEXT, created_at REAL)"
+            )
+
+    def get(self, key, max_age=MAX_AGE):
+        with self._lock:
+            row = self._conn.execute("SELECT output, created_at FROM task_memo WHERE key = ?", (key,)).fetchone()
+            if row is not None and time.time() - row[1] <= max_age:
+                self.hits += 1
+                return row[0]
+            self.misses += 1
+            return None
+
+    def put(self, key, agent_role, output):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO task_memo VALUES (?, ?, ?, ?)",
+                               (key, agent_role, output, time.time()))
+
+    def prune(self, max_age=MAX_AGE):
+        """Delete entries older than ``max_age`` seconds. Returns the number removed."""
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM task_memo WHERE created_at < ?",
+                                      (time.time() - max_age,)).rowcount
+
+    def attach(self, crew):
+        """Memoize ``execute_task`` of every agent in ``crew`` (a per-run copy), in place.
+
+        Agents are wrapped per instance because ``Crew.copy()`` builds fresh agents.
+        """
+        for agent in crew.agents:
+            if getattr(agent, "_memo_attached", False):
+                continue
+            object.__setattr__(agent, "execute_task", self._wrap(agent, agent.execute_task))
+            object.__setattr__(agent, "_memo_attached", True)
+        return crew
+
+    def _wrap(self, agent, execute_task):
+        def memoized(task, context=None, tools=None):
+            key = task_key(agent, task, context, tools)
+            max_age = TOOL_TASK_MAX_AGE if (tools if tools is not None else agent.tools) else MAX_AGE
+            output = self.get(key, max_age)
+            if output is not None:
+                print(f"Reusing memoized output of '{agent.role}' for this task")
+                return output
+            output = execute_task(task, context=context, tools=tools)
+            if isinstance(output, str) and output:
+                self.put(key, agent.role, output)
+            return output
+        return memoized
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses,
+                    "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0}
@@ -0,0 +1,173 @@
+"""Sector peer comparison for a single company.
+
+Peers are the listings in the same Yahoo industry and market (India or US)
+in the local symbol index, keeping the largest by market cap. Their
+profiles are fetched concurrently through the shared cache, stacked into a
+(companies x metrics) NumPy array and ranked column by column, so the
+company's P/E, margins, returns and growth come with a percentile within
+its industry.
+
+The peer set and the peers' metrics are cached per industry, so further
+companies from the same industry in a run only fetch their own profile.
+"""
+
+import math
+import os
+import warnings
+
+import numpy as np
+
+from advisor import symbols
+from advisor.cache import market_cache, PROFILE_TTL
+from advisor.compact import as_float
+from advisor.market import get_info, get_many
+
+PEER_TTL = 24 * 60 * 60
+MAX_PEERS = int(os.getenv("ADVISOR_MAX_PEERS", "10"))
+MARKETS = {"IN": ("NSE", "BSE"), "US": ("US",)}
+
+## (info key, label, kind); "times" ratios are usually better when lower
+PEER_METRICS = (
+    ("trailingPE", "P/E", "times"),
+    ("priceToBook", "P/B", "times"),
+    ("enterpriseToEbitda", "EV/EBITDA", "times"),
+    ("grossMargins", "Gross mgn %", "pct"),
+    ("operatingMargins", "Op mgn %", "pct"),
+    ("profitMargins", "Net mgn %", "pct"),
+    ("returnOnEquity", "ROE %", "pct"),
+    ("revenueGrowth", "Rev growth %", "pct"),
+    ("earningsGrowth", "EPS growth %", "pct"),
+    ("debtToEquity", "D/E", "times"),
+    ("marketCap", "Mkt cap (B)", "billions"),
+)
+
+
+def market_of(symbol):
+    return "IN" if symbol.upper().endswith((".NS", ".BO")) else "US"
+
+
+def _largest(candidates, max_peers):
+    """Keep the ``max_peers`` largest candidates by market cap (one bulk quote request per 50)."""
+    if len(candidates) <= max_peers:
+        return candidates
+    try:
+        from advisor.bulk import bulk_quotes
+
+        quotes = bulk_quotes(candidates)["quotes"]
+    except Exception:
+        return candidates[:max_peers]
+    return sorted(candidates, key=lambda s: -((quotes.get(s) or {}).get("marketCap") or 0))[:max_peers]
+
+
+def peer_symbols(industry, market, max_peers=MAX_PEERS):
+    """Return the Yahoo symbols of the largest listed companies in ``industry`` (cached for a day)."""
+    def load():
+        listings = symbols.default_index().in_industry(industry, MARKETS[market])
+        return _largest([entry[3] for entry in listings], max_peers + 1)
+    return market_cache.get_or_load(("peers", industry, market, max_peers), load, PEER_TTL)
+
+
+def metric_matrix(infos):
+    """Stack ``{symbol: info}`` into (symbols, companies x metrics float array)."""
+    names = [symbol for symbol, info in infos.items() if info]
+    matrix = np.array([[as_float(infos[symbol].get(key)) for key, _, _ in PEER_METRICS] for symbol in names],
+                      dtype=float).reshape(len(names), len(PEER_METRICS))
+    return names, matrix
+
+
+def percentile_ranks(values):
+    """Percentile (0-100) of every row within its column: share of the other rows below it.
+
+    Ties count half; NaN values are ignored and get a NaN rank.
+    """
+    valid = np.isfinite(values)
+    below = (values[:, None, :] > values[None, :, :]).sum(axis=1)
+    ties = (values[:, None, :] == values[None, :, :]).sum(axis=1) - 1
+    others = valid.sum(axis=0) - 1
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ranks = (below + 0.5 * ties) / others * 100
+    return np.where(valid & (others > 0), ranks, np.nan)
+
+
+def peer_table(industry, market, max_peers=MAX_PEERS):
+    """Return ``(symbols, metrics)`` for an industry's peers (cached per industry)."""
+    def load():
+        peers = peer_symbols(industry, market, max_peers)
+        return metric_matrix(get_many(get_info, peers))
+    return market_cache.get_or_load(("peer_table", industry, market, max_peers), load, PROFILE_TTL)
+
+
+def company_metrics(symbol):
+    """Return ``(industry, metrics row)`` for ``symbol`` (cached for hours, not the full profile)."""
+    def load():
+        info = get_info(symbol)
+        return info and (info.get("industry"), metric_matrix({symbol: info})[1])
+    return market_cache.get_or_load(("peer_metrics", symbol), load, PROFILE_TTL) or (None, None)
+
+
+def compare(symbol, max_peers=MAX_PEERS):
+    """Compare ``symbol`` with its industry peers.
+
+    Returns:
+        dict: ``symbol``, ``industry``, ``peers`` (list), ``values`` (company
+        metrics), ``median``, ``low``, ``high`` (peer statistics) and
+        ``percentile`` (company rank among peers), arrays ordered like
+        ``PEER_METRICS``; None when the company has no industry or peers.
+    """
+    industry, own = company_metrics(symbol)
+    if not industry:
+        return None
+    peers, peer_metrics = peer_table(industry, market_of(symbol), max_peers)
+    keep = [i for i, peer in enumerate(peers) if peer != symbol][:max_peers]
+    if not keep:
+        return None
+    values = np.vstack([own, peer_metrics[keep]])
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        median = np.nanmedian(values[1:], axis=0)
+        low = np.nanmin(values[1:], axis=0)
+        high = np.nanmax(values[1:], axis=0)
+    return {
+        "symbol": symbol,
+        "industry": industry,
+        "peers": [peers[i] for i in keep],
+        "values": values[0],
+        "median": median,
+        "low": low,
+        "high": high,
+        "percentile": percentile_ranks(values)[0],
+    }
+
+
+def _format(value, kind):
+    if value is None or math.isnan(value):
+        return "-"
+    if kind == "pct":
+        return f"{value * 100:.1f}"
+    if kind == "billions":
+        return f"{value / 1e9:.1f}"
+    return f"{value:.1f}"
+
+
+def peer_summary(symbol, max_peers=MAX_PEERS):
+    """Render the peer comparison for ``symbol`` as a compact text table."""
+    result = compare(symbol, max_peers)
+    if result is None:
+        return (f"No industry peers found for {symbol}; "
+                "classify the listing index with `python -m advisor.symbols classify`")
+    lines = [
+        f"Peer comparison for {symbol} in {result['industry']} "
+        f"({len(result['peers'])} peers: {', '.join(result['peers'])})",
+        "Percentile = share of peers below the company (for P/E, P/B, EV/EBITDA and D/E lower is cheaper/safer)",
+        f"Metric | {symbol} | Peer median | Peer range | Percentile",
+    ]
+    for position, (_, label, kind) in enumerate(PEER_METRICS):
+        percentile = result["percentile"][position]
+        lines.append(" | ".join([
+            label,
+            _format(result["values"][position], kind),
+            _format(result["median"][position], kind),
+            f"{_format(result['low'][position], kind)} to {_format(result['high'][position], kind)}",
+            "-" if math.isnan(percentile) else f"{percentile:.0f}",
+        ]))
+    return "\n".join(lines)
@@ -0,0 +1,96 @@
+"""Deterministic data-prefetch stage that runs before the LLM agents.
+
+Given the ``{stock}`` input, the symbol is resolved and price, profile and
+income statements are fetched concurrently in plain Python. The results are
+appended to the descriptions of the data-hungry tasks, so agents read them
+instead of spending LLM iterations deciding which tools to call.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from advisor.compact import compact_statement, is_indian_symbol
+from advisor.market import get_snapshot, get_price, get_financials, resolve_symbol
+from advisor.breaker import ProviderUnavailable
+
+def prefetch(stock):
+    """Resolve ``stock`` and fetch its profile, price and income statements concurrently.
+
+    Returns:
+        dict: ``symbol``, ``company_info`` (``CompanySnapshot``), ``price``,
+        ``financials`` (DataFrame or None), ``errors`` and ``elapsed_s``.
+    """
+    started = time.perf_counter()
+    data = {"stock": stock, "symbol": None, "company_info": None, "price": None,
+            "financials": None, "errors": {}}
+    try:
+        symbol = resolve_symbol(stock)
+    except ProviderUnavailable as e:
+        data["errors"]["symbol"] = str(e)
+        symbol = None
+    if symbol is None:
+        data["errors"].setdefault("symbol", f"Could not resolve a listed symbol for {stock}")
+        data["elapsed_s"] = round(time.perf_counter() - started, 3)
+        return data
+    data["symbol"] = symbol
+
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="prefetch") as pool:
+        ## Fetching the profile also primes the price entry read below
+        futures = {
+            "company_info": pool.submit(get_snapshot, symbol),
+            "financials": pool.submit(get_financials, symbol),
+        }
+        for name, future in futures.items():
+            try:
+                data[name] = future.result()
+            except Exception as e:
+                data["errors"][name] = str(e)
+    try:
+        data["price"] = get_price(symbol)
+    except Exception as e:
+        data["errors"]["price"] = str(e)
+    data["elapsed_s"] = round(time.perf_counter() - started, 3)
+    return data
+
+
+def render_context(data):
+    """Render prefetched data as plain text for a task description.
+
+    The text avoids curly braces so CrewAI's ``{input}`` interpolation leaves it alone,
+    and carries no fetch time, so identical data gives identical descriptions
+    (and task memo keys); the agents already know the current date.
+    """
+    if data["symbol"] is None:
+        return ""
+    lines = [
+        "",
+        f"Prefetched market data for {data['stock']} (resolved symbol: {data['symbol']}). "
+        "Use it directly and only call tools for information that is missing below.",
+    ]
+    if data["price"] is not None:
+        lines.append(f"Current stock price: {data['price']:.2f}")
+    if data["company_info"]:
+        lines.append("Company profile and snapshot:")
+        lines.append(data["company_info"].render())
+    if data["financials"] is not None:
+        lines.append(compact_statement(data["financials"], indian=is_indian_symbol(data["symbol"]),
+                                       title="Annual income statement"))
+    return "\n".join(lines)
+
+
+def inject_context(crew, context, task_indexes):
+    """Append ``context`` to the descriptions of ``crew.tasks[i]`` for each index, in place."""
+    if not context:
+        return crew
+    for index in task_indexes:
+        crew.tasks[index].description += "\n" + context
+    return crew
+
+
+def prefetched_crew(crew, stock, task_indexes):
+    """Prefetch data for ``stock`` and inject it into ``crew`` (a per-run copy) in place."""
+    data = prefetch(stock)
+    for name, error in data["errors"].items():
+        print(f"Prefetch {name} failed for {stock}: {error}")
+    print(f"Prefetched {data['symbol'] or stock} in {data['elapsed_s']}s")
+    return inject_context(crew, render_context(data), task_indexes)
@@ -0,0 +1,426 @@
+"""Market-data providers behind one interface, with optional hedged requests.
+
+Every backend answers the same questions in Yahoo's shapes (a
+``Ticker.info``-style dict, a price, an annual income-statement frame,
+daily OHLCV bars), so the tools and caches do not care where the data came
+from.
+
+``ADVISOR_PROVIDER`` picks the primary backend (``yahoo`` or ``finnhub``).
+Setting ``ADVISOR_HEDGE_PROVIDER`` wraps it in a ``HedgedProvider``: when the
+primary has not answered by its recent p95 latency, the secondary is asked
+too and the first good answer wins.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from advisor.ratelimit import limiter
+from advisor.breaker import breaker, guarded
+
+DEFAULT_PROVIDER = os.getenv("ADVISOR_PROVIDER", "yahoo")
+HEDGE_PROVIDER = os.getenv("ADVISOR_HEDGE_PROVIDER", "")
+## Hedge deadline used until enough latencies have been observed
+HEDGE_AFTER = float(os.getenv("ADVISOR_HEDGE_AFTER", "1.5"))
+HEDGE_MIN_SAMPLES = 20
+## Symbols per yf.download call; each chunk gets its own deadline
+HISTORY_CHUNK = int(os.getenv("ADVISOR_HISTORY_CHUNK", "5"))
+
+## yfinance and curl_cffi are imported on first use, so importing this module
+## stays cheap; benchmarks assign a stand-in to ``yf`` before any call
+yf = None
+_session = None
+_import_lock = threading.Lock()
+
+
+def _yf():
+    global yf
+    with _import_lock:
+        if yf is None:
+            import yfinance
+            yf = yfinance
+        return yf
+
+
+def get_session():
+    """Return the shared browser-impersonating HTTP session used for Yahoo."""
+    global _session
+    with _import_lock:
+        if _session is None:
+            from curl_cffi import requests
+            _session = requests.Session(impersonate="chrome")
+        return _session
+
+
+class MarketDataProvider:
+    """Interface shared by all market-data backends.
+
+    Each method returns None when the provider has no data for ``symbol``
+    and raises on transport errors, or ``ProviderUnavailable`` when the
+    provider's circuit breaker is open or the call missed its deadline.
+    """
+
+    name = "base"
+
+    def info(self, symbol):
+        """Return a ``Ticker.info``-shaped dict for ``symbol``."""
+        raise NotImplementedError
+
+    def price(self, symbol):
+        """Return the current market price for ``symbol``."""
+        info = self.info(symbol)
+        return info and info.get("regularMarketPrice", info.get("currentPrice"))
+
+    def financials(self, symbol):
+        """Return the annual income statement (items x period-end columns)."""
+        raise NotImplementedError
+
+    def history(self, symbol, period="1y"):
+        """Return daily bars (Open, High, Low, Close, Volume) indexed by date."""
+        raise NotImplementedError
+
+    def histories(self, symbols, period="1y"):
+        """Return ``{symbol: bars or None}``; backends may batch the requests."""
+        return {symbol: self.history(symbol, period) for symbol in symbols}
+
+
+## Bar columns kept from every backend
+OHLCV = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def _clean_bars(frame):
+    if frame is None or frame.empty or "Close" not in frame:
+        return None
+    frame = frame[[column for column in OHLCV if column in frame]].dropna(subset=["Close"])
+    if frame.empty:
+        return None
+    ## Exchanges report in their own time zone; keep the trading date only
+    if getattr(frame.index, "tz", None) is not None:
+        frame.index = frame.index.tz_localize(None)
+    frame.index = frame.index.normalize()
+    return frame
+
+
+class YahooProvider(MarketDataProvider):
+    """yfinance backend; symbols are Yahoo symbols such as ``RELIANCE.NS``."""
+
+    name = "yahoo"
+
+    @guarded("yahoo", rate_limited=True)
+    def info(self, symbol):
+        return _yf().Ticker(symbol, session=get_session()).info or None
+
+    @guarded("yahoo", rate_limited=True)
+    def financials(self, symbol):
+        financials = _yf().Ticker(symbol, session=get_session()).financials
+        return None if financials is None or financials.empty else financials
+
+    @guarded("yahoo", rate_limited=True)
+    def history(self, symbol, period="1y"):
+        return _clean_bars(_yf().Ticker(symbol, session=get_session()).history(period=period, interval="1d"))
+
+    def histories(self, symbols, period="1y"):
+        ## yf.download sends one request per ticker, so the watchlist goes in
+        ## small chunks, each taking one token per symbol and its own deadline
+        symbols = list(symbols)
+        result = {}
+        for start in range(0, len(symbols), HISTORY_CHUNK):
+            chunk = symbols[start:start + HISTORY_CHUNK]
+            result.update(breaker("yahoo").call(self._download, chunk, period,
+                                                throttle=limiter("yahoo"), tokens=len(chunk)))
+        return result
+
+    @staticmethod
+    def _download(symbols, period):
+        import pandas as pd
+
+        frame = _yf().download(symbols, period=period, interval="1d", group_by="ticker",
+                               auto_adjust=True, progress=False, threads=False, session=get_session())
+        result = {}
+        for symbol in symbols:
+            if isinstance(frame.columns, pd.MultiIndex):
+                bars = frame[symbol] if symbol in frame.columns.get_level_values(0) else None
+            else:
+                bars = frame
+            result[symbol] = _clean_bars(bars)
+        return result
+
+
+## XBRL concepts from Finnhub's reported financials, renamed to Yahoo's row labels
+FINNHUB_CONCEPTS = {
+    "Revenues": "Total Revenue",
+    "RevenueFromContractWithCustomerExcludingAssessedTax": "Total Revenue",
+    "SalesRevenueNet": "Total Revenue",
+    "CostOfRevenue": "Cost Of Revenue",
+    "CostOfGoodsAndServicesSold": "Cost Of Revenue",
+    "GrossProfit": "Gross Profit",
+    "ResearchAndDevelopmentExpense": "Research And Development",
+    "SellingGeneralAndAdministrativeExpense": "Selling General And Administration",
+    "OperatingIncomeLoss": "Operating Income",
+    "InterestExpense": "Interest Expense",
+    "IncomeLossFromContinuingOperationsBeforeIncomeTaxesExtraordinaryItemsNoncontrollingInterest": "Pretax Income",
+    "IncomeTaxExpenseBenefit": "Tax Provision",
+    "NetIncomeLoss": "Net Income",
+    "EarningsPerShareBasic": "Basic EPS",
+    "EarningsPerShareDiluted": "Diluted EPS",
+}
+
+
+class FinnhubProvider(MarketDataProvider):
+    """Finnhub backend, mapped onto Yahoo's field names.
+
+    Finnhub uses the same exchange suffixes as Yahoo (``RELIANCE.NS``,
+    ``TCS.BO``), so symbols are passed through unchanged.
+    """
+
+    name = "finnhub"
+
+    def __init__(self, api_key=None):
+        self.api_key = api_key or os.getenv("FINNHUB_API_KEY")
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        with self._lock:
+            if self._client is None:
+                import finnhub
+                self._client = finnhub.Client(api_key=self.api_key)
+            return self._client
+
+    def _call(self, method, *args, **kwargs):
+        return breaker("finnhub").call(getattr(self.client, method), *args, throttle=limiter("finnhub"), **kwargs)
+
+    def price(self, symbol):
+        quote = self._call("quote", symbol)
+        ## Finnhub answers unknown symbols with an all-zero quote
+        return (quote or {}).get("c") or None
+
+    def info(self, symbol):
+        profile = self._call("company_profile2", symbol=symbol)
+        if not profile:
+            return None
+        quote = self._call("quote", symbol) or {}
+        metrics = (self._call("company_basic_financials", symbol, "all") or {}).get("metric") or {}
+
+        def percent(key):
+            value = metrics.get(key)
+            return value / 100 if value is not None else None
+
+        market_cap = profile.get("marketCapitalization")
+        return {
+            "shortName": profile.get("name"),
+            "symbol": symbol,
+            "regularMarketPrice": quote.get("c") or None,
+            "currency": profile.get("currency"),
+            "marketCap": market_cap * 1e6 if market_cap is not None else None,   # reported in millions
+            "sector": profile.get("finnhubIndustry"),
+            "industry": profile.get("finnhubIndustry"),
+            "country": profile.get("country"),
+            "exchange": profile.get("exchange"),
+            "website": profile.get("weburl"),
+            "trailingEps": metrics.get("epsBasicExclExtraItemsTTM"),
+            "trailingPE": metrics.get("peBasicExclExtraTTM"),
+            "fiftyTwoWeekLow": metrics.get("52WeekLow"),
+            "fiftyTwoWeekHigh": metrics.get("52WeekHigh"),
+            "revenueGrowth": percent("revenueGrowthTTMYoy"),
+            "grossMargins": percent("grossMarginTTM"),
+            "dividendYield": percent("dividendYieldIndicatedAnnual"),
+            "returnOnEquity": percent("roeTTM"),
+            "returnOnAssets": percent("roaTTM"),
+            "debtToEquity": metrics.get("totalDebt/totalEquityQuarterly"),
+        }
+
+    def financials(self, symbol):
+        import pandas as pd
+
+        reports = (self._call("financials_reported", symbol=symbol, freq="annual") or {}).get("data") or []
+        columns = {}
+        for report in reports:
+            rows = {}
+            for line in (report.get("report") or {}).get("ic") or []:
+                concept = str(line.get("concept", "")).split("_", 1)[-1]
+                label = FINNHUB_CONCEPTS.get(concept, line.get("label"))
+                if label and label not in rows:
+                    rows[label] = line.get("value")
+            if rows and report.get("endDate"):
+                columns[pd.Timestamp(report["endDate"]).normalize()] = rows
+        if not columns:
+            return None
+        frame = pd.DataFrame(columns)
+        return frame[sorted(frame.columns, reverse=True)]
+
+    def history(self, symbol, period="1y"):
+        import pandas as pd
+
+        end = int(time.time())
+        candles = self._call("stock_candles", symbol, "D", end - _period_days(period) * 86400, end) or {}
+        if candles.get("s") != "ok":
+            return None
+        frame = pd.DataFrame({"Open": candles["o"], "High": candles["h"], "Low": candles["l"],
+                              "Close": candles["c"], "Volume": candles["v"]},
+                             index=pd.to_datetime(candles["t"], unit="s"))
+        return _clean_bars(frame)
+
+
+def _period_days(period):
+    """Days covered by a yfinance-style period such as ``6mo``, ``1y`` or ``5y``."""
+    units = {"d": 1, "wk": 7, "mo": 31, "y": 366}
+    for suffix, days in units.items():
+        if period.endswith(suffix) and period[:-len(suffix)].isdigit():
+            return int(period[:-len(suffix)]) * days
+    raise ValueError(f"Unsupported period: {period}")
+
+
+class LatencyTracker:
+    """Rolling window of call latencies, per provider and method."""
+
+    def __init__(self, window=200):
+        self._samples = {}
+        self._window = window
+        self._lock = threading.Lock()
+
+    def add(self, key, seconds):
+        with self._lock:
+            self._samples.setdefault(key, deque(maxlen=self._window)).append(seconds)
+
+    def percentile(self, key, pct, default=None):
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return default
+        return samples[min(len(samples) - 1, int(round(pct / 100 * (len(samples) - 1))))]
+
+
+class HedgedProvider(MarketDataProvider):
+    """Ask ``primary`` first and ``secondary`` too if the primary is slow.
+
+    The hedge fires once the primary has been outstanding for its observed
+    p95 latency (``hedge_after`` until enough samples exist), or as soon as
+    the primary fails or comes back empty. The first non-empty answer wins;
+    the losing call finishes in the background and only feeds the latency
+    window.
+    """
+
+    def __init__(self, primary, secondary, hedge_after=HEDGE_AFTER, max_workers=16):
+        self.primary = primary
+        self.secondary = secondary
+        self.hedge_after = hedge_after
+        self.name = f"{primary.name}+{secondary.name}"
+        self.latency = LatencyTracker()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hedged = 0
+        self.secondary_wins = 0
+
+    def _timed(self, provider, method, *args):
+        started = time.perf_counter()
+        try:
+            return getattr(provider, method)(*args)
+        finally:
+            self.latency.add((provider.name, method), time.perf_counter() - started)
+
+    def deadline(self, method):
+        """Seconds to wait on the primary before hedging ``method`` calls."""
+        return self.latency.percentile((self.primary.name, method), 95, self.hedge_after)
+
+    def _hedged(self, method, *args):
+        with self._lock:
+            self.calls += 1
+        primary = self._executor.submit(self._timed, self.primary, method, *args)
+        done, _ = wait([primary], timeout=self.deadline(method))
+        if done and primary.exception() is None and _good(primary.result()):
+            return primary.result()
+
+        with self._lock:
+            self.hedged += 1
+        secondary = self._executor.submit(self._timed, self.secondary, method, *args)
+        pending = {primary, secondary}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None and _good(future.result()):
+                    if future is secondary:
+                        with self._lock:
+                            self.secondary_wins += 1
+                    return future.result()
+        ## Neither answered: surface the primary's error, else its empty answer
+        if primary.exception() is not None:
+            raise primary.exception()
+        return primary.result()
+
+    def info(self, symbol):
+        return self._hedged("info", symbol)
+
+    def price(self, symbol):
+        return self._hedged("price", symbol)
+
+    def financials(self, symbol):
+        return self._hedged("financials", symbol)
+
+    def history(self, symbol, period="1y"):
+        return self._hedged("history", symbol, period)
+
+    def histories(self, symbols, period="1y"):
+        return self._hedged("histories", symbols, period)
+
+    def stats(self):
+        with self._lock:
+            stats = {"calls": self.calls, "hedged": self.hedged, "secondary_wins": self.secondary_wins}
+        stats["deadlines_s"] = {method: round(self.deadline(method), 3)
+                                for method in ("info", "price", "financials", "history")}
+        return stats
+
+
+def _good(value):
+    if value is None:
+        return False
+    if isinstance(value, dict) and value and all(item is None for item in value.values()):
+        return False
+    empty = getattr(value, "empty", None)
+    return not empty if empty is not None else bool(value)
+
+
+PROVIDERS = {
+    "yahoo": YahooProvider,
+    "finnhub": FinnhubProvider,
+}
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def make_provider(name=DEFAULT_PROVIDER, hedge=HEDGE_PROVIDER):
+    """Build the provider called ``name``, hedged with ``hedge`` when given."""
+    provider = PROVIDERS[name.strip().lower()]()
+    if hedge and hedge.strip().lower() != provider.name:
+        provider = HedgedProvider(provider, PROVIDERS[hedge.strip().lower()]())
+    return provider
+
+
+def default_provider():
+    """Return the process-wide provider configured from the environment."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = make_provider()
+        return _default
+
+
+def set_default_provider(provider):
+    """Replace the process-wide provider (e.g. from a CLI flag)."""
+    global _default
+    with _default_lock:
+        _default = provider
+
+
+def provider_stats():
+    """Return the provider name and, when hedging, its hedge counters."""
+    provider = default_provider()
+    stats = {"provider": provider.name}
+    if isinstance(provider, HedgedProvider):
+        stats.update(provider.stats())
+    return stats
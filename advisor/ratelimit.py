@@ -0,0 +1,137 @@
+"""Process-wide token-bucket rate limiters, one per external provider.
+
+Calls only wait when a provider's budget is actually exhausted, instead of
+sleeping a fixed time on every call, and the buckets are shared by all
+threads and event loops so parallel runs cannot burst past the quota.
+
+Rates are ``(requests per second, burst)`` and can be overridden with
+environment variables such as ``ADVISOR_RATE_YAHOO=4,8``.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+import time
+
+DEFAULT_RATES = {
+    "yahoo": (2.0, 5),
+    "finnhub": (1.0, 30),        # free tier: 60 calls/minute
+    "adzuna": (0.4, 5),          # ~25 calls/minute
+    "duckduckgo": (1.0, 3),
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket usable from threads and asyncio code.
+
+    Each acquire reserves its tokens immediately (the balance may go
+    negative) and then waits for its turn, so waiters are served in order
+    without polling.
+    """
+
+    def __init__(self, rate, capacity=None):
+        """
+        Args:
+            rate (float): Tokens added per second.
+            capacity (float): Maximum burst size, defaults to one second of tokens.
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+
+    def _reserve(self, tokens):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.calls += 1
+            if wait:
+                self.waits += 1
+                self.wait_time += wait
+                self.max_wait = max(self.max_wait, wait)
+            return wait
+
+    def acquire(self, tokens=1):
+        """Block until ``tokens`` are available. Returns the seconds waited."""
+        wait = self._reserve(tokens)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens=1):
+        """Like ``acquire`` but yields to the event loop while waiting."""
+        wait = self._reserve(tokens)
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self):
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "burst": self.capacity,
+                "calls": self.calls,
+                "waits": self.waits,
+                "wait_s": round(self.wait_time, 3),
+                "max_wait_s": round(self.max_wait, 3),
+            }
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def _configured_rate(provider):
+    rate, burst = DEFAULT_RATES.get(provider, (1.0, 1))
+    override = os.getenv(f"ADVISOR_RATE_{provider.upper()}")
+    if override:
+        parts = override.split(",")
+        rate = float(parts[0])
+        burst = float(parts[1]) if len(parts) > 1 else max(1.0, rate)
+    return rate, burst
+
+
+def limiter(provider):
+    """Return the shared TokenBucket for ``provider``, creating it on first use."""
+    with _limiters_lock:
+        bucket = _limiters.get(provider)
+        if bucket is None:
+            bucket = _limiters[provider] = TokenBucket(*_configured_rate(provider))
+        return bucket
+
+
+def rate_limited(provider):
+    """Decorator that takes one token from ``provider``'s bucket before each call.
+
+    Works for both plain and ``async def`` functions.
+    """
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                await limiter(provider).acquire_async()
+                return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            limiter(provider).acquire()
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def limiter_stats():
+    """Return ``{provider: stats}`` for every limiter used so far."""
+    with _limiters_lock:
+        buckets = dict(_limiters)
+    return {provider: bucket.stats() for provider, bucket in buckets.items()}
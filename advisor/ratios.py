@@ -0,0 +1,192 @@
+"""Vectorized fundamental ratios from annual income statements.
+
+Statements for every symbol are stacked into one (items x symbols x periods)
+NumPy array, newest period first, so growth, CAGR, margins and coverage for
+a whole list of symbols are a handful of array operations. The agent gets a
+small precomputed table instead of raw statement JSON to read ratios from.
+"""
+
+import math
+import warnings
+
+import numpy as np
+
+## Statement rows used by the ratios, in panel order
+RATIO_ITEMS = (
+    "Total Revenue",
+    "Gross Profit",
+    "Operating Income",
+    "EBITDA",
+    "Interest Expense",
+    "Pretax Income",
+    "Tax Provision",
+    "Net Income",
+    "Diluted EPS",
+)
+MAX_PERIODS = 10
+
+## Ratio columns, in display order: (column, header, kind)
+SUMMARY_COLUMNS = (
+    ("revenue_yoy", "Rev YoY %", "pct"),
+    ("revenue_cagr", "Rev CAGR %", "pct"),
+    ("net_income_yoy", "NI YoY %", "pct"),
+    ("eps_yoy", "EPS YoY %", "pct"),
+    ("gross_margin", "Gross mgn %", "pct"),
+    ("operating_margin", "Op mgn %", "pct"),
+    ("operating_margin_change", "Op mgn chg pp", "pct"),
+    ("net_margin", "Net mgn %", "pct"),
+    ("ebitda_margin", "EBITDA mgn %", "pct"),
+    ("interest_coverage", "Int cover x", "times"),
+    ("tax_rate", "Tax rate %", "pct"),
+)
+
+
+def statement_panel(statements, items=RATIO_ITEMS, periods=MAX_PERIODS):
+    """Stack statement frames into one array.
+
+    Args:
+        statements (dict): ``{symbol: frame (items x period-end columns) or None}``.
+        items (tuple[str]): Rows to keep; missing rows are NaN.
+        periods (int): Latest periods kept per symbol.
+
+    Returns:
+        tuple: ``(symbols, period_ends, panel)`` where ``panel`` is
+        (items x symbols x periods), newest first, and ``period_ends`` is a
+        (symbols x periods) object array of period-end timestamps.
+    """
+    import pandas as pd
+
+    symbols = [symbol for symbol, frame in statements.items() if frame is not None and not frame.empty]
+    panel = np.full((len(items), len(symbols), periods), np.nan)
+    period_ends = np.full((len(symbols), periods), None, dtype=object)
+    for position, symbol in enumerate(symbols):
+        frame = statements[symbol]
+        columns = sorted(frame.columns, reverse=True)[:periods]
+        panel[:, position, :len(columns)] = frame.reindex(index=list(items), columns=columns).astype(float).to_numpy()
+        period_ends[position, :len(columns)] = [pd.Timestamp(column) for column in columns]
+    return symbols, period_ends, panel
+
+
+def growth(current, previous):
+    """Relative change that keeps its sign when ``previous`` is negative."""
+    return (current - previous) / np.abs(previous)
+
+
+def _years_between(period_ends, newest, oldest):
+    rows = np.arange(period_ends.shape[0])
+    return np.array([(period_ends[row, new] - period_ends[row, old]).days / 365.25
+                     if period_ends[row, old] is not None else np.nan
+                     for row, new, old in zip(rows, newest, oldest)])
+
+
+def compute_ratios(statements, periods=MAX_PERIODS):
+    """Compute the latest ratios for every symbol with a stored income statement.
+
+    Args:
+        statements (dict): ``{symbol: frame or None}``, frames shaped like ``Ticker.financials``.
+        periods (int): Latest periods considered for the CAGR.
+
+    Returns:
+        DataFrame: One row per symbol with the latest fiscal year, years covered,
+        YoY revenue/net income/EPS growth, revenue CAGR, gross/operating/net/EBITDA
+        margins, operating-margin change, interest coverage and tax rate.
+        Growth, margins and rates are fractions.
+    """
+    import pandas as pd
+
+    symbols, period_ends, panel = statement_panel(statements, periods=periods)
+    if not symbols:
+        return pd.DataFrame()
+    ## Missing rows and too-short histories come out NaN
+    with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+        warnings.simplefilter("ignore", RuntimeWarning)
+        table = pd.DataFrame(_ratio_columns(period_ends, panel), index=symbols)
+    return table
+
+
+def _ratio_columns(period_ends, panel):
+    revenue, gross, operating, ebitda, interest, pretax, tax, net, eps = panel
+    margins = operating / revenue
+
+    ## CAGR runs from the oldest period with positive revenue to the newest
+    positive = np.isfinite(revenue) & (revenue > 0)
+    oldest = revenue.shape[1] - 1 - np.argmax(positive[:, ::-1], axis=1)
+    first = revenue[np.arange(revenue.shape[0]), oldest]
+    years = _years_between(period_ends, np.zeros(len(oldest), dtype=int), oldest)
+    cagr = np.where((years >= 1) & positive[:, 0], (revenue[:, 0] / first) ** (1 / years) - 1, np.nan)
+
+    return {
+        "fiscal_year_end": [ends[0].strftime("%Y-%m") if ends[0] is not None else None for ends in period_ends],
+        "years": np.isfinite(revenue).sum(axis=1),
+        "revenue_yoy": growth(revenue[:, 0], revenue[:, 1]),
+        "revenue_cagr": cagr,
+        "net_income_yoy": growth(net[:, 0], net[:, 1]),
+        "eps_yoy": growth(eps[:, 0], eps[:, 1]),
+        "gross_margin": gross[:, 0] / revenue[:, 0],
+        "operating_margin": margins[:, 0],
+        "operating_margin_change": margins[:, 0] - margins[:, 1],
+        "net_margin": net[:, 0] / revenue[:, 0],
+        "ebitda_margin": ebitda[:, 0] / revenue[:, 0],
+        ## Providers report interest expense with either sign
+        "interest_coverage": np.where(np.abs(interest[:, 0]) > 0, operating[:, 0] / np.abs(interest[:, 0]), np.nan),
+        "tax_rate": np.where(pretax[:, 0] > 0, tax[:, 0] / pretax[:, 0], np.nan),
+    }
+
+
+def ratio_trend(frame, periods=5):
+    """Per-year revenue growth, margins and coverage for one statement, newest first."""
+    import pandas as pd
+
+    symbols, period_ends, panel = statement_panel({"_": frame}, periods=periods + 1)
+    if not symbols:
+        return pd.DataFrame()
+    revenue, gross, operating, ebitda, interest, pretax, tax, net, eps = panel[:, 0, :]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        trend = pd.DataFrame({
+            "revenue_yoy": np.append(growth(revenue[:-1], revenue[1:]), np.nan),
+            "operating_margin": operating / revenue,
+            "net_margin": net / revenue,
+            "interest_coverage": np.where(np.abs(interest) > 0, operating / np.abs(interest), np.nan),
+        }, index=[end.strftime("%Y-%m") if end is not None else None for end in period_ends[0]])
+    return trend[trend.index.notna()].head(periods)
+
+
+def _format(value, kind):
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return "-"
+    if kind == "pct":
+        return f"{value * 100:.1f}"
+    if kind == "times":
+        return f"{value:.1f}"
+    return str(value)
+
+
+def ratio_summary(statements):
+    """Render ratios for ``statements`` as a compact text table, one row per symbol.
+
+    A single symbol also gets its year-by-year trend.
+    """
+    table = compute_ratios(statements)
+    missing = [symbol for symbol, frame in statements.items() if frame is None or frame.empty]
+    if table.empty:
+        return f"No income statements found for {', '.join(missing)}"
+    lines = [
+        "Financial ratios from annual income statements (growth, margins and tax rate in %, "
+        "margin change in percentage points, interest coverage in x)",
+        " | ".join(["Symbol", "FY end", "Years"] + [header for _, header, _ in SUMMARY_COLUMNS]),
+    ]
+    for symbol, row in table.iterrows():
+        values = [_format(row[column], kind) for column, _, kind in SUMMARY_COLUMNS]
+        lines.append(" | ".join([symbol, str(row["fiscal_year_end"]), str(int(row["years"]))] + values))
+    if len(table) == 1:
+        trend = ratio_trend(statements[table.index[0]])
+        lines += ["", "Trend by fiscal year (newest first)",
+                  "FY end | Rev YoY % | Op mgn % | Net mgn % | Int cover x"]
+        for period, row in trend.iterrows():
+            lines.append(" | ".join([period, _format(row["revenue_yoy"], "pct"),
+                                     _format(row["operating_margin"], "pct"),
+                                     _format(row["net_margin"], "pct"),
+                                     _format(row["interest_coverage"], "times")]))
+    if missing:
+        lines.append(f"No income statements: {', '.join(missing)}")
+    return "\n".join(lines)
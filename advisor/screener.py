@@ -0,0 +1,200 @@
+"""Vectorized stock screener run before any agent.
+
+Quote snapshots for the whole universe (thousands of symbols, one request
+per 50) are loaded into a columnar frame, numeric filters become boolean
+masks over whole columns, and the survivors are ranked by their average
+percentile across the ranking columns. Profile fields (margins, returns,
+growth, leverage) cost one request per symbol, so they are only fetched
+for the symbols that passed the quote filters, and for at most
+``MAX_PROFILES`` of them (the largest by market cap). Only the top-N
+shortlist is handed to the crew, so LLM spend scales with the shortlist,
+not the universe:
+
+    python 3_investment_advisor.py --universe NSE --screen pe=5:25 --screen pos52=:0.4 \\
+        --screen op_margin=0.15: --rank pe --rank roe:desc --top 10
+
+Filters are ``field=min:max`` with either bound optional; margins, returns
+and growth are fractions (0.15 = 15%). ``pos52`` is the price position
+between the 52-week low (0) and high (1).
+"""
+
+import os
+
+import numpy as np
+
+from advisor import symbols
+from advisor.bulk import bulk_quotes, bulk_profiles
+from advisor.compact import as_float
+
+## Short filter names for the numeric snapshot columns
+FIELD_ALIASES = {
+    "price": "regularMarketPrice",
+    "change": "regularMarketChangePercent",
+    "mcap": "marketCap",
+    "pe": "trailingPE",
+    "fpe": "forwardPE",
+    "pb": "priceToBook",
+    "yield": "dividendYield",
+    "volume": "averageVolume",
+    "pos52": "week52_position",
+    "vs_sma50": "vs_fifty_day",
+    "vs_sma200": "vs_two_hundred_day",
+    "ev_ebitda": "enterpriseToEbitda",
+    "gross_margin": "grossMargins",
+    "op_margin": "operatingMargins",
+    "net_margin": "profitMargins",
+    "roe": "returnOnEquity",
+    "rev_growth": "revenueGrowth",
+    "eps_growth": "earningsGrowth",
+    "de": "debtToEquity",
+}
+
+QUOTE_COLUMNS = ("regularMarketPrice", "regularMarketChangePercent", "marketCap", "trailingPE", "forwardPE",
+                 "priceToBook", "dividendYield", "averageVolume", "fiftyTwoWeekLow", "fiftyTwoWeekHigh",
+                 "fiftyDayAverage", "twoHundredDayAverage")
+DERIVED_COLUMNS = ("week52_position", "vs_fifty_day", "vs_two_hundred_day")
+## Only in full profiles: fetched per symbol, after the quote filters
+PROFILE_COLUMNS = ("enterpriseToEbitda", "grossMargins", "operatingMargins", "profitMargins",
+                   "returnOnEquity", "revenueGrowth", "earningsGrowth", "debtToEquity")
+DEFAULT_TOP = 10
+## Most profiles fetched per screen; larger quote-filter survivors keep the largest by market cap
+MAX_PROFILES = int(os.getenv("ADVISOR_SCREEN_MAX_PROFILES", "100"))
+
+
+def field_name(name):
+    """Map a filter alias (``pe``) or a snapshot column (``trailingPE``) to its column."""
+    column = FIELD_ALIASES.get(name.strip().lower(), name.strip())
+    if column not in QUOTE_COLUMNS + DERIVED_COLUMNS + PROFILE_COLUMNS:
+        raise ValueError(f"Unknown screen field {name!r}; use one of {', '.join(sorted(FIELD_ALIASES))}")
+    return column
+
+
+def parse_filter(spec):
+    """Parse ``field=min:max`` (either bound optional) into ``(column, low, high)``.
+
+    A single value (``pe=15``) is an exact match.
+    """
+    name, sep, bounds = spec.partition("=")
+    if not sep:
+        raise ValueError(f"Screen filter {spec!r} is not field=min:max")
+    low, colon, high = bounds.partition(":")
+    low = float(low) if low.strip() else -np.inf
+    high = (float(high) if high.strip() else np.inf) if colon else low
+    return field_name(name), low, high
+
+
+def parse_rank(spec):
+    """Parse ``field`` (lower is better) or ``field:desc`` (higher is better) into ``(column, descending)``."""
+    name, _, order = spec.partition(":")
+    if order and order.lower() not in ("asc", "desc"):
+        raise ValueError(f"Rank order in {spec!r} must be asc or desc")
+    return field_name(name), order.lower() == "desc"
+
+
+def universe(exchange):
+    """Yahoo symbols of every listing on ``exchange`` in the local symbol index."""
+    return [entry[3] for entry in symbols.default_index().listings if entry[2] == exchange]
+
+
+def snapshot_frame(symbols_list):
+    """Load quote snapshots for ``symbols_list`` into a columnar frame (one row per Yahoo symbol).
+
+    Returns:
+        tuple: ``(frame, failed)``; missing values are NaN and ``failed`` maps symbols to reasons.
+    """
+    import pandas as pd
+
+    result = bulk_quotes(symbols_list)
+    quotes = result["quotes"]
+    frame = pd.DataFrame({column: np.array([as_float(quote.get(column)) for quote in quotes.values()])
+                          for column in QUOTE_COLUMNS}, index=list(quotes))
+    price, low, high = (frame[c].to_numpy() for c in ("regularMarketPrice", "fiftyTwoWeekLow", "fiftyTwoWeekHigh"))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        frame["week52_position"] = np.where(high > low, (price - low) / (high - low), np.nan)
+        frame["vs_fifty_day"] = price / frame["fiftyDayAverage"].to_numpy() - 1
+        frame["vs_two_hundred_day"] = price / frame["twoHundredDayAverage"].to_numpy() - 1
+    return frame, result["failed"]
+
+
+def add_profiles(frame, columns=PROFILE_COLUMNS):
+    """Add profile ``columns`` to ``frame`` from full profiles (one request per row)."""
+    profiles = bulk_profiles(list(frame.index))["profiles"] if len(frame) else {}
+    for column in columns:
+        frame[column] = np.array([as_float((profiles.get(symbol) or {}).get(column)) for symbol in frame.index])
+    return frame
+
+
+def apply_filters(frame, filters):
+    """Keep the rows inside every ``(column, low, high)`` band; a missing value fails its filter."""
+    mask = np.ones(len(frame), dtype=bool)
+    for column, low, high in filters:
+        values = frame[column].to_numpy(dtype=float)
+        mask &= (values >= low) & (values <= high)
+    return frame[mask].copy()
+
+
+def rank(frame, ranks):
+    """Score rows by their average percentile over ``ranks`` and sort best first.
+
+    Args:
+        frame (DataFrame): Snapshot rows.
+        ranks (list[tuple]): ``(column, descending)``; a missing value ranks last.
+
+    Returns:
+        DataFrame: ``frame`` with a ``score`` column (0-1, lower is better).
+    """
+    if not ranks or frame.empty:
+        return frame.assign(score=np.nan)
+    percentiles = np.column_stack([
+        frame[column].rank(pct=True, ascending=not descending, na_option="bottom").to_numpy()
+        for column, descending in ranks
+    ])
+    return frame.assign(score=percentiles.mean(axis=1)).sort_values("score", kind="stable")
+
+
+def screen(symbols_list, filters=(), ranks=(), top=DEFAULT_TOP, max_profiles=MAX_PROFILES):
+    """Screen ``symbols_list`` and return the shortlist.
+
+    Quote filters run first over the whole universe; profile fields are fetched
+    only for the survivors (at most ``max_profiles``, the largest by market
+    cap), and then filtered and ranked.
+
+    Args:
+        symbols_list (list[str]): Universe of tickers or company names.
+        filters (list[str]): ``field=min:max`` specs.
+        ranks (list[str]): ``field`` or ``field:desc`` specs.
+        top (int): Shortlist size.
+        max_profiles (int): Most symbols whose full profile is fetched.
+
+    Returns:
+        dict: ``shortlist`` (Yahoo symbols, best first), ``frame`` (their price,
+        filtered and ranked columns and ``score``), ``failed`` (symbol -> reason)
+        and ``stats`` (row counts per stage).
+    """
+    filters = [parse_filter(spec) for spec in filters]
+    ranks = [parse_rank(spec) for spec in ranks]
+    frame, failed = snapshot_frame(symbols_list)
+    stats = {"universe": len(set(symbols_list)), "quoted": len(frame)}
+
+    frame = apply_filters(frame, [f for f in filters if f[0] not in PROFILE_COLUMNS])
+    stats["after_quote_filters"] = len(frame)
+    profile_columns = {column for column, *_ in filters + ranks if column in PROFILE_COLUMNS}
+    if profile_columns:
+        if len(frame) > max_profiles:
+            frame = frame.sort_values("marketCap", ascending=False, kind="stable").head(max_profiles)
+            stats["largest_profiled"] = len(frame)
+        frame = apply_filters(add_profiles(frame, sorted(profile_columns)),
+                              [f for f in filters if f[0] in PROFILE_COLUMNS])
+        stats["after_profile_filters"] = len(frame)
+
+    frame = rank(frame, ranks).head(top)
+    stats["shortlist"] = len(frame)
+    columns = dict.fromkeys(["regularMarketPrice"] + [column for column, *_ in filters + ranks] + ["score"])
+    return {"shortlist": list(frame.index), "frame": frame[list(columns)], "failed": failed, "stats": stats}
+
+
+def print_screen(result):
+    """Print the screening funnel and the shortlist with its filter and rank columns."""
+    print("Screen:", " -> ".join(f"{stage.replace('_', ' ')} {count}" for stage, count in result["stats"].items()))
+    if not result["frame"].empty:
+        print(result["frame"].round(3).to_string())
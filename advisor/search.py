@@ -0,0 +1,85 @@
+"""Cached, coalesced DuckDuckGo search with snippet de-duplication.
+
+One search client is reused for every call, results are cached by
+normalized query text, concurrent identical queries share a single request,
+and near-identical snippets (syndicated copies of the same story) are
+dropped before they reach the agent's context.
+"""
+
+import re
+import threading
+
+from advisor.cache import TTLCache
+from advisor.coalesce import SingleFlight
+from advisor.ratelimit import limiter
+from advisor.breaker import breaker
+
+SEARCH_TTL = 30 * 60
+MAX_RESULTS = 8
+## Word-shingle Jaccard similarity above which two snippets count as duplicates
+DUPLICATE_SIMILARITY = 0.7
+
+search_cache = TTLCache(maxsize=1024, default_ttl=SEARCH_TTL)
+_flights = SingleFlight()
+_client = None
+_client_lock = threading.Lock()
+
+
+def _get_client():
+    global _client
+    with _client_lock:
+        if _client is None:
+            from langchain_community.utilities import DuckDuckGoSearchAPIWrapper
+            _client = DuckDuckGoSearchAPIWrapper(max_results=MAX_RESULTS)
+        return _client
+
+
+def normalize_query(query):
+    """Lower-case ``query``, drop punctuation and collapse whitespace."""
+    return " ".join(re.sub(r"[^\w\s.&-]", " ", query.lower()).split())
+
+
+def _shingles(text, size=3):
+    words = re.sub(r"[^\w\s]", " ", text.lower()).split()
+    if len(words) < size:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def dedupe_results(results, threshold=DUPLICATE_SIMILARITY):
+    """Drop results whose snippet is a near-duplicate of an earlier one."""
+    kept, kept_shingles = [], []
+    for result in results:
+        shingles = _shingles(result.get("snippet", ""))
+        if any(len(shingles & other) / len(shingles | other) >= threshold for other in kept_shingles):
+            continue
+        kept.append(result)
+        kept_shingles.append(shingles)
+    return kept
+
+
+def _search(query):
+    results = breaker("duckduckgo").call(_get_client().results, query, MAX_RESULTS, throttle=limiter("duckduckgo"))
+    return dedupe_results(results)
+
+
+def search_results(query):
+    """Return de-duplicated result dicts (title, snippet, link) for ``query``."""
+    key = normalize_query(query)
+    results = search_cache.get(key)
+    if results is None:
+        results = _flights.do(key, _search, query)
+        search_cache.set(key, results)
+    return results
+
+
+def search(query):
+    """Return search results for ``query`` as compact text, one result per line."""
+    results = search_results(query)
+    if not results:
+        return f"No results found for {query}"
+    return "\n".join(f"- {r.get('title', '').strip()}: {r.get('snippet', '').strip()}" for r in results)
+
+
+def search_stats():
+    return {"cache": search_cache.stats(), "coalescing": _flights.stats()}
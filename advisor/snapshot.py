@@ -0,0 +1,142 @@
+"""Typed, compact company profile snapshot.
+
+``CompanySnapshot`` keeps the profile fields the agents use: text fields in
+``__slots__`` and every numeric field as a float in one ``array('d')``
+(NaN when missing), instead of a dict of mixed strings such as
+"2450.1 INR". It serializes to a couple of hundred bytes for the cache
+(``to_bytes``/``from_bytes``) and is only turned into LLM-facing text at
+the edge by ``render``.
+"""
+
+import math
+import struct
+from array import array
+
+from advisor.compact import UNITS, as_float, is_indian_symbol, pick_unit
+
+TEXT_FIELDS = ("symbol", "name", "currency", "sector", "industry", "city", "country")
+## (attribute, ``Ticker.info`` keys in order of preference, label, kind)
+NUMERIC_FIELDS = (
+    ("price", ("regularMarketPrice", "currentPrice"), "Current stock price", "quote"),
+    ("market_cap", ("marketCap", "enterpriseValue"), "Market cap", "money"),
+    ("eps", ("trailingEps",), "EPS", "price"),
+    ("pe", ("trailingPE",), "P/E", "ratio"),
+    ("low_52w", ("fiftyTwoWeekLow",), "52-week low", "price"),
+    ("high_52w", ("fiftyTwoWeekHigh",), "52-week high", "price"),
+    ("avg_50d", ("fiftyDayAverage",), "50-day average", "price"),
+    ("avg_200d", ("twoHundredDayAverage",), "200-day average", "price"),
+    ("employees", ("fullTimeEmployees",), "Employees", "count"),
+    ("total_cash", ("totalCash",), "Total cash", "money"),
+    ("free_cashflow", ("freeCashflow",), "Free cash flow", "money"),
+    ("operating_cashflow", ("operatingCashflow",), "Operating cash flow", "money"),
+    ("ebitda", ("ebitda",), "EBITDA", "money"),
+    ("revenue_growth", ("revenueGrowth",), "Revenue growth", "pct"),
+    ("gross_margins", ("grossMargins",), "Gross margin", "pct"),
+    ("ebitda_margins", ("ebitdaMargins",), "EBITDA margin", "pct"),
+)
+NUMERIC_NAMES = tuple(field[0] for field in NUMERIC_FIELDS)
+
+## Binary layout: version, text length, "\x1f"-joined UTF-8 text fields, float64 values
+_VERSION = 1
+_HEADER = struct.Struct("<BH")
+_VALUES = struct.Struct(f"<{len(NUMERIC_FIELDS)}d")
+_SEPARATOR = "\x1f"
+
+
+class CompanySnapshot:
+    """Company profile with numeric fields kept as floats (NaN when missing).
+
+    Numeric fields are read as attributes (``snapshot.pe``, ``snapshot.market_cap``)
+    and are backed by one ``array('d')`` in ``NUMERIC_FIELDS`` order.
+    """
+
+    __slots__ = TEXT_FIELDS + ("values",)
+
+    def __init__(self, values=None, **text):
+        """
+        Args:
+            values: Floats in ``NUMERIC_FIELDS`` order; all NaN when None.
+            **text: Text fields from ``TEXT_FIELDS``; missing ones are None.
+        """
+        for name in TEXT_FIELDS:
+            setattr(self, name, text.pop(name, None) or None)
+        if text:
+            raise TypeError(f"Unknown snapshot fields: {', '.join(text)}")
+        self.values = array("d", values if values is not None else [math.nan] * len(NUMERIC_FIELDS))
+
+    @classmethod
+    def from_info(cls, info):
+        """Build a snapshot from a ``Ticker.info``-shaped dict."""
+        values = []
+        for _, keys, _, _ in NUMERIC_FIELDS:
+            value = next((info[key] for key in keys if info.get(key) is not None), None)
+            values.append(as_float(value))
+        return cls(values, symbol=info.get("symbol"), name=info.get("shortName") or info.get("longName"),
+                   currency=info.get("currency"), sector=info.get("sector"), industry=info.get("industry"),
+                   city=info.get("city"), country=info.get("country"))
+
+    def to_bytes(self):
+        """Serialize to a compact binary record."""
+        text = _SEPARATOR.join(getattr(self, name) or "" for name in TEXT_FIELDS).encode("utf-8")
+        return _HEADER.pack(_VERSION, len(text)) + text + _VALUES.pack(*self.values)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Rebuild a snapshot from ``to_bytes`` output."""
+        version, length = _HEADER.unpack_from(data)
+        if version != _VERSION:
+            raise ValueError(f"Unsupported snapshot version {version}")
+        text = bytes(data[_HEADER.size:_HEADER.size + length]).decode("utf-8").split(_SEPARATOR)
+        values = _VALUES.unpack_from(data, _HEADER.size + length)
+        return cls(values, **dict(zip(TEXT_FIELDS, text)))
+
+    def to_dict(self):
+        """Plain dict of every field, numeric ones as floats."""
+        fields = {name: getattr(self, name) for name in TEXT_FIELDS}
+        fields.update(zip(NUMERIC_NAMES, self.values))
+        return fields
+
+    def __eq__(self, other):
+        if not isinstance(other, CompanySnapshot):
+            return NotImplemented
+        return self.to_bytes() == other.to_bytes()
+
+    def __repr__(self):
+        return f"CompanySnapshot({self.symbol!r}, price={self.price}, market_cap={self.market_cap})"
+
+    def render(self):
+        """LLM-facing text: one ``label: value`` line per known field, money in Cr for Indian stocks."""
+        indian = is_indian_symbol(self.symbol or "")
+        currency = f" {self.currency}" if self.currency else ""
+        unit = pick_unit([value for (_, _, _, kind), value in zip(NUMERIC_FIELDS, self.values) if kind == "money"],
+                         indian=indian)
+        place = ", ".join(part for part in (self.city, self.country) if part)
+        lines = [f"{self.name or self.symbol} ({self.symbol})" + (f", {place}" if place else "")]
+        if self.sector or self.industry:
+            lines.append(f"Sector / industry: {self.sector or '-'} / {self.industry or '-'}")
+        for (_, _, label, kind), value in zip(NUMERIC_FIELDS, self.values):
+            if math.isnan(value):
+                continue
+            if kind == "money":
+                text = f"{value / UNITS[unit]:.1f} {unit}{currency}"
+            elif kind == "pct":
+                text = f"{value * 100:.1f}%"
+            elif kind == "count":
+                text = f"{value:.0f}"
+            elif kind == "quote":
+                text = f"{value:.2f}{currency}"
+            elif kind == "price":
+                text = f"{value:.2f}"
+            else:
+                text = f"{value:.1f}"
+            lines.append(f"{label}: {text}")
+        return "\n".join(lines)
+
+
+def _numeric_property(position):
+    return property(lambda self: self.values[position], doc=NUMERIC_FIELDS[position][2])
+
+
+for _position, _name in enumerate(NUMERIC_NAMES):
+    setattr(CompanySnapshot, _name, _numeric_property(_position))
+
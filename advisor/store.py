@@ -0,0 +1,170 @@
+"""Persistent SQLite store for company fundamentals.
+
+Statements are stored one row per (symbol, statement, period). A statement is
+only re-fetched from the provider once a newer period could have been
+published, and only periods newer than the stored ones are written, so
+repeated runs over a watchlist hit the network for fundamentals only a few
+times a year.
+"""
+
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+
+from advisor.breaker import ProviderUnavailable
+
+DEFAULT_DB_PATH = os.getenv("ADVISOR_DB", "advisor_data.sqlite3")
+
+## Days after a period end before the next statement is expected to be published
+REPORTING_LAG = {"annual": 90, "quarterly": 45}
+PERIOD_LENGTH = {"annual": 365, "quarterly": 91}
+## How often to re-check the provider once a new period is due but not yet published
+RECHECK_INTERVAL = 24 * 60 * 60
+
+
+class FundamentalsStore:
+    """SQLite-backed store of financial statements keyed by (symbol, statement, period)."""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        """
+        Args:
+            path (str): SQLite database file, or ":memory:".
+        """
+        self.path = path
+        self.network_fetches = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS statements ("
+                " symbol TEXT, statement TEXT, period TEXT, data TEXT,"
+                " PRIMARY KEY (symbol, statement, period))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS refresh_log ("
+                " symbol TEXT, statement TEXT, checked_at REAL,"
+                " PRIMARY KEY (symbol, statement))"
+            )
+
+    def periods(self, symbol, statement):
+        """Return ``{period (ISO date): {line item: value}}`` for stored periods, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT period, data FROM statements WHERE symbol = ? AND statement = ? ORDER BY period DESC",
+                (symbol, statement),
+            ).fetchall()
+        return {period: json.loads(data) for period, data in rows}
+
+    def load(self, symbol, statement):
+        """Return the stored statement as a frame shaped like ``Ticker.financials``, or None."""
+        import pandas as pd
+
+        periods = self.periods(symbol, statement)
+        if not periods:
+            return None
+        frame = pd.DataFrame(periods)
+        frame.columns = pd.to_datetime(frame.columns)
+        return frame
+
+    def last_checked(self, symbol, statement):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT checked_at FROM refresh_log WHERE symbol = ? AND statement = ?",
+                (symbol, statement),
+            ).fetchone()
+        return row[0] if row else None
+
+    def save(self, symbol, statement, frame, only_newer_than=None):
+        """Write the periods (columns) of ``frame`` newer than ``only_newer_than``.
+
+        Returns:
+            int: Number of periods written.
+        """
+        import pandas as pd
+
+        rows = []
+        for column in frame.columns:
+            period = pd.Timestamp(column).date().isoformat()
+            if only_newer_than is not None and period <= only_newer_than:
+                continue
+            items = {
+                str(item): (None if value is None or (isinstance(value, float) and math.isnan(value)) else float(value))
+                for item, value in frame[column].items()
+            }
+            rows.append((symbol, statement, period, json.dumps(items)))
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO statements VALUES (?, ?, ?, ?)", rows)
+            self._mark_checked(symbol, statement)
+        return len(rows)
+
+    def _mark_checked(self, symbol, statement):
+        self._conn.execute("INSERT OR REPLACE INTO refresh_log VALUES (?, ?, ?)", (symbol, statement, time.time()))
+
+    def is_due(self, symbol, statement, frequency="annual"):
+        """True if a period newer than the latest stored one may have been published."""
+        periods = self.periods(symbol, statement)
+        if not periods:
+            ## Symbols without statements (ETFs, unknown tickers) are re-checked once per interval
+            checked_at = self.last_checked(symbol, statement)
+            return checked_at is None or time.time() - checked_at > RECHECK_INTERVAL
+        latest = date.fromisoformat(next(iter(periods)))
+        expected = latest + timedelta(days=PERIOD_LENGTH[frequency] + REPORTING_LAG[frequency])
+        if date.today() < expected:
+            return False
+        checked_at = self.last_checked(symbol, statement)
+        return checked_at is None or time.time() - checked_at > RECHECK_INTERVAL
+
+    def get_statement(self, symbol, statement, fetch, frequency="annual"):
+        """Return the statement frame, calling ``fetch()`` only when a newer period is due.
+
+        Args:
+            symbol (str): The stock symbol.
+            statement (str): Statement name, e.g. "income".
+            fetch (callable): Returns the provider frame (items x periods) or None.
+            frequency (str): "annual" or "quarterly".
+        """
+        if not self.is_due(symbol, statement, frequency):
+            return self.load(symbol, statement)
+        stored = self.periods(symbol, statement)
+        latest = next(iter(stored), None)
+        self.network_fetches += 1
+        try:
+            frame = fetch()
+        except ProviderUnavailable:
+            ## Serve the stored periods while the provider is down
+            if latest is None:
+                raise
+            return self.load(symbol, statement)
+        if frame is None or frame.empty:
+            with self._lock, self._conn:
+                self._mark_checked(symbol, statement)
+            return self.load(symbol, statement)
+        self.save(symbol, statement, frame, only_newer_than=latest)
+        return self.load(symbol, statement)
+
+    def clear(self):
+        """Delete every stored statement and refresh record."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM statements")
+            self._conn.execute("DELETE FROM refresh_log")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def default_store():
+    """Return the process-wide store at ``DEFAULT_DB_PATH``, opening it on first use."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = FundamentalsStore()
+        return _default_store
@@ -0,0 +1,310 @@
+"""Exchange symbol resolver backed by a locally built listing index.
+
+The index holds (ticker, company name, exchange) for NSE, BSE and US listings
+and resolves a ticker or a company name ("RELIANCE", "Reliance Industries")
+to its Yahoo symbol ("RELIANCE.NS") without any network call, so agents no
+longer try symbols with and without ".NS".
+
+Listings can also carry their Yahoo industry, which the peer comparison
+uses to find companies in the same industry. Industries are learnt from
+every profile fetched, and can be filled in for a whole exchange up front.
+
+Build or refresh the index with:
+
+    python -m advisor.symbols build [--bse list_of_scrips.csv]
+    python -m advisor.symbols classify --exchange NSE
+    python -m advisor.symbols lookup "Reliance Industries"
+"""
+
+import argparse
+import csv
+import difflib
+import io
+import json
+import os
+import re
+import threading
+from functools import lru_cache
+
+DEFAULT_INDEX_PATH = os.getenv("ADVISOR_SYMBOL_INDEX", "symbol_index.json")
+
+## Preferred exchange when a ticker or name is listed on several exchanges
+EXCHANGE_PREFERENCE = tuple(os.getenv("ADVISOR_EXCHANGE_PREFERENCE", "NSE,BSE,US").split(","))
+YAHOO_SUFFIX = {"NSE": ".NS", "BSE": ".BO", "US": ""}
+## An upper-case single token such as "HDFC" or "M&M" is taken as a ticker, never fuzzy-matched
+TICKER_SHAPE = re.compile(r"^[A-Z0-9][A-Z0-9&.\-^]{0,19}$")
+
+NSE_URL = "https://archives.nseindia.com/content/equities/EQUITY_L.csv"
+NASDAQ_URLS = (
+    "https://www.nasdaqtrader.com/dynamic/SymDir/nasdaqlisted.txt",
+    "https://www.nasdaqtrader.com/dynamic/SymDir/otherlisted.txt",
+)
+
+_NAME_NOISE = {"the", "ltd", "limited", "inc", "incorporated", "corp", "corporation", "co",
+               "company", "plc", "class", "common", "stock", "shares", "ordinary", "equity"}
+
+
+def normalize_name(name):
+    """Lower-case ``name`` and drop punctuation and legal suffixes like "Ltd" or "Inc"."""
+    tokens = re.sub(r"[^a-z0-9 ]", " ", name.lower().replace("&", " and ")).split()
+    return " ".join(token for token in tokens if token not in _NAME_NOISE)
+
+
+def yahoo_symbol(ticker, exchange):
+    if exchange == "US":
+        return ticker.replace(".", "-")
+    return ticker + YAHOO_SUFFIX[exchange]
+
+
+class SymbolIndex:
+    """In-memory listing index with exact ticker, exact name and fuzzy name lookup."""
+
+    def __init__(self, listings=()):
+        """
+        Args:
+            listings: Iterable of ``(ticker, name, exchange[, industry])`` tuples.
+        """
+        self.listings = []
+        self.industries = {}
+        self._by_ticker = {}
+        self._by_name = {}
+        self._by_token = {}
+        self._by_industry = {}
+        self._lock = threading.Lock()
+        for listing in listings:
+            self.add(*listing)
+
+    def add(self, ticker, name, exchange, industry=None):
+        entry = (ticker.upper(), name, exchange, yahoo_symbol(ticker.upper(), exchange))
+        self.listings.append(entry)
+        normalized = normalize_name(name)
+        for key, table in ((entry[0], self._by_ticker), (entry[3], self._by_ticker), (normalized, self._by_name)):
+            if key:
+                table.setdefault(key, []).append(entry)
+        for token in set(normalized.split()):
+            self._by_token.setdefault(token, []).append(entry)
+        if industry:
+            self.set_industry(entry[3], industry)
+
+    def set_industry(self, symbol, industry):
+        """Record the industry of the listing whose Yahoo symbol is ``symbol``; False if not indexed."""
+        entries = [entry for entry in self._by_ticker.get(symbol, ()) if entry[3] == symbol]
+        if not entries or not industry:
+            return False
+        with self._lock:
+            previous = self.industries.get(symbol)
+            if previous == industry:
+                return True
+            if previous:
+                self._by_industry[previous] = [e for e in self._by_industry[previous] if e[3] != symbol]
+            self.industries[symbol] = industry
+            self._by_industry.setdefault(industry, []).append(entries[0])
+        return True
+
+    def in_industry(self, industry, exchanges=None):
+        """Return the listings in ``industry``, one per company, on the preferred exchange.
+
+        Args:
+            industry (str): Yahoo industry name.
+            exchanges (tuple[str]): Only keep these exchanges, e.g. ``("NSE", "BSE")``.
+        """
+        with self._lock:
+            entries = list(self._by_industry.get(industry, ()))
+        companies = {}
+        for entry in entries:
+            if exchanges and entry[2] not in exchanges:
+                continue
+            companies.setdefault(normalize_name(entry[1]), []).append(entry)
+        return [self._preferred(listed) for listed in companies.values()]
+
+    @staticmethod
+    def _preferred(entries):
+        rank = {exchange: i for i, exchange in enumerate(EXCHANGE_PREFERENCE)}
+        return min(entries, key=lambda entry: rank.get(entry[2], len(rank)))
+
+    def lookup(self, query, cutoff=0.6):
+        """Return the best ``(ticker, name, exchange, yahoo_symbol)`` for ``query``, or None."""
+        query = query.strip()
+        if not query:
+            return None
+        entries = self._by_ticker.get(query.upper())
+        if entries:
+            return self._preferred(entries)
+        normalized = normalize_name(query)
+        entries = self._by_name.get(normalized)
+        if entries:
+            return self._preferred(entries)
+        ## An unknown ticker must not resolve to a similarly named company (HDFC -> HDFCBANK);
+        ## the caller probes it with exchange suffixes instead
+        if TICKER_SHAPE.match(query):
+            return None
+        ## Any other single word ("Hdfc", "Infosys") only resolves to the one company
+        ## whose name starts with it, never to a fuzzy match
+        if len(normalized.split()) == 1:
+            return self._single_company(normalized)
+        return self._fuzzy(normalized, cutoff)
+
+    def _single_company(self, token):
+        companies = {}
+        for entry in self._by_token.get(token, ()):
+            name = normalize_name(entry[1])
+            if name.split()[0] == token:
+                companies.setdefault(name, []).append(entry)
+        return self._preferred(next(iter(companies.values()))) if len(companies) == 1 else None
+
+    def _fuzzy(self, normalized, cutoff):
+        candidates = {}
+        for token in normalized.split():
+            for entry in self._by_token.get(token, ()):
+                candidates[entry] = None
+        best, best_score = [], cutoff
+        matcher = difflib.SequenceMatcher(b=normalized, autojunk=False)
+        for entry in candidates:
+            matcher.set_seq1(normalize_name(entry[1]))
+            score = matcher.ratio()
+            if score > best_score:
+                best, best_score = [entry], score
+            elif score == best_score:
+                best.append(entry)
+        return self._preferred(best) if best else None
+
+    def save(self, path=DEFAULT_INDEX_PATH):
+        with self._lock:
+            rows = [list(entry[:3]) + ([self.industries[entry[3]]] if entry[3] in self.industries else [])
+                    for entry in self.listings]
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(rows, file, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path=DEFAULT_INDEX_PATH):
+        with open(path, encoding="utf-8") as file:
+            return cls(json.load(file))
+
+    def __len__(self):
+        return len(self.listings)
+
+
+## Listing parsers for the exchange downloads
+
+def parse_nse(text):
+    """Parse NSE's EQUITY_L.csv (SYMBOL, NAME OF COMPANY, ...)."""
+    reader = csv.DictReader(io.StringIO(text))
+    reader.fieldnames = [name.strip() for name in reader.fieldnames]
+    return [(row["SYMBOL"].strip(), row["NAME OF COMPANY"].strip(), "NSE") for row in reader]
+
+
+def parse_bse(text):
+    """Parse BSE's list_of_scrips.csv (Security Id, Security Name / Issuer Name, ...)."""
+    reader = csv.DictReader(io.StringIO(text))
+    reader.fieldnames = [name.strip() for name in reader.fieldnames]
+    listings = []
+    for row in reader:
+        if row.get("Status", "Active").strip() != "Active":
+            continue
+        name = (row.get("Issuer Name") or row.get("Security Name") or "").strip()
+        listings.append((row["Security Id"].strip(), name, "BSE"))
+    return listings
+
+
+def parse_nasdaq(text):
+    """Parse nasdaqlisted.txt / otherlisted.txt (pipe separated, test issues skipped)."""
+    reader = csv.DictReader(io.StringIO(text), delimiter="|")
+    listings = []
+    for row in reader:
+        ticker = row.get("Symbol") or row.get("ACT Symbol")
+        if not ticker or ticker.startswith("File Creation Time") or row.get("Test Issue") == "Y":
+            continue
+        listings.append((ticker.strip(), row["Security Name"].strip(), "US"))
+    return listings
+
+
+def build_index(bse_file=None):
+    """Download the NSE and US listings (plus a local BSE file if given) into a SymbolIndex."""
+    from curl_cffi import requests
+
+    session = requests.Session(impersonate="chrome")
+    listings = parse_nse(session.get(NSE_URL, timeout=30).text)
+    for url in NASDAQ_URLS:
+        listings += parse_nasdaq(session.get(url, timeout=30).text)
+    if bse_file:
+        with open(bse_file, encoding="utf-8-sig") as file:
+            listings += parse_bse(file.read())
+    return SymbolIndex(listings)
+
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+
+def default_index():
+    """Return the index at ``DEFAULT_INDEX_PATH`` (an empty one if it was never built)."""
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            _default_index = SymbolIndex.load() if os.path.exists(DEFAULT_INDEX_PATH) else SymbolIndex()
+        return _default_index
+
+
+@lru_cache(maxsize=4096)
+def resolve(query):
+    """Return the Yahoo symbol for a ticker or company name, or None if it is not indexed."""
+    entry = default_index().lookup(query)
+    return entry[3] if entry else None
+
+
+def record_industry(symbol, industry):
+    """Remember the industry of an indexed ``symbol`` (in memory; ``classify`` saves it)."""
+    return default_index().set_industry(symbol, industry)
+
+
+def classify(index, exchange=None, limit=None):
+    """Fill in the industry of unclassified listings from Yahoo profiles.
+
+    Args:
+        index (SymbolIndex): Index to update in place.
+        exchange (str): Only classify listings on this exchange.
+        limit (int): Classify at most this many listings.
+
+    Returns:
+        int: Number of listings classified.
+    """
+    from advisor.bulk import bulk_profiles
+
+    pending = [entry[3] for entry in index.listings
+               if entry[3] not in index.industries and (exchange is None or entry[2] == exchange)]
+    pending = pending[:limit] if limit else pending
+    profiles = bulk_profiles(pending)["profiles"]
+    return sum(index.set_industry(symbol, info.get("industry")) for symbol, info in profiles.items())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or query the exchange symbol index")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="Download listings and write the index")
+    build.add_argument("--bse", help="Local BSE list_of_scrips.csv to include")
+    build.add_argument("--output", default=DEFAULT_INDEX_PATH)
+    classify_cmd = commands.add_parser("classify", help="Add Yahoo industries to indexed listings")
+    classify_cmd.add_argument("--exchange", choices=sorted(YAHOO_SUFFIX), help="Only this exchange")
+    classify_cmd.add_argument("--limit", type=int, help="Classify at most this many listings")
+    lookup = commands.add_parser("lookup", help="Resolve a ticker or company name")
+    lookup.add_argument("query")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        index = build_index(args.bse)
+        ## Keep the industries of listings that are still listed
+        for symbol, industry in default_index().industries.items():
+            index.set_industry(symbol, industry)
+        index.save(args.output)
+        print(f"Wrote {len(index)} listings to {args.output}")
+    elif args.command == "classify":
+        index = default_index()
+        classified = classify(index, args.exchange, args.limit)
+        index.save()
+        print(f"Classified {classified} listings ({len(index.industries)} with an industry) in {DEFAULT_INDEX_PATH}")
+    else:
+        print(default_index().lookup(args.query))
+
+
+if __name__ == "__main__":
+    main()
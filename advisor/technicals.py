@@ -0,0 +1,231 @@
+"""Vectorized technical indicators over daily price history.
+
+Closes for every symbol are stacked into one (days x symbols) NumPy array,
+so a whole watchlist is handled in a single pass: simple moving averages
+come from cumulative sums, exponential averages advance every symbol at
+once per day, and returns, volatility and drawdowns are whole-array
+operations. ``technical_summary`` renders one compact row per symbol for
+the analyst instead of raw price series.
+"""
+
+import math
+import warnings
+
+import numpy as np
+
+TRADING_DAYS = 252
+RSI_PERIOD = 14
+MACD_SPANS = (12, 26, 9)
+
+## Indicator columns, in display order: (column, header, kind)
+SUMMARY_COLUMNS = (
+    ("close", "Close", "price"),
+    ("change_1m", "1M %", "pct"),
+    ("change_3m", "3M %", "pct"),
+    ("change_1y", "1Y %", "pct"),
+    ("sma_50", "SMA50", "price"),
+    ("sma_200", "SMA200", "price"),
+    ("ema_20", "EMA20", "price"),
+    ("rsi_14", "RSI14", "plain"),
+    ("macd_hist", "MACD hist", "price"),
+    ("vol_20d", "Vol20d %", "pct"),
+    ("vol_1y", "Vol1Y %", "pct"),
+    ("drawdown", "DD %", "pct"),
+    ("max_drawdown", "MaxDD %", "pct"),
+)
+
+
+def close_matrix(histories):
+    """Stack closing prices into a (days x symbols) array aligned on trading dates.
+
+    Args:
+        histories (dict): ``{symbol: OHLCV frame or None}``.
+
+    Returns:
+        tuple: ``(symbols, dates, closes)``; days a symbol did not trade carry
+        its previous close, days before its first bar are NaN.
+    """
+    import pandas as pd
+
+    series = {symbol: frame["Close"] for symbol, frame in histories.items()
+              if frame is not None and len(frame)}
+    if not series:
+        return [], pd.DatetimeIndex([]), np.empty((0, 0))
+    ## Exchange holidays differ across a mixed watchlist
+    closes = pd.DataFrame(series).sort_index().ffill()
+    return list(closes.columns), closes.index, closes.to_numpy(dtype=float)
+
+
+def sma(values, window):
+    """Simple moving average down each column, NaN until ``window`` values exist."""
+    valid = np.isfinite(values)
+    padding = np.zeros((1, values.shape[1]))
+    sums = np.vstack([padding, np.cumsum(np.where(valid, values, 0.0), axis=0)])
+    counts = np.vstack([padding, np.cumsum(valid, axis=0)])
+    result = np.full(values.shape, np.nan)
+    if window <= values.shape[0]:
+        window_sums = sums[window:] - sums[:-window]
+        full = (counts[window:] - counts[:-window]) == window
+        result[window - 1:] = np.where(full, window_sums / window, np.nan)
+    return result
+
+
+def ema(values, span=None, alpha=None):
+    """Exponential moving average down each column (all symbols per step).
+
+    Each column starts at its first valid value; gaps carry the average forward.
+    """
+    alpha = alpha if alpha is not None else 2.0 / (span + 1)
+    result = np.full(values.shape, np.nan)
+    average = np.full(values.shape[1], np.nan)
+    for day, row in enumerate(values):
+        updated = average + alpha * (row - average)
+        average = np.where(np.isnan(average), row, np.where(np.isnan(row), average, updated))
+        result[day] = average
+    return result
+
+
+def rsi(values, period=RSI_PERIOD):
+    """Wilder's relative strength index (0-100) down each column."""
+    change = np.diff(values, axis=0, prepend=np.nan)
+    gains = ema(np.where(np.isnan(change), np.nan, np.maximum(change, 0.0)), alpha=1.0 / period)
+    losses = ema(np.where(np.isnan(change), np.nan, np.maximum(-change, 0.0)), alpha=1.0 / period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        strength = 100.0 - 100.0 / (1.0 + gains / losses)
+    return np.where(losses == 0, np.where(gains > 0, 100.0, 50.0), strength)
+
+
+def macd(values, fast=MACD_SPANS[0], slow=MACD_SPANS[1], signal=MACD_SPANS[2]):
+    """Return ``(macd, signal, histogram)`` arrays."""
+    line = ema(values, fast) - ema(values, slow)
+    signal_line = ema(line, signal)
+    return line, signal_line, line - signal_line
+
+
+def drawdowns(values):
+    """Fractional distance below the running peak (0 at a new high, negative below it)."""
+    peaks = np.fmax.accumulate(values, axis=0)
+    with np.errstate(invalid="ignore"):
+        return values / peaks - 1.0
+
+
+def _last_valid(values):
+    """Last non-NaN value in each column."""
+    valid = np.isfinite(values)
+    index = values.shape[0] - 1 - np.argmax(valid[::-1], axis=0)
+    return np.where(valid.any(axis=0), values[index, np.arange(values.shape[1])], np.nan)
+
+
+def _change(closes, days):
+    if closes.shape[0] <= days:
+        return np.full(closes.shape[1], np.nan)
+    return closes[-1] / closes[-1 - days] - 1.0
+
+
+def _volatility(returns, days):
+    window = returns[-days:]
+    if len(window) < 2:
+        return np.full(returns.shape[1], np.nan)
+    enough = np.isfinite(window).sum(axis=0) > 1
+    return np.where(enough, np.nanstd(window, axis=0, ddof=1) * math.sqrt(TRADING_DAYS), np.nan)
+
+
+def compute_indicators(histories):
+    """Compute the latest indicators for every symbol with price history.
+
+    Args:
+        histories (dict): ``{symbol: OHLCV frame or None}``.
+
+    Returns:
+        DataFrame: One row per symbol with close, 1M/3M/1Y change, SMA 20/50/200,
+        EMA 20, RSI 14, MACD line/signal/histogram, 20-day and 1-year annualized
+        volatility, current and maximum drawdown, 52-week high/low and bar count.
+        Changes, volatility and drawdowns are fractions.
+    """
+    import pandas as pd
+
+    symbols, dates, closes = close_matrix(histories)
+    if not symbols:
+        return pd.DataFrame()
+    ## Recent listings have too few bars for some windows; those come out NaN
+    with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return _indicator_table(symbols, dates, closes)
+
+
+def _indicator_table(symbols, dates, closes):
+    import pandas as pd
+
+    returns = np.diff(np.log(closes), axis=0)
+    line, signal, histogram = macd(closes)
+    drawdown = drawdowns(closes)
+    last_year = closes[-TRADING_DAYS:]
+    columns = {
+        "close": closes[-1],
+        "change_1m": _change(closes, 21),
+        "change_3m": _change(closes, 63),
+        "change_1y": last_year[-1] / last_year[0] - 1.0,
+        "sma_20": sma(closes, 20)[-1],
+        "sma_50": sma(closes, 50)[-1],
+        "sma_200": sma(closes, 200)[-1],
+        "ema_20": ema(closes, 20)[-1],
+        "rsi_14": rsi(closes)[-1],
+        "macd": line[-1],
+        "macd_signal": signal[-1],
+        "macd_hist": histogram[-1],
+        "vol_20d": _volatility(returns, 20),
+        "vol_1y": _volatility(returns, TRADING_DAYS),
+        "drawdown": _last_valid(drawdown),
+        "max_drawdown": np.nanmin(drawdown, axis=0),
+        "high_52w": np.nanmax(last_year, axis=0),
+        "low_52w": np.nanmin(last_year, axis=0),
+        "bars": np.isfinite(closes).sum(axis=0),
+    }
+    table = pd.DataFrame(columns, index=symbols)
+    table.attrs["as_of"] = dates[-1]
+    return table
+
+
+def signals(row):
+    """Short trend/momentum labels for one indicator row."""
+    labels = []
+    if not math.isnan(row["sma_200"]):
+        labels.append("above SMA200" if row["close"] > row["sma_200"] else "below SMA200")
+        if not math.isnan(row["sma_50"]):
+            labels.append("SMA50>SMA200" if row["sma_50"] > row["sma_200"] else "SMA50<SMA200")
+    if row["rsi_14"] >= 70:
+        labels.append("RSI overbought")
+    elif row["rsi_14"] <= 30:
+        labels.append("RSI oversold")
+    if not math.isnan(row["macd_hist"]):
+        labels.append("MACD bullish" if row["macd_hist"] > 0 else "MACD bearish")
+    return ", ".join(labels)
+
+
+def _format(value, kind):
+    if value is None or math.isnan(value):
+        return "-"
+    if kind == "pct":
+        return f"{value * 100:.1f}"
+    if kind == "plain":
+        return f"{value:.0f}"
+    return f"{value:.2f}"
+
+
+def technical_summary(histories):
+    """Render indicators for ``histories`` as a compact text table, one row per symbol."""
+    table = compute_indicators(histories)
+    missing = [symbol for symbol, frame in histories.items() if frame is None or not len(frame)]
+    if table.empty:
+        return f"No price history found for {', '.join(missing)}"
+    lines = [
+        f"Technical indicators from daily closes up to {table.attrs['as_of']:%Y-%m-%d} "
+        "(changes, annualized volatility and drawdowns in %)",
+        " | ".join(["Symbol"] + [header for _, header, _ in SUMMARY_COLUMNS] + ["Signals"]),
+    ]
+    for symbol, row in table.iterrows():
+        values = [_format(row[column], kind) for column, _, kind in SUMMARY_COLUMNS]
+        lines.append(" | ".join([symbol] + values + [signals(row)]))
+    if missing:
+        lines.append(f"No price history: {', '.join(missing)}")
+    return "\n".join(lines)
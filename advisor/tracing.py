@@ -0,0 +1,430 @@
+"""Structured span tracing for crew runs.
+
+Records nested spans ``crew -> task -> agent -> iteration -> llm / tool``
+with durations, estimated token counts, cache hits and errors, from CrewAI's
+event bus; each LLM call of an agent opens a new iteration. Finished traces go to optional
+sinks (a JSONL file and/or an OTLP/HTTP collector such as a local
+OpenTelemetry Collector or Jaeger on :4318), and a per-span-kind summary
+table is printed when ``trace_kickoff`` returns.
+
+    tracer = Tracer(sinks=[JsonlSink("trace.jsonl")])
+    tracer.install()
+    crew = Crew(...)      # tools wrapped with tool_scope(name) report cache hits
+    result = tracer.trace_kickoff(crew, inputs={"stock": "RELIANCE"})
+"""
+
+import contextvars
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import urllib.request
+import uuid
+from collections import defaultdict
+
+try:
+    from crewai.events import crewai_event_bus
+    from crewai.events import (
+        TaskStartedEvent, TaskCompletedEvent, TaskFailedEvent,
+        AgentExecutionStartedEvent, AgentExecutionCompletedEvent, AgentExecutionErrorEvent,
+        LLMCallStartedEvent, LLMCallCompletedEvent, LLMCallFailedEvent,
+        ToolUsageStartedEvent, ToolUsageFinishedEvent, ToolUsageErrorEvent,
+    )
+except ImportError:  # crewai < 1.0
+    from crewai.utilities.events import crewai_event_bus
+    from crewai.utilities.events import (
+        TaskStartedEvent, TaskCompletedEvent, TaskFailedEvent,
+        AgentExecutionStartedEvent, AgentExecutionCompletedEvent, AgentExecutionErrorEvent,
+        LLMCallStartedEvent, LLMCallCompletedEvent, LLMCallFailedEvent,
+        ToolUsageStartedEvent, ToolUsageFinishedEvent, ToolUsageErrorEvent,
+    )
+
+from advisor.cache import market_cache
+
+SPAN_KINDS = ("crew", "task", "agent", "iteration", "llm", "tool")
+
+## Market-cache lookups are counted per tool call while it runs (``tool_scope``);
+## a context variable follows the call into ``get_many`` workers and async tasks
+_scope = contextvars.ContextVar("advisor_tool_scope", default=None)
+_scope_lock = threading.Lock()
+_tracers = []
+
+
+def _count_cache_lookup(key, hit):
+    counts = _scope.get()
+    if counts is not None:
+        field = "cache_hits" if hit else "cache_misses"
+        with _scope_lock:
+            counts[field] = counts.get(field, 0) + 1
+
+
+def _args_key(arguments):
+    """Canonical text for a tool call's arguments (a dict, or its JSON text)."""
+    if isinstance(arguments, str):
+        try:
+            arguments = json.loads(arguments)
+        except ValueError:
+            return arguments
+    if isinstance(arguments, dict):
+        return json.dumps(arguments, sort_keys=True, default=str)
+    return str(arguments)
+
+
+def tool_scope(tool_name):
+    """Decorator for a tool function: its market-cache hits and misses go to its ``tool`` span.
+
+    The lookups happen on the thread running the tool, which need not be the
+    thread handling the tool events, so the counts are handed over keyed by
+    tool name and call arguments.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            counts = {}
+            token = _scope.set(counts)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _scope.reset(token)
+                arguments = _args_key(dict(signature.bind_partial(*args, **kwargs).arguments))
+                for tracer in _tracers:
+                    tracer.record_tool_cache(tool_name, arguments, counts)
+        return wrapper
+    return decorator
+
+
+def _estimate_tokens(value):
+    """Rough token count (4 characters per token) for messages or text."""
+    if value is None:
+        return 0
+    if isinstance(value, list):
+        return sum(_estimate_tokens(message.get("content") if isinstance(message, dict) else message)
+                   for message in value)
+    return len(str(value)) // 4
+
+
+class Span:
+    """One timed operation in a trace."""
+
+    __slots__ = ("trace_id", "span_id", "parent_id", "kind", "name", "start", "end", "attributes", "error")
+
+    def __init__(self, kind, name, parent=None, attributes=None):
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent.span_id if parent else None
+        self.kind = kind
+        self.name = name
+        self.start = time.time()
+        self.end = None
+        self.attributes = dict(attributes or {})
+        self.error = None
+
+    @property
+    def duration_ms(self):
+        return round(((self.end or time.time()) - self.start) * 1000, 2)
+
+    def to_dict(self):
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "kind": self.kind,
+            "name": self.name,
+            "start": self.start,
+            "duration_ms": self.duration_ms,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class JsonlSink:
+    """Appends one JSON object per span to a file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans):
+        with self._lock, open(self.path, "a", encoding="utf-8") as file:
+            for span in spans:
+                file.write(json.dumps(span.to_dict(), default=str) + "\n")
+
+
+class OtlpHttpSink:
+    """Posts spans as OTLP/HTTP JSON to a collector, e.g. http://localhost:4318/v1/traces."""
+
+    def __init__(self, endpoint, service_name="investment-advisor", timeout=5):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+
+    @staticmethod
+    def _value(value):
+        if isinstance(value, bool):
+            return {"boolValue": value}
+        if isinstance(value, int):
+            return {"intValue": str(value)}
+        if isinstance(value, float):
+            return {"doubleValue": value}
+        return {"stringValue": str(value)}
+
+    def _span(self, span):
+        attributes = dict(span.attributes, **{"advisor.kind": span.kind})
+        otlp = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": f"{span.kind} {span.name}",
+            "kind": 1,
+            "startTimeUnixNano": str(int(span.start * 1e9)),
+            "endTimeUnixNano": str(int((span.end or span.start) * 1e9)),
+            "attributes": [{"key": key, "value": self._value(value)} for key, value in attributes.items()],
+            "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+        }
+        if span.parent_id:
+            otlp["parentSpanId"] = span.parent_id
+        return otlp
+
+    def export(self, spans):
+        payload = {"resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": self.service_name}}]},
+            "scopeSpans": [{"scope": {"name": "advisor.tracing"}, "spans": [self._span(s) for s in spans]}],
+        }]}
+        request = urllib.request.Request(self.endpoint, data=json.dumps(payload).encode(),
+                                         headers={"Content-Type": "application/json"})
+        try:
+            urllib.request.urlopen(request, timeout=self.timeout).close()
+        except Exception as e:
+            print(f"OTLP export to {self.endpoint} failed: {e}")
+
+
+class Tracer:
+    """Collects spans from CrewAI events and keeps per-kind aggregates for the summary.
+
+    Event handlers may run on a worker pool rather than on the thread that
+    emitted the event (crewai >= 1.0), so open spans are keyed by event
+    identity (crew, task and agent objects, agent ids, LLM call ids), never
+    by the handling thread.
+    """
+
+    def __init__(self, sinks=None):
+        self.sinks = list(sinks or [])
+        self._lock = threading.Lock()
+        self._open = {}                       # (kind, key) -> open span
+        self._agents = {}                     # agent id / key / role -> agent span key
+        self._tool_cache = defaultdict(list)  # tool name -> [(arguments, cache counts)] of finished calls
+        self._pending = defaultdict(list)     # trace_id -> finished spans awaiting export
+        self._totals = defaultdict(lambda: {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "errors": 0,
+                                            "cache_hits": 0, "cache_misses": 0,
+                                            "prompt_tokens": 0, "completion_tokens": 0})
+        self._installed = False
+
+    ## Span bookkeeping
+
+    def start_span(self, kind, name, parent=None, attributes=None, key=None):
+        """Open a span under ``parent`` (None for a root), registered under ``(kind, key)``."""
+        span = Span(kind, name, parent, attributes)
+        if key is not None:
+            with self._lock:
+                self._open[(kind, key)] = span
+        return span
+
+    def end_span(self, span, error=None, key=None, **attributes):
+        if span is None or span.end is not None:
+            return
+        span.end = time.time()
+        span.attributes.update(attributes)
+        if error is not None:
+            span.error = str(error)
+        with self._lock:
+            if key is not None:
+                self._open.pop((span.kind, key), None)
+            totals = self._totals[(span.kind, span.name)]
+            totals["count"] += 1
+            totals["total_ms"] += span.duration_ms
+            totals["max_ms"] = max(totals["max_ms"], span.duration_ms)
+            totals["errors"] += span.error is not None
+            for field in ("cache_hits", "cache_misses", "prompt_tokens", "completion_tokens"):
+                totals[field] += span.attributes.get(field, 0)
+            self._pending[span.trace_id].append(span)
+            export = span.parent_id is None
+            spans = self._pending.pop(span.trace_id) if export else None
+        if export:
+            for sink in self.sinks:
+                sink.export(spans)
+
+    def _open_span(self, kind, key):
+        with self._lock:
+            return self._open.get((kind, key))
+
+    def _agent_key(self, source, event):
+        """Agent span key for an LLM or tool event, from the agent id, key or role it carries."""
+        agent = getattr(event, "from_agent", None) or getattr(event, "agent", None)
+        candidates = [getattr(agent, "id", None), getattr(event, "agent_id", None),
+                      getattr(event, "agent_key", None), getattr(event, "agent_role", None),
+                      getattr(source, "id", None) if source is not None else None]
+        with self._lock:
+            for candidate in candidates:
+                if candidate is not None and str(candidate) in self._agents:
+                    return self._agents[str(candidate)]
+        return None
+
+    ## Hooks
+
+    def install(self):
+        """Register the CrewAI event handlers and the market-cache listener (idempotent)."""
+        if self._installed:
+            return self
+        self._installed = True
+        _tracers.append(self)
+        if _count_cache_lookup not in market_cache.listeners:
+            market_cache.listeners.append(_count_cache_lookup)
+        on = crewai_event_bus.on
+
+        on(TaskStartedEvent)(self._on_task_started)
+        on(TaskCompletedEvent)(lambda source, event: self._on_task_finished(source, event))
+        on(TaskFailedEvent)(lambda source, event: self._on_task_finished(source, event, getattr(event, "error", "failed")))
+        on(AgentExecutionStartedEvent)(self._on_agent_started)
+        on(AgentExecutionCompletedEvent)(lambda source, event: self._on_agent_finished(event))
+        on(AgentExecutionErrorEvent)(lambda source, event: self._on_agent_finished(event, getattr(event, "error", "failed")))
+        on(LLMCallStartedEvent)(self._on_llm_started)
+        on(LLMCallCompletedEvent)(lambda source, event: self._on_llm_finished(source, event))
+        on(LLMCallFailedEvent)(lambda source, event: self._on_llm_finished(source, event, getattr(event, "error", "failed")))
+        on(ToolUsageStartedEvent)(self._on_tool_started)
+        on(ToolUsageFinishedEvent)(lambda source, event: self._on_tool_finished(source, event))
+        on(ToolUsageErrorEvent)(lambda source, event: self._on_tool_finished(source, event, getattr(event, "error", "failed")))
+        return self
+
+    def _on_task_started(self, task, event):
+        agent = getattr(task, "agent", None)
+        crew = getattr(agent, "crew", None)
+        parent = self._open_span("crew", id(crew)) if crew is not None else None
+        name = getattr(task, "name", None) or (agent.role if agent else "task")
+        self.start_span("task", name, parent=parent, key=id(task))
+
+    def _on_task_finished(self, task, event, error=None):
+        self.end_span(self._open_span("task", id(task)), error=error, key=id(task))
+
+    def _on_agent_started(self, source, event):
+        agent = event.agent
+        key = (id(agent), id(event.task))
+        with self._lock:
+            for alias in (getattr(agent, "id", None), getattr(agent, "key", None), agent.role):
+                if alias is not None:
+                    self._agents[str(alias)] = key
+        self.start_span("agent", agent.role, parent=self._open_span("task", id(event.task)), key=key)
+
+    def _on_agent_finished(self, event, error=None):
+        key = (id(event.agent), id(event.task))
+        self.end_span(self._open_span("iteration", key), key=key)
+        self.end_span(self._open_span("agent", key), error=error, key=key)
+        with self._lock:
+            for alias, agent_key in list(self._agents.items()):
+                if agent_key == key:
+                    del self._agents[alias]
+
+    def _llm_key(self, source, event, agent_key):
+        return getattr(event, "call_id", None) or agent_key or id(source)
+
+    def _on_llm_started(self, source, event):
+        ## Every LLM call starts a new agent iteration (reasoning step); tool calls follow inside it
+        agent_key = self._agent_key(source, event)
+        parent = None
+        if agent_key is not None:
+            previous = self._open_span("iteration", agent_key)
+            self.end_span(previous, key=agent_key)
+            step = previous.attributes.get("step", 0) + 1 if previous else 1
+            agent = self._open_span("agent", agent_key)
+            parent = self.start_span("iteration", agent.name if agent else "agent", parent=agent,
+                                     attributes={"step": step}, key=agent_key)
+        model = getattr(source, "model", None) or getattr(event, "model", None) or "llm"
+        self.start_span("llm", str(model), parent=parent, key=self._llm_key(source, event, agent_key),
+                        attributes={"prompt_tokens": _estimate_tokens(getattr(event, "messages", None))})
+
+    def _on_llm_finished(self, source, event, error=None):
+        key = self._llm_key(source, event, self._agent_key(source, event))
+        self.end_span(self._open_span("llm", key), error=error, key=key,
+                      completion_tokens=_estimate_tokens(getattr(event, "response", None)))
+
+    def _tool_key(self, source, event):
+        agent_key = self._agent_key(source, event)
+        return agent_key, (agent_key, getattr(event, "tool_name", "tool"))
+
+    def _on_tool_started(self, source, event):
+        agent_key, key = self._tool_key(source, event)
+        parent = (self._open_span("iteration", agent_key) or self._open_span("agent", agent_key)) if agent_key else None
+        self.start_span("tool", getattr(event, "tool_name", "tool"), parent=parent, key=key)
+
+    def _on_tool_finished(self, source, event, error=None):
+        _, key = self._tool_key(source, event)
+        span = self._open_span("tool", key)
+        if span is None:
+            return
+        attributes = {}
+        from_cache = getattr(event, "from_cache", None)
+        if from_cache is not None:
+            attributes["crew_cache_hit"] = bool(from_cache)
+        ## Cache lookups counted while the tool ran (see ``tool_scope``), matched by
+        ## call arguments; the oldest call of the tool when the arguments differ
+        arguments = _args_key(getattr(event, "tool_args", None) or {})
+        with self._lock:
+            calls = self._tool_cache[span.name]
+            match = next((i for i, (args, _) in enumerate(calls) if args == arguments), 0)
+            attributes.update(calls.pop(match)[1] if calls else {})
+        self.end_span(span, error=error, key=key, **attributes)
+
+    def record_tool_cache(self, tool_name, arguments, counts):
+        with self._lock:
+            self._tool_cache[tool_name].append((arguments, counts))
+
+    ## Running crews
+
+    def trace_kickoff(self, crew, inputs=None, print_summary=True):
+        """Run ``crew.kickoff(inputs=...)`` inside a crew span and print the summary table."""
+        name = ",".join(f"{key}={value}" for key, value in (inputs or {}).items()) or "crew"
+        span = self.start_span("crew", name, parent=None, key=id(crew))
+        try:
+            result = crew.kickoff(inputs=inputs)
+        except Exception as e:
+            self.end_span(span, error=e, key=id(crew))
+            raise
+        usage = getattr(crew, "usage_metrics", None)
+        usage = usage.model_dump() if hasattr(usage, "model_dump") else (usage or {})
+        self.end_span(span, key=id(crew), **{f"usage_{key}": value for key, value in usage.items()
+                                             if isinstance(value, (int, float))})
+        if print_summary:
+            self.print_summary()
+        return result
+
+    def summary(self):
+        """Return aggregate rows ``{(kind, name): totals}`` for all finished spans."""
+        with self._lock:
+            return {key: dict(value) for key, value in self._totals.items()}
+
+    def print_summary(self):
+        rows = sorted(self.summary().items(), key=lambda item: (SPAN_KINDS.index(item[0][0]), -item[1]["total_ms"]))
+        print("\n" + "=" * 108)
+        print(f"{'kind':<10}{'name':<36}{'count':>6}{'total ms':>11}{'mean ms':>10}{'max ms':>10}"
+              f"{'errors':>7}{'cache h/m':>10}{'tokens in/out':>18}")
+        for (kind, name), totals in rows:
+            mean = totals["total_ms"] / totals["count"] if totals["count"] else 0
+            cache = f"{totals['cache_hits']}/{totals['cache_misses']}"
+            tokens = f"{totals['prompt_tokens']}/{totals['completion_tokens']}"
+            print(f"{kind:<10}{name[:35]:<36}{totals['count']:>6}{totals['total_ms']:>11.0f}{mean:>10.0f}"
+                  f"{totals['max_ms']:>10.0f}{totals['errors']:>7}{cache:>10}{tokens:>18}")
+        print("=" * 108)
+
+
+def sinks_from_env(trace_file=None, otlp_endpoint=None):
+    """Build sinks from arguments or the ADVISOR_TRACE_FILE / ADVISOR_OTLP_ENDPOINT variables."""
+    sinks = []
+    trace_file = trace_file or os.getenv("ADVISOR_TRACE_FILE")
+    otlp_endpoint = otlp_endpoint or os.getenv("ADVISOR_OTLP_ENDPOINT")
+    if trace_file:
+        sinks.append(JsonlSink(trace_file))
+    if otlp_endpoint:
+        sinks.append(OtlpHttpSink(otlp_endpoint))
+    return sinks
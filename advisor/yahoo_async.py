@@ -0,0 +1,167 @@
+"""Async Yahoo Finance fetchers on a pooled curl_cffi AsyncSession.
+
+``yfinance`` only works with blocking sessions, so the price and profile
+calls talk to Yahoo's chart and quoteSummary endpoints directly. One client
+keeps a bounded connection pool and can overlap hundreds of requests on a
+single event loop. Results land in the shared ``market_cache``, so the
+synchronous tools reuse them.
+
+Usage:
+
+    async with AsyncYahooClient() as client:
+        info = await client.get_info("RELIANCE.NS")
+
+    asyncio.run(warm_cache(["TCS", "INFY", "AAPL"]))
+"""
+
+import asyncio
+
+from curl_cffi.requests import AsyncSession
+
+from advisor import symbols
+from advisor.cache import market_cache, PRICE_TTL
+from advisor.ratelimit import limiter
+from advisor.breaker import breaker
+from advisor.market import get_financials, remember_profile
+
+CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+QUOTE_SUMMARY_URL = "https://query2.finance.yahoo.com/v10/finance/quoteSummary/{symbol}"
+CRUMB_URL = "https://query1.finance.yahoo.com/v1/test/getcrumb"
+COOKIE_URL = "https://fc.yahoo.com"
+
+## quoteSummary modules that together provide the ``Ticker.info`` fields the tools use
+INFO_MODULES = ("price", "summaryDetail", "assetProfile", "financialData", "defaultKeyStatistics")
+
+DEFAULT_MAX_CLIENTS = 20
+
+
+def _flatten_modules(result):
+    """Merge quoteSummary modules into one ``Ticker.info``-style dict of raw values."""
+    info = {}
+    for module in result.values():
+        if not isinstance(module, dict):
+            continue
+        for key, value in module.items():
+            if isinstance(value, dict):
+                value = value.get("raw", value.get("fmt")) if value else None
+            if key not in info or info[key] is None:
+                info[key] = value
+    return info
+
+
+class AsyncYahooClient:
+    """Async Yahoo client with a bounded connection pool and shared caching."""
+
+    def __init__(self, max_clients=DEFAULT_MAX_CLIENTS, timeout=15):
+        """
+        Args:
+            max_clients (int): Maximum concurrent connections in the pool.
+            timeout (float): Per-request timeout in seconds.
+        """
+        self.max_clients = max_clients
+        self.timeout = timeout
+        self._session = None
+        self._crumb = None
+        self._crumb_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        self._session = AsyncSession(impersonate="chrome", max_clients=self.max_clients, timeout=self.timeout)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._session.close()
+
+    async def _get_checked(self, url, params=None):
+        ## curl_cffi does not raise on HTTP errors; raise inside the breaker so 429/5xx count
+        response = await self._session.get(url, params=params)
+        response.raise_for_status()
+        return response
+
+    async def _get_json(self, url, params=None):
+        response = await breaker("yahoo").call_async(self._get_checked, url, params=params, throttle=limiter("yahoo"))
+        return response.json()
+
+    async def _ensure_crumb(self):
+        async with self._crumb_lock:
+            if self._crumb is None:
+                ## fc.yahoo.com answers 404 but sets the consent cookie the crumb is tied to
+                await self._session.get(COOKIE_URL, allow_redirects=True)
+                response = await self._session.get(CRUMB_URL)
+                response.raise_for_status()
+                self._crumb = response.text.strip()
+            return self._crumb
+
+    async def get_price(self, symbol):
+        """Return the current market price for ``symbol`` (cached for seconds)."""
+        symbol = symbols.resolve(symbol) or symbol
+        price = market_cache.get(("price", symbol))
+        if price is not None:
+            return price
+        data = await self._get_json(CHART_URL.format(symbol=symbol), {"range": "1d", "interval": "1d"})
+        results = (data.get("chart") or {}).get("result") or []
+        price = results[0]["meta"].get("regularMarketPrice") if results else None
+        if price:
+            market_cache.set(("price", symbol), price, PRICE_TTL)
+        return price
+
+    async def get_info(self, symbol):
+        """Fetch a ``Ticker.info``-style dict for ``symbol``.
+
+        Only the price and the compact snapshot are cached (see ``remember_profile``).
+        """
+        symbol = symbols.resolve(symbol) or symbol
+        crumb = await self._ensure_crumb()
+        data = await self._get_json(QUOTE_SUMMARY_URL.format(symbol=symbol),
+                                    {"modules": ",".join(INFO_MODULES), "crumb": crumb})
+        results = (data.get("quoteSummary") or {}).get("result") or []
+        if not results:
+            return None
+        info = _flatten_modules(results[0])
+        info.setdefault("symbol", symbol)
+        remember_profile(symbol, info)
+        return info
+
+    async def get_quotes(self, symbols_list):
+        """Return raw v7 quote dicts for up to ~50 symbols in a single request.
+
+        Symbols Yahoo does not know are simply absent from the result.
+        """
+        crumb = await self._ensure_crumb()
+        data = await self._get_json(QUOTE_URL, {"symbols": ",".join(symbols_list), "crumb": crumb})
+        results = (data.get("quoteResponse") or {}).get("result") or []
+        return {quote["symbol"]: quote for quote in results if quote.get("symbol")}
+
+    async def get_financials(self, symbol):
+        """Return the annual income statement frame for ``symbol``.
+
+        Statements come from the on-disk store and rarely touch the network,
+        so the blocking yfinance path runs in a worker thread.
+        """
+        symbol = symbols.resolve(symbol) or symbol
+        return await asyncio.to_thread(get_financials, symbol)
+
+    async def gather(self, fetch, symbols_list):
+        """Run ``fetch(symbol)`` for every symbol concurrently.
+
+        Returns:
+            dict: symbol -> result, or the exception raised for that symbol.
+        """
+        results = await asyncio.gather(*(fetch(symbol) for symbol in symbols_list), return_exceptions=True)
+        return dict(zip(symbols_list, results))
+
+
+async def warm_cache(symbols_list, max_clients=DEFAULT_MAX_CLIENTS, financials=True):
+    """Fetch profile (and price) plus optional financials for many symbols on one event loop.
+
+    Returns:
+        dict: symbol -> error message for the symbols that failed.
+    """
+    errors = {}
+    async with AsyncYahooClient(max_clients=max_clients) as client:
+        fetches = [client.get_info] + ([client.get_financials] if financials else [])
+        for fetch in fetches:
+            for symbol, result in (await client.gather(fetch, symbols_list)).items():
+                if isinstance(result, Exception):
+                    errors.setdefault(symbol, f"{type(result).__name__}: {result}")
+    return errors
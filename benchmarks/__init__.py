@@ -0,0 +1 @@
+"""Offline benchmarks for the investment advisor crew."""
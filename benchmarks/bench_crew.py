@@ -0,0 +1,284 @@
+"""Offline benchmark for 3_investment_advisor.py.
+
+Runs the real crew, tools and advisor data layer against a scripted
+``FakeLLM`` and the local provider stand-in, at several concurrency levels,
+and reports end-to-end, per-task, per-tool and LLM latency percentiles plus
+throughput. No OpenAI, Yahoo or DuckDuckGo access is needed.
+
+    python -m benchmarks.bench_crew --levels 1,4,16 --symbols 16
+    python -m benchmarks.bench_crew --parallel-tasks --prefetch --json bench.json
+"""
+
+import argparse
+import importlib.util
+import json
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "3_investment_advisor.py")
+
+## Keep the benchmark hermetic: in-memory store, no provider throttling, no telemetry
+os.environ.setdefault("ADVISOR_DB", ":memory:")
+for _provider in ("YAHOO", "FINNHUB", "ADZUNA", "DUCKDUCKGO"):
+    os.environ.setdefault(f"ADVISOR_RATE_{_provider}", "100000,100000")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("OPENAI_API_KEY", "offline-benchmark")
+
+
+def percentiles(values, points=(50, 95, 99)):
+    """Return ``{"p50": ..., ...}`` (nearest rank) plus count and mean, in milliseconds."""
+    if not values:
+        return {"n": 0}
+    ordered = sorted(values)
+    result = {"n": len(ordered), "mean": round(sum(ordered) / len(ordered) * 1000, 1)}
+    for point in points:
+        index = min(len(ordered) - 1, max(0, math.ceil(point / 100 * len(ordered)) - 1))
+        result[f"p{point}"] = round(ordered[index] * 1000, 1)
+    return result
+
+
+class Metrics:
+    """Thread-safe collection of latency samples by category and name."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.samples = defaultdict(lambda: defaultdict(list))
+        self.tokens = {"prompt": 0, "completion": 0}
+
+    def add(self, category, name, seconds):
+        with self._lock:
+            self.samples[category][name].append(seconds)
+
+    def add_tokens(self, prompt, completion):
+        with self._lock:
+            self.tokens["prompt"] += prompt
+            self.tokens["completion"] += completion
+
+    def summary(self):
+        with self._lock:
+            return {category: {name: percentiles(values) for name, values in names.items()}
+                    for category, names in self.samples.items()}
+
+
+class StandInTicker:
+    """Drop-in for ``yf.Ticker`` that reads from the stand-in server."""
+
+    def __init__(self, client, symbol):
+        self._client = client
+        self._symbol = symbol
+
+    @property
+    def info(self):
+        return self._client.fetch_info(self._symbol)
+
+    @property
+    def financials(self):
+        return self._client.fetch_financials(self._symbol)
+
+    def history(self, period="1y", interval="1d", **kwargs):
+        return self._client.fetch_history(self._symbol)
+
+
+class StandInYFinance:
+    """Minimal ``yfinance`` module replacement exposing ``Ticker`` and ``download``."""
+
+    def __init__(self, client):
+        self._client = client
+
+    def Ticker(self, symbol, session=None):
+        return StandInTicker(self._client, symbol)
+
+    def download(self, tickers, group_by="ticker", **kwargs):
+        import pandas as pd
+
+        return pd.concat({symbol: self._client.fetch_history(symbol) for symbol in tickers}, axis=1)
+
+
+def load_advisor_script():
+    """Import 3_investment_advisor.py as a module (its crew is built, not run)."""
+    sys.path.insert(0, ROOT)
+    spec = importlib.util.spec_from_file_location("investment_advisor", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _timed(func, metrics, name):
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            metrics.add("tool", name, time.perf_counter() - started)
+    return wrapper
+
+
+def seed_industries(client, symbols_list):
+    """Index the benchmark symbols with their stand-in industries, so the peer tool has peers."""
+    from advisor import symbols
+
+    exchanges = {".NS": "NSE", ".BO": "BSE"}
+    listings = []
+    for symbol in symbols_list:
+        info = client.fetch_info(symbol) or {}
+        ticker, dot, suffix = symbol.rpartition(".")
+        exchange = exchanges.get(f".{suffix}", "US") if dot else "US"
+        listings.append((ticker if exchange != "US" else symbol, info.get("shortName") or symbol,
+                         exchange, info.get("industry")))
+    with symbols._default_index_lock:
+        symbols._default_index = symbols.SymbolIndex(listings)
+    symbols.resolve.cache_clear()
+
+
+def instrument(script, client, metrics, symbols_list):
+    """Route the advisor's providers to the stand-in, seed peer industries and time every tool."""
+    import advisor.bulk as bulk
+    import advisor.search as search
+    import advisor.providers as providers
+
+    providers.yf = StandInYFinance(client)
+    providers.set_default_provider(providers.YahooProvider())
+    search._client = client
+    ## Peer selection ranks candidates by market cap from bulk quotes
+    bulk.bulk_quotes = lambda symbols_list, chunk_size=bulk.CHUNK_SIZE: {
+        "quotes": {symbol: client.fetch_info(symbol) for symbol in symbols_list}, "failed": {}}
+    seed_industries(client, symbols_list)
+    for tool in (script.get_current_stock_price, script.get_company_info,
+                 script.get_income_statements, script.get_technical_indicators, script.get_financial_ratios,
+                 script.get_peer_comparison, script.search_tool):
+        tool.func = _timed(tool.func, metrics, tool.name)
+
+
+def make_prepare(script, metrics, args):
+    """Return the run_batch ``prepare`` hook that swaps in FakeLLMs and task timers."""
+    from benchmarks.fake_llm import FakeLLM
+
+    task_names = [task.agent.role for task in script.crew.tasks]
+
+    def record_llm(latency, prompt_tokens, completion_tokens):
+        metrics.add("llm", "call", latency)
+        metrics.add_tokens(prompt_tokens, completion_tokens)
+
+    def prepare(crew_copy, symbol):
+        if args.prefetch:
+            started = time.perf_counter()
+            indexes = [script.crew.tasks.index(script.get_company_financials),
+                       script.crew.tasks.index(script.advise)]
+            crew_copy = script.prefetched_crew(crew_copy, symbol, indexes)
+            metrics.add("stage", "prefetch", time.perf_counter() - started)
+        crew_copy.verbose = False
+        for agent in crew_copy.agents:
+            agent.verbose = False
+            agent.llm = FakeLLM(symbol=symbol, ttft=args.llm_ttft, per_token=args.llm_per_token,
+                                output_tokens=args.output_tokens, seed=args.seed, recorder=record_llm)
+        last = [time.perf_counter()]
+        lock = threading.Lock()
+
+        def task_done(name):
+            def callback(output):
+                with lock:
+                    now = time.perf_counter()
+                    metrics.add("task", name, now - last[0])
+                    last[0] = now
+            return callback
+
+        for task, name in zip(crew_copy.tasks, task_names):
+            task.callback = task_done(name)
+        return crew_copy
+
+    return prepare
+
+
+def run_level(script, symbols, workers, metrics, args, output_dir):
+    from advisor.batch import run_batch
+    from advisor.cache import market_cache
+    from advisor.store import default_store
+
+    from advisor.search import search_cache
+
+    if not args.warm:
+        market_cache.clear()
+        search_cache.clear()
+        default_store().clear()
+    batch = run_batch(script.crew, symbols, max_workers=workers, output_dir=output_dir,
+                      prepare=make_prepare(script, metrics, args))
+    return batch
+
+
+def print_table(title, rows):
+    print(f"\n{title}")
+    print(f"  {'name':<32}{'n':>6}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}   (ms)")
+    for name, stats in rows.items():
+        if stats.get("n"):
+            print(f"  {name:<32}{stats['n']:>6}{stats['mean']:>10}{stats['p50']:>10}{stats['p95']:>10}{stats['p99']:>10}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline benchmark for the investment crew")
+    parser.add_argument("--levels", default="1,4,16", help="Comma separated concurrency levels")
+    parser.add_argument("--symbols", type=int, default=16, help="Synthetic symbols per level")
+    parser.add_argument("--symbol-list", help="Comma separated symbols instead of synthetic ones")
+    parser.add_argument("--llm-ttft", type=float, default=0.3, help="Fake LLM seconds to first token")
+    parser.add_argument("--llm-per-token", type=float, default=0.002, help="Fake LLM seconds per token")
+    parser.add_argument("--output-tokens", type=int, default=150, help="Fake LLM tokens per final answer")
+    parser.add_argument("--provider-latency", type=float, default=0.05, help="Stand-in seconds per request")
+    parser.add_argument("--parallel-tasks", action="store_true", help="Benchmark with --parallel-tasks")
+    parser.add_argument("--prefetch", action="store_true", help="Benchmark with --prefetch")
+    parser.add_argument("--warm", action="store_true", help="Keep the market cache between levels")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    from benchmarks.stand_in import StandInServer, StandInClient
+
+    if args.symbol_list:
+        symbols = args.symbol_list.split(",")
+    else:
+        symbols = [f"BENCH{i:03d}.NS" for i in range(args.symbols)]
+    levels = [int(level) for level in args.levels.split(",")]
+
+    results = {"config": vars(args), "levels": {}}
+    with StandInServer(latency=args.provider_latency) as server, tempfile.TemporaryDirectory() as output_dir:
+        script = load_advisor_script()
+        if args.parallel_tasks:
+            script.enable_concurrent_tasks(script.crew)
+        metrics = Metrics()
+        instrument(script, StandInClient(server.url), metrics, symbols)
+        for workers in levels:
+            metrics.reset()
+            requests_before = server.requests
+            batch = run_level(script, symbols, workers, metrics, args, output_dir)
+            summary = metrics.summary()
+            crew_times = {"crew": percentiles([t for t in batch["durations"].values()])}
+            level = {"throughput": batch["stats"], "end_to_end": crew_times, **summary,
+                     "tokens": metrics.tokens, "provider_requests": server.requests - requests_before}
+            results["levels"][workers] = level
+
+            print("\n" + "=" * 70)
+            stats = batch["stats"]
+            print(f"Concurrency {workers}: {stats['succeeded']}/{stats['symbols']} symbols in "
+                  f"{stats['elapsed_s']}s -> {stats['symbols_per_min']} symbols/min "
+                  f"({len(batch['errors'])} failed)")
+            print_table("End to end", crew_times)
+            for category in ("stage", "task", "tool", "llm"):
+                print_table(category.title(), summary.get(category, {}))
+            print(f"\nTokens: {metrics.tokens}, stand-in requests: {level['provider_requests']}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Cold-start benchmark for 3_investment_advisor.py.
+
+Imports the script, and runs ``--help``, in fresh interpreters and exits
+with status 1 when the median time goes over budget or when a heavy
+library is imported eagerly, so a regression fails the build:
+
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --budget 0.2 --help-budget 0.5 --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "3_investment_advisor.py")
+
+## Libraries that must only be imported once the crew is actually built or run
+HEAVY_MODULES = ("crewai", "langchain_community", "litellm", "openai", "yfinance", "curl_cffi",
+                 "pandas", "numpy", "dotenv")
+
+DEFAULT_BUDGET_S = float(os.getenv("ADVISOR_IMPORT_BUDGET_S", "0.25"))
+DEFAULT_HELP_BUDGET_S = float(os.getenv("ADVISOR_HELP_BUDGET_S", "0.5"))
+
+_PROBE = """
+import importlib.util, json, sys, time
+started = time.perf_counter()
+spec = importlib.util.spec_from_file_location("investment_advisor", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+elapsed = time.perf_counter() - started
+print(json.dumps({"import_s": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def measure_import():
+    """Import the script in a fresh interpreter; return seconds and the loaded modules."""
+    output = subprocess.run([sys.executable, "-c", _PROBE, SCRIPT], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    probe = json.loads(output.strip().splitlines()[-1])
+    return probe["import_s"], probe["modules"]
+
+
+def measure_help():
+    """Wall-clock seconds for ``python 3_investment_advisor.py --help``, interpreter start included."""
+    started = time.perf_counter()
+    subprocess.run([sys.executable, SCRIPT, "--help"], cwd=ROOT, check=True, capture_output=True)
+    return time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold-start benchmark for the investment crew script")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_S,
+                        help="Maximum median seconds to import the script")
+    parser.add_argument("--help-budget", type=float, default=DEFAULT_HELP_BUDGET_S,
+                        help="Maximum median seconds for --help, interpreter start included")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    import_times, eager = [], set()
+    for _ in range(args.runs):
+        seconds, modules = measure_import()
+        import_times.append(seconds)
+        eager.update(name.split(".")[0] for name in modules if name.split(".")[0] in HEAVY_MODULES)
+    help_times = [measure_help() for _ in range(args.runs)]
+
+    results = {
+        "import_median_s": round(statistics.median(import_times), 4),
+        "import_max_s": round(max(import_times), 4),
+        "help_median_s": round(statistics.median(help_times), 4),
+        "eager_heavy_modules": sorted(eager),
+        "budget_s": args.budget,
+        "help_budget_s": args.help_budget,
+    }
+    print(f"import  median {results['import_median_s'] * 1000:7.1f} ms  (budget {args.budget * 1000:.0f} ms)")
+    print(f"--help  median {results['help_median_s'] * 1000:7.1f} ms  (budget {args.help_budget * 1000:.0f} ms)")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=1)
+
+    failures = []
+    if results["import_median_s"] > args.budget:
+        failures.append("import time over budget")
+    if results["help_median_s"] > args.help_budget:
+        failures.append("--help time over budget")
+    if eager:
+        failures.append(f"heavy modules imported eagerly: {', '.join(sorted(eager))}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Scripted stand-in LLM for offline crew benchmarks.
+
+``FakeLLM`` answers CrewAI's ReAct prompts without any network call: it
+calls each tool listed in the prompt once (so the tool path is exercised),
+then returns a final answer of a configurable number of tokens. Latency is
+``ttft + tokens * per_token`` plus optional jitter.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+
+from crewai import BaseLLM
+
+_TOOL_NAME = re.compile(r"^Tool Name: (.+)$", re.MULTILINE)
+_TOOL_ARGS = re.compile(r"^Tool Arguments: \{'(\w+)'", re.MULTILINE)
+
+
+class FakeLLM(BaseLLM):
+    """Deterministic ReAct responder with configurable latency and token counts."""
+
+    def __init__(self, symbol="RELIANCE", ttft=0.3, per_token=0.01, output_tokens=150, jitter=0.1,
+                 seed=None, recorder=None):
+        """
+        Args:
+            symbol (str): Value passed as the first argument of every tool call.
+            ttft (float): Seconds before the first token.
+            per_token (float): Seconds per generated token.
+            output_tokens (int): Tokens in each final answer.
+            jitter (float): Relative random jitter applied to the latency.
+            seed (int): Seed for the jitter, for repeatable runs.
+            recorder (callable): Called as ``recorder(latency_s, prompt_tokens, completion_tokens)``.
+        """
+        super().__init__(model="fake-llm")
+        self.symbol = symbol
+        self.ttft = ttft
+        self.per_token = per_token
+        self.output_tokens = output_tokens
+        self.jitter = jitter
+        self.recorder = recorder
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _respond(self, prompt):
+        tools = _TOOL_NAME.findall(prompt)
+        arg_names = _TOOL_ARGS.findall(prompt)
+        calls_made = prompt.count("Observation:")
+        if calls_made < len(tools):
+            arg = arg_names[calls_made] if calls_made < len(arg_names) else "symbol"
+            return (f"Thought: I need more data\nAction: {tools[calls_made].strip()}\n"
+                    f"Action Input: {json.dumps({arg: self.symbol})}"), 30
+        answer = " ".join(["insight"] * self.output_tokens)
+        return f"Thought: I now know the final answer\nFinal Answer: {self.symbol}: {answer}", self.output_tokens
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None, **kwargs):
+        if isinstance(messages, str):
+            prompt = messages
+        else:
+            prompt = "\n".join(str(message.get("content", "")) for message in messages)
+        response, completion_tokens = self._respond(prompt)
+        with self._lock:
+            factor = 1 + self._random.uniform(-self.jitter, self.jitter)
+        latency = (self.ttft + completion_tokens * self.per_token) * factor
+        time.sleep(latency)
+        if self.recorder is not None:
+            self.recorder(latency, len(prompt) // 4, completion_tokens)
+        return response
+
+    def supports_function_calling(self):
+        return False
+
+    def supports_stop_words(self):
+        return True
+
+    def get_context_window_size(self):
+        return 128000
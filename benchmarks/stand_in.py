@@ -0,0 +1,275 @@
+"""Local HTTP stand-in for Yahoo Finance and DuckDuckGo.
+
+Serves recorded responses (``benchmarks/recordings/*.json``) over HTTP on
+localhost with a configurable per-request latency, and falls back to a
+deterministic synthetic payload for symbols that were never recorded, so
+benchmarks can run any number of symbols offline.
+
+The shipped ``recordings/synthetic_sample.json`` is synthetic, not a live
+capture (a hand-made RELIANCE.NS profile and ``synthetic_financials``
+statements). Record real responses once (needs network) with:
+
+    python -m benchmarks.stand_in record RELIANCE.NS TCS.NS AAPL
+
+Recorded files override the synthetic ones for the same symbols.
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+import urllib.parse
+import urllib.request
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+RECORDINGS_DIR = os.path.join(os.path.dirname(__file__), "recordings")
+
+
+def load_recordings(directory=RECORDINGS_DIR):
+    """Merge every recording file in ``directory`` into one ``{info, financials, history, search}`` dict."""
+    merged = {"info": {}, "financials": {}, "history": {}, "search": {}}
+    ## Synthetic files first, so real recordings win for the same symbol
+    paths = sorted(glob.glob(os.path.join(directory, "*.json")),
+                   key=lambda path: (not os.path.basename(path).startswith("synthetic"), path))
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            recording = json.load(file)
+        for section in merged:
+            merged[section].update(recording.get(section, {}))
+    return merged
+
+
+def synthetic_info(symbol):
+    """Deterministic fake ``Ticker.info`` for ``symbol``."""
+    seed = int(hashlib.sha1(symbol.encode()).hexdigest()[:8], 16)
+    price = 100 + seed % 3000
+    return {
+        "shortName": f"{symbol.split('.')[0].title()} Ltd",
+        "symbol": symbol,
+        "regularMarketPrice": float(price),
+        "currency": "INR" if symbol.endswith((".NS", ".BO")) else "USD",
+        "marketCap": price * (1e7 + seed % 1e9),
+        "sector": "Industrials",
+        "industry": "Conglomerates",
+        "country": "India" if symbol.endswith((".NS", ".BO")) else "United States",
+        "trailingEps": round(price / (10 + seed % 40), 2),
+        "trailingPE": float(10 + seed % 40),
+        "fiftyTwoWeekLow": price * 0.7,
+        "fiftyTwoWeekHigh": price * 1.2,
+        "fiftyDayAverage": price * 0.98,
+        "twoHundredDayAverage": price * 0.93,
+        "revenueGrowth": (seed % 30) / 100,
+        "grossMargins": 0.3 + (seed % 20) / 100,
+        "ebitdaMargins": 0.1 + (seed % 15) / 100,
+    }
+
+
+def synthetic_financials(symbol):
+    """Deterministic fake annual income statements, ``{period: {item: value}}``."""
+    seed = int(hashlib.sha1(symbol.encode()).hexdigest()[:8], 16)
+    revenue = 1e10 + seed * 1e3
+    periods = {}
+    for years_back in range(4):
+        scale = 1 / (1.08 ** years_back)
+        periods[f"{2025 - years_back}-03-31"] = {
+            "Total Revenue": revenue * scale,
+            "Gross Profit": revenue * scale * 0.4,
+            "Operating Income": revenue * scale * 0.18,
+            "EBITDA": revenue * scale * 0.22,
+            "Interest Expense": revenue * scale * 0.02,
+            "Pretax Income": revenue * scale * 0.15,
+            "Net Income": revenue * scale * 0.11,
+            "Diluted EPS": round(20 * scale, 2),
+        }
+    return periods
+
+
+def synthetic_history(symbol, days=260):
+    """Deterministic fake daily bars ending today, ``{date: {Open, High, Low, Close, Volume}}``."""
+    seed = int(hashlib.sha1(symbol.encode()).hexdigest()[:8], 16)
+    rng = random.Random(seed)
+    close = float(100 + seed % 3000)
+    day = date.today()
+    bars = {}
+    while len(bars) < days:
+        if day.weekday() < 5:
+            previous = close / (1 + rng.gauss(0.0004, 0.015))
+            bars[day.isoformat()] = {
+                "Open": round(previous, 2),
+                "High": round(max(previous, close) * 1.005, 2),
+                "Low": round(min(previous, close) * 0.995, 2),
+                "Close": round(close, 2),
+                "Volume": rng.randint(100_000, 5_000_000),
+            }
+            close = previous
+        day -= timedelta(days=1)
+    return dict(sorted(bars.items()))
+
+
+class StandInServer:
+    """Threaded localhost server for recorded provider responses.
+
+    Routes: ``/yahoo/info/<symbol>``, ``/yahoo/financials/<symbol>``,
+    ``/yahoo/history/<symbol>`` and ``/ddg/search?q=...``.
+    """
+
+    def __init__(self, latency=0.05, recordings=None, port=0):
+        """
+        Args:
+            latency (float): Seconds added to every response, to mimic the network.
+            recordings (dict): Output of ``load_recordings``; loaded from disk when None.
+            port (int): Port to bind, 0 picks a free one.
+        """
+        self.latency = latency
+        self.recordings = recordings if recordings is not None else load_recordings()
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests += 1
+                time.sleep(server.latency)
+                status, body = server.route(self.path)
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}"
+
+    def route(self, path):
+        parsed = urllib.parse.urlparse(path)
+        parts = parsed.path.strip("/").split("/")
+        if parts[:2] == ["yahoo", "info"] and len(parts) == 3:
+            symbol = urllib.parse.unquote(parts[2])
+            return 200, self.recordings["info"].get(symbol) or synthetic_info(symbol)
+        if parts[:2] == ["yahoo", "financials"] and len(parts) == 3:
+            symbol = urllib.parse.unquote(parts[2])
+            return 200, self.recordings["financials"].get(symbol) or synthetic_financials(symbol)
+        if parts[:2] == ["yahoo", "history"] and len(parts) == 3:
+            symbol = urllib.parse.unquote(parts[2])
+            return 200, self.recordings["history"].get(symbol) or synthetic_history(symbol)
+        if parts == ["ddg", "search"]:
+            query = urllib.parse.parse_qs(parsed.query).get("q", [""])[0]
+            results = self.recordings["search"].get(query) or self.recordings["search"].get("default") or [
+                {"title": f"{query} results", "snippet": f"{query}: quarterly results in line with estimates.",
+                 "link": "https://example.com/1"},
+                {"title": f"{query} dividend", "snippet": f"{query}: board approves final dividend and buyback.",
+                 "link": "https://example.com/2"},
+            ]
+            if isinstance(results, str):
+                results = [{"title": query, "snippet": results, "link": ""}]
+            return 200, {"query": query, "results": results}
+        return 404, {"error": f"unknown path {parsed.path}"}
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+class StandInClient:
+    """Fetches from a running StandInServer in the shapes the advisor code expects."""
+
+    def __init__(self, base_url, timeout=10):
+        self.base_url = base_url
+        self.timeout = timeout
+
+    def _get(self, path):
+        with urllib.request.urlopen(self.base_url + path, timeout=self.timeout) as response:
+            return json.load(response)
+
+    def fetch_info(self, symbol):
+        return self._get("/yahoo/info/" + urllib.parse.quote(symbol))
+
+    def fetch_financials(self, symbol):
+        import pandas as pd
+
+        frame = pd.DataFrame(self._get("/yahoo/financials/" + urllib.parse.quote(symbol)))
+        frame.columns = pd.to_datetime(frame.columns)
+        return frame
+
+    def fetch_history(self, symbol):
+        import pandas as pd
+
+        frame = pd.DataFrame.from_dict(self._get("/yahoo/history/" + urllib.parse.quote(symbol)), orient="index")
+        frame.index = pd.to_datetime(frame.index)
+        return frame
+
+    def results(self, query, max_results=8):
+        """Same shape as ``DuckDuckGoSearchAPIWrapper.results``."""
+        return self._get("/ddg/search?q=" + urllib.parse.quote(query))["results"][:max_results]
+
+
+def record(symbols, output):
+    """Fetch live responses for ``symbols`` and write them as a recording file."""
+    from advisor.search import search_results
+    from advisor.market import get_info, get_financials, get_history
+
+    recording = {"info": {}, "financials": {}, "history": {}, "search": {}}
+    for symbol in symbols:
+        recording["info"][symbol] = get_info(symbol)
+        financials = get_financials(symbol)
+        if financials is not None:
+            recording["financials"][symbol] = json.loads(financials.to_json(date_format="iso"))
+        history = get_history(symbol)
+        if history is not None:
+            recording["history"][symbol] = {day.strftime("%Y-%m-%d"): bar for day, bar in
+                                            history.to_dict(orient="index").items()}
+        recording["search"][symbol] = search_results(symbol)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(recording, file, indent=1, default=str)
+    print(f"Recorded {len(symbols)} symbols to {output}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local provider stand-in")
+    commands = parser.add_subparsers(dest="command", required=True)
+    rec = commands.add_parser("record", help="Record live responses for symbols")
+    rec.add_argument("symbols", nargs="+")
+    rec.add_argument("--output", default=os.path.join(RECORDINGS_DIR, "recorded.json"))
+    serve = commands.add_parser("serve", help="Serve recordings until interrupted")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        record(args.symbols, args.output)
+    else:
+        with StandInServer(latency=args.latency, port=args.port) as server:
+            print(f"Serving recordings on {server.url} (Ctrl+C to stop)")
+            try:
+                while True:
+                    time.sleep(3600)
+            except KeyboardInterrupt:
+                pass
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,7 @@ pip install crewai langchain langchain-openai requests python-dotenv PyPDF2 pdfp
 import json
 import requests
 import os
+import sys
 from datetime import datetime
 from typing import Dict, Any
 from dotenv import load_dotenv
@@ -26,6 +27,11 @@ from crewai.tasks.task_output import TaskOutput
 import PyPDF2
 import pdfplumber
 
+# Shared helpers (rate limiting, caching) live in the advisor package at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from advisor.ratelimit import limiter
+from advisor.llm_cache import cached_llm, llm_cache_stats
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -129,6 +135,7 @@ def search_jobs(input_json: str) -> str:
     }
     
     try:
+        limiter("adzuna").acquire()
         response = requests.get(url, params=params)
         response.raise_for_status()
         jobs_data = response.json()
@@ -178,7 +185,8 @@ class EnhancedJobSearchAgentSystem:
         if not os.getenv('OPENAI_API_KEY'):
             raise ValueError("Please set OPENAI_API_KEY in your .env file")
         
-        self.llm = ChatOpenAI(model="gpt-4.1-2025-04-14")
+        # Uses the on-disk LLM response cache when ADVISOR_LLM_CACHE=1
+        self.llm = cached_llm("gpt-4.1-2025-04-14", fallback=ChatOpenAI(model="gpt-4.1-2025-04-14"))
         self.resume_path = resume_path
         self.resume_content = ""
         
@@ -493,6 +501,8 @@ def main():
         if result:
             print("\n📊 Final Summary:")
             print(result)
+        if llm_cache_stats():
+            print(f"🗄️  LLM cache: {llm_cache_stats()}")
         
     except ValueError as e:
         print(f"❌ .env Configuration Error: {e}")